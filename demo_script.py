@@ -2,10 +2,7 @@ import asyncio
 import logging
 import os
 
-from skills.skill_content_generator.executor import SkillContentGenerator
-from skills.skill_mcp_bridger import SkillMCPBridger
-from skills.skill_persona_consistency.executor import SkillPersonaConsistency
-from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from skills.registry import SkillRegistry
 from src.mcp.client import ChimeraMCPClient
 from src.models.schemas import Campaign
 from src.persona.soul import Soul
@@ -40,15 +37,13 @@ async def main():
 
     # Initialize Agents
     planner = ChimeraPlanner()
-    worker = ChimeraWorker(mcp_client=mcp_client)
+    # Skills are discovered by name and imported on first use
+    registry = SkillRegistry(dependencies={"mcp_client": mcp_client})
+    worker = ChimeraWorker(mcp_client=mcp_client, registry=registry)
     judge = ChimeraJudge(confidence_threshold=0.8)
     state_manager = InMemoryStateManager()
 
-    # Register Skills to Worker
-    worker.register_skill(SkillContentGenerator())
-    worker.register_skill(SkillTrendAnalysis())
-    worker.register_skill(SkillPersonaConsistency())
-    worker.register_skill(SkillMCPBridger(mcp_client=mcp_client))
+    print(f"Discovered Skills: {', '.join(registry.available())}")
 
     orchestrator = ChimeraOrchestrator(
         name="ChimeraOrchestrator",
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import BaseModel
@@ -12,6 +14,16 @@ class BaseSkill(ABC):
     Skills are internal, reusable logic packages invoked by Workers.
     """
 
+    # Whether the skill calls out to an MCP server (used for health-based admission).
+    requires_mcp: bool = False
+    # Whether identical inputs always give the same output, so results may be cached.
+    cacheable: bool = False
+    # Whether running a task again has no further effect, so identical concurrent
+    # tasks may share one execution and slow ones may be hedged.
+    idempotent: bool = False
+    # Bump when a change to the skill alters its output; part of the result cache key.
+    version: str = "1"
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -26,6 +38,21 @@ class BaseSkill(ABC):
         """
         pass
 
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        """
+        Execute several tasks of this skill at once, returning one output per input
+        in the same order. Defaults to running `execute` for each item; skills with
+        per-call overhead worth amortizing override it.
+        """
+        return list(await asyncio.gather(*(self.execute(t) for t in task_inputs)))
+
+    def can_coalesce(self, task_input: WorkerTaskInput) -> bool:
+        """
+        Whether this task is safe to run more than once: identical in-flight copies
+        may share one execution, and a slow one may get a backup attempt.
+        """
+        return self.idempotent
+
     def validate_params(self, params: dict[str, Any], schema: type[BaseModel]) -> bool:
         """Helper to validate params against a specific Pydantic model."""
         try:
@@ -33,3 +60,24 @@ class BaseSkill(ABC):
             return True
         except Exception:
             return False
+
+
+class StreamingSkill(BaseSkill):
+    """
+    A skill that can emit its content as a stream of chunks, so it can be checked
+    while it is being generated and abandoned as soon as it is bound to be rejected.
+    """
+
+    @abstractmethod
+    def stream(self, task_input: WorkerTaskInput) -> AsyncIterator[str]:
+        """Yield the content in chunks; raises if the task's params are invalid."""
+        pass
+
+    @abstractmethod
+    def finalize(self, task_input: WorkerTaskInput, content: str) -> WorkerTaskOutput:
+        """Build the task output from the complete streamed content."""
+        pass
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        chunks = [chunk async for chunk in self.stream(task_input)]
+        return self.finalize(task_input, "".join(chunks))
@@ -0,0 +1,104 @@
+import importlib
+import inspect
+import logging
+import pkgutil
+from importlib.metadata import entry_points
+from typing import Any
+
+from skills.base import BaseSkill
+
+ENTRY_POINT_GROUP = "chimera.skills"
+
+
+class SkillRegistry:
+    """
+    Lazily discovered skills.
+
+    Discovery only collects names: every `skill_*` module or package in the
+    `skills/` package (packages keep their skill in `executor.py`), plus the
+    `chimera.skills` entry points of installed distributions (name = skill name,
+    value = 'module:Class'). A skill's module is imported, and the skill
+    instantiated, the first time it is requested; the instance is then cached.
+
+    Constructor arguments a skill needs (e.g. `mcp_client` for the MCP bridger)
+    are filled by name from `dependencies`.
+    """
+
+    def __init__(
+        self,
+        dependencies: dict[str, Any] | None = None,
+        include_entry_points: bool = True,
+    ):
+        self.dependencies = dependencies or {}
+        self._sources: dict[str, str] = {}
+        self._instances: dict[str, BaseSkill] = {}
+        self._discover_package()
+        if include_entry_points:
+            self._discover_entry_points()
+
+    def _discover_package(self):
+        import skills
+
+        for module in pkgutil.iter_modules(skills.__path__):
+            if module.name.startswith("skill_"):
+                suffix = ".executor" if module.ispkg else ""
+                self._sources[module.name] = f"skills.{module.name}{suffix}"
+
+    def _discover_entry_points(self):
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            # Installed plugins may deliberately override a bundled skill.
+            self._sources[entry_point.name] = entry_point.value
+
+    def register(self, skill: BaseSkill):
+        """Add an already constructed skill (takes precedence over discovery)."""
+        self._instances[skill.name] = skill
+
+    def available(self) -> list[str]:
+        """Names of every known skill; nothing is imported."""
+        return sorted(self._sources.keys() | self._instances.keys())
+
+    def is_loaded(self, skill_name: str) -> bool:
+        return skill_name in self._instances
+
+    def __contains__(self, skill_name: str) -> bool:
+        return skill_name in self._instances or skill_name in self._sources
+
+    def get(self, skill_name: str) -> BaseSkill | None:
+        """The skill instance, importing it on first use; None for unknown skills."""
+        skill = self._instances.get(skill_name)
+        if skill is None and skill_name in self._sources:
+            skill = self._load(skill_name, self._sources[skill_name])
+            self._instances[skill_name] = skill
+        return skill
+
+    def _load(self, skill_name: str, source: str) -> BaseSkill:
+        module_name, _, class_name = source.partition(":")
+        logging.info(f"Loading skill {skill_name} from {source}.")
+        module = importlib.import_module(module_name)
+        if class_name:
+            skill_cls = getattr(module, class_name)
+        else:
+            skill_cls = self._find_skill_class(module, skill_name)
+        skill: BaseSkill = skill_cls(**self._constructor_kwargs(skill_cls))
+        return skill
+
+    @staticmethod
+    def _find_skill_class(module, skill_name: str) -> type[BaseSkill]:
+        candidates = [
+            obj
+            for obj in vars(module).values()
+            if inspect.isclass(obj)
+            and issubclass(obj, BaseSkill)
+            and not inspect.isabstract(obj)
+            and obj.__module__ == module.__name__
+        ]
+        if len(candidates) != 1:
+            raise LookupError(
+                f"Expected exactly one BaseSkill subclass for {skill_name} in "
+                f"{module.__name__}, found {len(candidates)}."
+            )
+        return candidates[0]
+
+    def _constructor_kwargs(self, skill_cls: type[BaseSkill]) -> dict[str, Any]:
+        parameters = inspect.signature(skill_cls).parameters
+        return {name: value for name, value in self.dependencies.items() if name in parameters}
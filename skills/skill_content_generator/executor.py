@@ -1,8 +1,11 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import BaseModel, Field
 
-from skills.base import BaseSkill
+from skills.base import StreamingSkill
 from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
 
 
@@ -19,17 +22,27 @@ class ContentGeneratorOutput(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
-class SkillContentGenerator(BaseSkill):
+class SkillContentGenerator(StreamingSkill):
     """
     POC Implementation of the Content Generator Skill.
     Initially simulates content generation based on prompt and persona.
+    `stream` emits the same content word by word, as an LLM would token by token.
     """
 
+    cacheable = True
+    idempotent = True
+
     @property
     def name(self) -> str:
         return "skill_content_generator"
 
     async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return self._generate(task_input)
+
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        return [self._generate(task_input) for task_input in task_inputs]
+
+    def _generate(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         # Validate internal params
         try:
             params = ContentGeneratorInput(**task_input.params)
@@ -42,13 +55,24 @@ class SkillContentGenerator(BaseSkill):
                 reasoning=f"Invalid parameters for {self.name}: {str(e)}",
             )
 
+        return self.finalize(task_input, self._compose(params))
+
+    async def stream(self, task_input: WorkerTaskInput) -> AsyncIterator[str]:
+        params = ContentGeneratorInput(**task_input.params)
+        for chunk in re.findall(r"\S+\s*|\s+", self._compose(params)):
+            yield chunk
+            await asyncio.sleep(0)
+
+    @staticmethod
+    def _compose(params: ContentGeneratorInput) -> str:
         # Simulation logic (In a real scenario, this would call an LLM via MCP)
-        generated_content = (
+        return (
             f"[Generated for {params.target_platform}] {params.prompt}\n(Voice: {params.persona})"
         )
 
+    def finalize(self, task_input: WorkerTaskInput, content: str) -> WorkerTaskOutput:
         result = ContentGeneratorOutput(
-            content=generated_content, metadata={"source": "simulated_poc", "vibe": "consistent"}
+            content=content, metadata={"source": "simulated_poc", "vibe": "consistent"}
         )
 
         return WorkerTaskOutput(
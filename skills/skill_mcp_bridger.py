@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from pydantic import BaseModel
@@ -5,6 +6,8 @@ from pydantic import BaseModel
 from skills.base import BaseSkill
 from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
 
+READ_ONLY_TOOLS = frozenset({"search_trends"})
+
 
 class MCPToolInput(BaseModel):
     tool_name: str
@@ -15,25 +18,45 @@ class SkillMCPBridger(BaseSkill):
     """
     Skill that bridges Swarm Workers to external MCP servers.
     Useful for executing tools like 'post_content' or 'search_trends' via MCP.
+
+    Only calls to `read_only_tools` may be coalesced with identical in-flight calls
+    or hedged; anything with side effects (e.g. 'post_content') always runs exactly once.
     """
 
-    def __init__(self, mcp_client):
+    requires_mcp = True
+
+    def __init__(self, mcp_client, read_only_tools: set[str] | None = None):
         self._mcp_client = mcp_client
+        self.read_only_tools = read_only_tools if read_only_tools is not None else READ_ONLY_TOOLS
 
     @property
     def name(self) -> str:
         return "skill_mcp_bridger"
 
+    def can_coalesce(self, task_input: WorkerTaskInput) -> bool:
+        return task_input.params.get("tool_name") in self.read_only_tools
+
     async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         if not self._mcp_client:
-            return WorkerTaskOutput(
-                task_id=task_input.task_id,
-                skill_name=self.name,
-                result=None,
-                confidence_score=0.0,
-                reasoning="MCP client not initialized on this brider.",
-            )
+            return self._no_client(task_input)
+        return await self._call(task_input)
+
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        """Issue every tool call of the batch concurrently over the one MCP session."""
+        if not self._mcp_client:
+            return [self._no_client(task_input) for task_input in task_inputs]
+        return list(await asyncio.gather(*(self._call(t) for t in task_inputs)))
+
+    def _no_client(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result=None,
+            confidence_score=0.0,
+            reasoning="MCP client not initialized on this brider.",
+        )
 
+    async def _call(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         try:
             params = MCPToolInput(**task_input.params)
             mcp_result = await self._mcp_client.call_tool(params.tool_name, params.arguments)
@@ -23,11 +23,20 @@ class SkillPersonaConsistency(BaseSkill):
     Validates multimodal output against the agent's SOUL.md DNA.
     """
 
+    cacheable = True
+    idempotent = True
+
     @property
     def name(self) -> str:
         return "skill_persona_consistency"
 
     async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return self._verify(task_input)
+
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        return [self._verify(task_input) for task_input in task_inputs]
+
+    def _verify(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         try:
             _ = PersonaConsistencyInput(**task_input.params)
         except Exception as e:
@@ -25,11 +25,23 @@ class SkillTrendAnalysis(BaseSkill):
     Perceives the digital world via MCP (simulated) to identify viral trends.
     """
 
+    # The simulated viral potential is random, so repeated analyses must not be served from cache.
+    cacheable = False
+    # Concurrent identical lookups can still share one analysis.
+    idempotent = True
+
     @property
     def name(self) -> str:
         return "skill_trend_analysis"
 
     async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return self._analyze(task_input)
+
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        # The analysis never awaits, so a batch runs in one pass without per-item scheduling.
+        return [self._analyze(task_input) for task_input in task_inputs]
+
+    def _analyze(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         try:
             params = TrendAnalysisInput(**task_input.params)
         except Exception as e:
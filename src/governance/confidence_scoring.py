@@ -1,7 +1,150 @@
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
 
 from src.persona.soul import Soul
 
+if TYPE_CHECKING:
+    import numpy as np
+
+SLANG_WORDS = ["lit", "fam", "bruh"]
+SLANG_TERMS = [rf"\b{word}\b" for word in SLANG_WORDS]
+SAFETY_KEYWORDS = ["harm", "exploit", "illegal", "attack"]
+
+BASE_SCORE = 0.95
+SLANG_PENALTY = 0.3  # per forbidden action about slang
+SHORT_CONTENT_LENGTH = 20
+SHORT_CONTENT_PENALTY = 0.1
+
+
+def _numpy():
+    """NumPy is only needed for bulk scoring (the 'bulk' extra)."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Bulk scoring requires NumPy; install it with the 'bulk' extra.") from e
+    return numpy
+
+
+class ContentMatcher:
+    """
+    Every content rule of one persona compiled into a single regex, so content is
+    scanned once however many rules and forbidden actions there are.
+
+    Rule ids are 'safety:<keyword>' (substring match) and, when the persona forbids
+    slang, 'slang:<word>' (whole-word match). Build matchers with `compile_matcher`,
+    which caches one per set of forbidden actions.
+    """
+
+    def __init__(self, forbidden: tuple[str, ...]):
+        self.slang_actions = [action for action in forbidden if "slang" in action.lower()]
+        # Added once per slang action, exactly as the per-action scoring loop did.
+        self.slang_penalty = 0.0
+        for _ in self.slang_actions:
+            self.slang_penalty += SLANG_PENALTY
+
+        literals = {f"safety:{word}": word for word in SAFETY_KEYWORDS}
+        patterns = {rule: re.escape(word) for rule, word in literals.items()}
+        if self.slang_actions:
+            for word in SLANG_WORDS:
+                literals[f"slang:{word}"] = word
+                # Same as \bword\b, but leading with the literal lets the regex
+                # engine search for it directly, which matters on long texts.
+                patterns[f"slang:{word}"] = rf"{re.escape(word)}\b(?<=\b{re.escape(word)})"
+
+        self.rules: dict[str, re.Pattern] = {
+            rule: re.compile(pattern) for rule, pattern in patterns.items()
+        }
+        self._rule_of = {word: rule for rule, word in reversed(literals.items())}
+        # The leading character class lets the regex engine skip ahead between
+        # candidates, and the slang words share one pair of word boundaries.
+        first_chars = "".join(sorted({re.escape(word[0]) for word in literals.values()}))
+        alternatives = [re.escape(word) for word in SAFETY_KEYWORDS]
+        if self.slang_actions:
+            alternatives.append(rf"\b(?:{'|'.join(re.escape(w) for w in SLANG_WORDS)})\b")
+        self._pattern = re.compile(f"(?=[{first_chars}])(?:{'|'.join(alternatives)})")
+
+    def scan(self, lowered: str) -> tuple[str, ...]:
+        """Ids of the rules that fire on already lowercased content, in rule order."""
+        found = {self._rule_of[match.group()] for match in self._pattern.finditer(lowered)}
+        if found:
+            # A match may hide an overlapping rule; settle the remaining rules one by one.
+            found.update(
+                rule
+                for rule, pattern in self.rules.items()
+                if rule not in found and pattern.search(lowered)
+            )
+        return tuple(rule for rule in self.rules if rule in found)
+
+    def score(self, content: str, hits: tuple[str, ...]) -> float:
+        penalty = 0.0
+        if any(rule.startswith("slang:") for rule in hits):
+            penalty += self.slang_penalty
+        if len(content) < SHORT_CONTENT_LENGTH:
+            penalty += SHORT_CONTENT_PENALTY
+        return max(0.0, BASE_SCORE - penalty)
+
+    def scan_bulk(self, lowered: list[str]) -> "np.ndarray":
+        """
+        Rule hits of many already lowercased contents as a boolean matrix, one row
+        per content and one column per rule (in `rules` order).
+        """
+        numpy = _numpy()
+        hits: np.ndarray = numpy.zeros((len(lowered), len(self.rules)), dtype=bool)
+        if not lowered:
+            return hits
+        # All contents are scanned as one text, one pass per rule: no rule can match
+        # across the newline between two contents, and it is a word boundary just
+        # like the end of a string.
+        text = "\n".join(lowered)
+        starts = numpy.cumsum([0] + [len(content) + 1 for content in lowered[:-1]])
+        for column, pattern in enumerate(self.rules.values()):
+            positions = [match.start() for match in pattern.finditer(text)]
+            if positions:
+                hits[numpy.searchsorted(starts, positions, side="right") - 1, column] = True
+        return hits
+
+    def score_bulk(self, contents: list[str]) -> tuple["np.ndarray", "np.ndarray"]:
+        """Scores and rule hits of many contents, exactly as `score` gives them one by one."""
+        np = _numpy()
+        hits = self.scan_bulk([content.lower() for content in contents])
+        lengths = np.fromiter(map(len, contents), dtype=np.int64, count=len(contents))
+        slang = np.array([rule.startswith("slang:") for rule in self.rules], dtype=bool)
+        # Same float additions as `score`: 0.0, then the slang and short penalties.
+        penalty = np.where(hits[:, slang].any(axis=1), self.slang_penalty, 0.0)
+        penalty = penalty + np.where(lengths < SHORT_CONTENT_LENGTH, SHORT_CONTENT_PENALTY, 0.0)
+        return np.maximum(0.0, BASE_SCORE - penalty), hits
+
+    def describe(self, rule: str) -> str:
+        kind, _, word = rule.partition(":")
+        if kind == "safety":
+            return f"safety keyword '{word}'"
+        return f"forbidden term '{word}' ({self.slang_actions[0]})"
+
+
+@lru_cache(maxsize=128)
+def compile_matcher(forbidden: tuple[str, ...]) -> ContentMatcher:
+    return ContentMatcher(forbidden)
+
+
+def _score_chunk(
+    forbidden: tuple[str, ...], contents: list[str]
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """Process pool task: bulk-score one chunk with the matcher for `forbidden`."""
+    return compile_matcher(forbidden).score_bulk(contents)
+
+
+class ContentCheck(BaseModel):
+    """Result of scanning one piece of content: its score and the rules that fired."""
+
+    score: float
+    hits: tuple[str, ...] = ()
+    safe: bool = True
+
 
 class ConfidenceScorer:
     """Evaluates content against persona consistency and safety rules."""
@@ -9,30 +152,113 @@ class ConfidenceScorer:
     def __init__(self, soul: Soul):
         self.soul = soul
 
+    @property
+    def matcher(self) -> ContentMatcher:
+        # Keyed by the current forbidden actions, so edits to the Soul take effect.
+        return compile_matcher(tuple(self.soul.forbidden))
+
+    def check(self, content: str) -> ContentCheck:
+        """Score and safety of `content` from a single scan, with the rules that fired."""
+        matcher = self.matcher
+        hits = matcher.scan(content.lower())
+        return ContentCheck(
+            score=matcher.score(content, hits),
+            hits=hits,
+            safe=not any(rule.startswith("safety:") for rule in hits),
+        )
+
     def score_content(self, content: str) -> float:
         """
         Heuristic-based scoring (Simulation).
         In a real system, this would use a dual-model LLM setup.
+        Base 0.95; -0.3 per forbidden action about slang if slang is used; -0.1 if
+        shorter than 20 characters.
         """
-        base_score = 0.95
-        penalty = 0.0
+        matcher = self.matcher
+        return matcher.score(content, matcher.scan(content.lower()))
 
-        # Check forbidden actions (Simplified simulation)
-        for action in self.soul.forbidden:
-            # Example: "generic slang" -> penalty if found
-            if "slang" in action.lower():
-                slang_terms = [r"\blit\b", r"\bfam\b", r"\bbruh\b"]
-                if any(re.search(term, content.lower()) for term in slang_terms):
-                    penalty += 0.3
+    def validate_safety(self, content: str) -> bool:
+        """Basic safety filter."""
+        return not any(rule.startswith("safety:") for rule in self.matcher.scan(content.lower()))
 
-        # Check brand alignment
-        if len(content) < 20:
-            penalty += 0.1  # Too short, not sophisticated enough
+    def score_bulk(
+        self, contents: Iterable[str], processes: int | None = None
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Score many contents at once, e.g. to re-score a backlog after the persona's
+        rules change. Requires NumPy (the 'bulk' extra).
 
-        final_score = max(0.0, base_score - penalty)
-        return final_score
+        Returns a float array of scores, identical to `score_content` per item, and a
+        boolean matrix of rule hits whose columns follow `matcher.rules`. With
+        `processes`, the contents are split into that many chunks scored in a
+        process pool.
+        """
+        np = _numpy()
+        contents = [str(content) for content in contents]
+        forbidden = tuple(self.soul.forbidden)
+        if not processes or processes < 2 or len(contents) < 2:
+            return compile_matcher(forbidden).score_bulk(contents)
 
-    def validate_safety(self, content: str) -> bool:
-        """Basic safety filter."""
-        forbidden_keywords = ["harm", "exploit", "illegal", "attack"]
-        return not any(word in content.lower() for word in forbidden_keywords)
+        size = -(-len(contents) // processes)
+        chunks = [contents[i : i + size] for i in range(0, len(contents), size)]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            parts = list(pool.map(_score_chunk, [forbidden] * len(chunks), chunks))
+        scores, hits = zip(*parts, strict=True)
+        return np.concatenate(scores), np.concatenate(hits)
+
+    def incremental(self) -> "IncrementalScore":
+        """Start scoring content that arrives in chunks (see IncrementalScore)."""
+        return IncrementalScore(self)
+
+
+class IncrementalScore:
+    """
+    Scores streamed content chunk by chunk, reporting the first breach as soon as
+    it appears: a safety keyword, or slang forbidden by the persona.
+
+    Each `feed` only rescans the tail that could complete a term across the chunk
+    boundary. A term ending exactly at the end of what has arrived is held back
+    until the next chunk (or `close`) shows it really ends a word.
+    """
+
+    def __init__(self, scorer: ConfidenceScorer):
+        self.scorer = scorer
+        self.matcher = scorer.matcher
+        self._overlap = max(len(word) for word in SAFETY_KEYWORDS + SLANG_WORDS)
+        self._parts: list[str] = []
+        self._lowered = ""
+        self._scanned = 0
+        self.breach: str | None = None
+
+    @property
+    def content(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> str | None:
+        """Add a chunk; returns the breach once one has been found."""
+        if self.breach is None:
+            self._parts.append(chunk)
+            self._lowered += chunk.lower()
+            self._scan(final=False)
+        return self.breach
+
+    def close(self) -> str | None:
+        """Mark the end of the content, settling terms held back at the very end."""
+        if self.breach is None:
+            self._scan(final=True)
+        return self.breach
+
+    def score(self) -> float:
+        """Score of everything fed so far, as `score_content` would give it."""
+        return self.scorer.score_content(self.content)
+
+    def _scan(self, final: bool):
+        text = self._lowered
+        start = max(0, self._scanned - self._overlap)
+        for rule, pattern in self.matcher.rules.items():
+            for match in pattern.finditer(text, start):
+                # `\b` at the end of partial content may be followed by more letters.
+                if final or rule.startswith("safety:") or match.end() < len(text):
+                    self.breach = self.matcher.describe(rule)
+                    return
+        self._scanned = len(text)
@@ -1,19 +1,43 @@
 import logging
+import time
 from contextlib import AsyncExitStack
 from typing import Any
 
 from mcp.client.stdio import stdio_client
 
 from mcp import ClientSession, StdioServerParameters
+from src.observability.metrics import SWARM_METRICS, SwarmMetrics
+from src.observability.tracing import span
+from src.swarm.cost_model import CostModel, tool_key
+from src.swarm.resilience import CircuitBreakerRegistry, RetryPolicy, call_with_retry
 
 
 class ChimeraMCPClient:
-    """Wrapper for MCP sessions to facilitate tool calling by swarm agents."""
+    """
+    Wrapper for MCP sessions to facilitate tool calling by swarm agents.
+    Tool calls can be retried on transient errors (`retry_policy`) and guarded by a
+    per-tool circuit breaker (`breakers`, keyed 'mcp:<tool>') so an outage fails fast;
+    the policy's `attempt_timeout` makes a hung tool count as a failure too.
+    Per-tool call latency and errors are recorded on `metrics`, and fed to
+    `cost_model` (as 'mcp:<tool>') when one is shared with the orchestrator.
+    """
 
-    def __init__(self, command: str, args: list | None = None):
+    def __init__(
+        self,
+        command: str,
+        args: list | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+        metrics: SwarmMetrics | None = None,
+        cost_model: CostModel | None = None,
+    ):
         self.server_params = StdioServerParameters(command=command, args=args or [])
         self.session: ClientSession | None = None
         self._exit_stack: AsyncExitStack | None = None
+        self.retry_policy = retry_policy
+        self.breakers = breakers
+        self.metrics = metrics or SWARM_METRICS
+        self.cost_model = cost_model
 
     async def connect(self):
         """Establish connection with the MCP server."""
@@ -33,13 +57,40 @@ class ChimeraMCPClient:
         if not self.session:
             raise RuntimeError("MCP Client is not connected.")
 
+        session = self.session
+        breaker = self.breakers.get(tool_key(tool_name)) if self.breakers else None
+        started = time.perf_counter()
         try:
-            result = await self.session.call_tool(tool_name, arguments)
+            with (
+                span("call_tool", {"mcp.tool": tool_name}),
+                self.metrics.mcp_seconds.labels(tool_name).time(),
+            ):
+                result = await call_with_retry(
+                    lambda: session.call_tool(tool_name, arguments), self.retry_policy, breaker
+                )
+            self._record_cost(tool_name, started, failed=False)
             return result.content
         except Exception as e:
+            self.metrics.mcp_errors.labels(tool_name).inc()
+            self._record_cost(tool_name, started, failed=True)
             logging.error(f"Error calling tool {tool_name}: {str(e)}")
             raise
 
+    def _record_cost(self, tool_name: str, started: float, failed: bool):
+        if self.cost_model is not None:
+            self.cost_model.record(tool_key(tool_name), time.perf_counter() - started, failed)
+
+    async def health_check(self) -> bool:
+        """Ping the MCP server; False when disconnected or unresponsive."""
+        if not self.session:
+            return False
+        try:
+            await self.session.send_ping()
+            return True
+        except Exception as e:
+            logging.warning(f"MCP health probe failed: {str(e)}")
+            return False
+
     async def disconnect(self):
         """Cleanly disconnect from the MCP server."""
         if self._exit_stack:
@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class CampaignStatus(StrEnum):
@@ -37,11 +37,29 @@ class Campaign(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class TaskParamRef(BaseModel):
+    """Reference to a value inside an upstream task's WorkerTaskOutput (e.g. 'result.content')."""
+
+    task_id: UUID
+    path: str = "result"
+
+
 class WorkerTaskInput(BaseModel):
     task_id: UUID = Field(default_factory=uuid4)
     skill_name: str
     params: dict[str, Any]
     persona_id: str
+    campaign_id: UUID | None = None
+    depends_on: list[UUID] = Field(default_factory=list)
+    param_refs: dict[str, TaskParamRef] = Field(default_factory=dict)
+    timeout_s: float | None = None  # per-task deadline enforced by the Worker
+
+    @model_validator(mode="after")
+    def _refs_imply_dependencies(self) -> "WorkerTaskInput":
+        for ref in self.param_refs.values():
+            if ref.task_id not in self.depends_on:
+                self.depends_on.append(ref.task_id)
+        return self
 
 
 class WorkerTaskOutput(BaseModel):
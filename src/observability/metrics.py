@@ -0,0 +1,344 @@
+import asyncio
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Timer:
+    """Context manager observing elapsed wall time (seconds) into a histogram series."""
+
+    __slots__ = ("_series", "_started")
+
+    def __init__(self, series: "_HistogramSeries"):
+        self._series = series
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._series.observe(time.perf_counter() - self._started)
+
+
+class _CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        self.value += amount
+
+
+class _GaugeSeries:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+
+class _HistogramSeries:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        # Buckets are upper-inclusive ("le"), so bisect_left finds the first bound >= value.
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+class Metric(ABC):
+    """
+    A named metric family with a fixed set of label names.
+    `labels(*values)` returns the series for one label combination; series are
+    created on first use and cached, so the hot path is a single dict lookup.
+    Metrics are meant to be updated from the event loop thread (no locking).
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: dict[tuple[str, ...], Any] = {}
+
+    @abstractmethod
+    def _new_series(self) -> Any:
+        """A fresh series for one label combination."""
+        pass
+
+    def labels(self, *values: Any) -> Any:
+        key = tuple(str(value) for value in values)
+        series = self._series.get(key)
+        if series is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric {self.name} expects labels {self.labelnames}, got {len(key)} value(s)."
+                )
+            series = self._series[key] = self._new_series()
+        return series
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        """(suffix, label string, value) triples for the text exposition format."""
+        return [
+            ("", _format_labels(self.labelnames, key), series.value)
+            for key, series in sorted(self._series.items())
+        ]
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new_series(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def value(self, *values: Any) -> float:
+        series: _CounterSeries = self.labels(*values)
+        return series.value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new_series(self) -> _GaugeSeries:
+        return _GaugeSeries()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def value(self, *values: Any) -> float:
+        series: _GaugeSeries = self.labels(*values)
+        return series.value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+        if not self.buckets:
+            raise ValueError("Histogram needs at least one finite bucket.")
+
+    def _new_series(self) -> _HistogramSeries:
+        return _HistogramSeries(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        series: _HistogramSeries = self.labels()
+        return series.time()
+
+    def samples(self) -> list[tuple[str, str, float]]:
+        samples = []
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), series.counts, strict=True):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                samples.append(("_bucket", _format_labels(self.labelnames, key, le), cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append(("_sum", labels, series.sum))
+            samples.append(("_count", labels, series.count))
+        return samples
+
+
+class MetricsRegistry:
+    """In-process registry of metric families, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def _register(self, metric_cls: type[Metric], name: str, *args, **kwargs) -> Any:
+        existing = self._metrics.get(name)
+        if existing is not None:
+            if not isinstance(existing, metric_cls):
+                raise ValueError(f"Metric {name} is already registered as a {existing.kind}.")
+            return existing
+        metric = metric_cls(name, *args, **kwargs)
+        self._metrics[name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric: Counter = self._register(Counter, name, documentation, labelnames)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        metric: Gauge = self._register(Gauge, name, documentation, labelnames)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric: Histogram = self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+        return metric
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 9464) -> asyncio.Server:
+        """
+        Start a minimal HTTP scrape endpoint: GET /metrics returns `render()`.
+        The caller owns the returned server (close it with `server.close()`).
+        """
+        return await asyncio.start_server(self._handle_scrape, host, port)
+
+    async def _handle_scrape(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            # Drain headers; the endpoint takes no input beyond the request line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode(errors="replace").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", self.render().encode()
+            else:
+                status, body = "404 Not Found", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logging.warning(f"Metrics scrape failed: {str(e)}")
+        finally:
+            writer.close()
+
+
+class SwarmMetrics:
+    """The swarm's instruments, registered on `registry`."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.stage_seconds = registry.histogram(
+            "chimera_stage_duration_seconds",
+            "Time spent per swarm stage (plan, execute, judge, persist).",
+            ("stage",),
+        )
+        self.skill_seconds = registry.histogram(
+            "chimera_skill_duration_seconds",
+            "Task execution time per skill, including retries and hedging.",
+            ("skill",),
+        )
+        self.mcp_seconds = registry.histogram(
+            "chimera_mcp_call_duration_seconds",
+            "MCP tool call time per tool, including retries.",
+            ("tool",),
+        )
+        self.task_outcomes = registry.counter(
+            "chimera_task_outcomes_total",
+            "Judged task outcomes by approval status.",
+            ("skill", "status"),
+        )
+        self.mcp_errors = registry.counter(
+            "chimera_mcp_call_errors_total",
+            "MCP tool calls that raised.",
+            ("tool",),
+        )
+        self.queue_depth = registry.gauge(
+            "chimera_queue_depth",
+            "Items waiting in the pipeline stage queues.",
+            ("queue",),
+        )
+        self.in_flight = registry.gauge(
+            "chimera_tasks_in_flight",
+            "Tasks currently dispatched to the worker.",
+        )
+
+
+REGISTRY = MetricsRegistry()
+SWARM_METRICS = SwarmMetrics(REGISTRY)
@@ -0,0 +1,246 @@
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+# OTLP enum values (opentelemetry/proto/trace/v1/trace.proto).
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_UNSET = 0
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class Span:
+    """A timed operation within a trace; created via `Tracer.start_span` or `span()`."""
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "start_time_ns",
+        "end_time_ns",
+        "status_code",
+        "status_message",
+        "sampled",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_span_id: str | None,
+        attributes: dict[str, Any],
+        sampled: bool,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: int | None = None
+        self.status_code = STATUS_CODE_UNSET
+        self.status_message = ""
+        self.sampled = sampled
+
+    def set_attribute(self, key: str, value: Any):
+        if self.sampled:
+            self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = message
+
+    def end(self):
+        if self.end_time_ns is None:
+            self.end_time_ns = time.time_ns()
+            if self.sampled:
+                self.tracer._on_end(self)
+
+    def to_otlp(self) -> dict[str, Any]:
+        """The span in OTLP/JSON form (ids as hex, times as stringified unix nanos)."""
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            otlp["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            otlp["status"]["message"] = self.status_message
+        return otlp
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    typed: dict[str, Any]
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+_current_span: ContextVar[Span | None] = ContextVar("chimera_current_span", default=None)
+
+
+class _SpanScope:
+    """Makes a span current for the duration of a `with` block and ends it on exit."""
+
+    __slots__ = ("span", "_token")
+
+    def __init__(self, span: Span):
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.span.set_error(f"{exc_type.__name__}: {exc}")
+        elif self.span.status_code == STATUS_CODE_UNSET:
+            self.span.status_code = STATUS_CODE_OK
+        self.span.end()
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: list[Span]):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory (tests, debugging)."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]):
+        self.spans.extend(spans)
+
+
+class JsonlSpanExporter(SpanExporter):
+    """
+    Appends one OTLP/JSON `ExportTraceServiceRequest` per line, so the file can be
+    replayed into any OTLP collector or inspected with jq.
+    """
+
+    def __init__(self, path: str | Path, service_name: str = "chimera"):
+        self.path = Path(path)
+        self.service_name = service_name
+
+    def export(self, spans: list[Span]):
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "chimera.swarm"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(request) + "\n")
+
+
+class Tracer:
+    """
+    Starts traces and collects their spans.
+
+    Whether a trace is recorded is decided once, at its root span, from the trace
+    id and `sample_rate` (so the decision is consistent across a trace). Finished
+    spans are buffered per trace and handed to `exporter` when the root span ends.
+    Without an exporter nothing is sampled, and unsampled spans are never buffered.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None, sample_rate: float = 1.0):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self._buffers: dict[str, list[Span]] = {}
+
+    def _should_sample(self, trace_id: str) -> bool:
+        if self.exporter is None or self.sample_rate <= 0.0:
+            return False
+        # Trace-id ratio sampling: the low 64 bits of a random id are uniform.
+        return int(trace_id[16:], 16) < self.sample_rate * 2**64
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None) -> _SpanScope:
+        """
+        Start a span as a child of the current span, or a new trace's root span.
+        Children join the trace (and tracer) of their parent.
+        """
+        parent = _current_span.get()
+        if parent is not None:
+            return parent.tracer._child(parent, name, attributes)
+        attributes = dict(attributes or {})
+        trace_id = os.urandom(16).hex()
+        sampled = self._should_sample(trace_id)
+        if sampled:
+            self._buffers[trace_id] = []
+        return _SpanScope(Span(self, name, trace_id, None, attributes, sampled))
+
+    def _child(self, parent: Span, name: str, attributes: dict[str, Any] | None) -> _SpanScope:
+        return _SpanScope(
+            Span(
+                self,
+                name,
+                parent.trace_id,
+                parent.span_id,
+                dict(attributes or {}),
+                parent.sampled,
+            )
+        )
+
+    def _on_end(self, span: Span):
+        buffer = self._buffers.get(span.trace_id)
+        if span.parent_span_id is not None and buffer is not None:
+            buffer.append(span)
+            return
+        # Root span (or a straggler that finished after its root): export now.
+        spans = [*self._buffers.pop(span.trace_id, []), span]
+        if self.exporter is None:
+            return
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logging.warning(f"Failed to export {len(spans)} span(s): {str(e)}")
+
+
+TRACER = Tracer()
+
+
+def span(name: str, attributes: dict[str, Any] | None = None) -> _SpanScope:
+    """Start a child of the current span (or a root span on the default TRACER)."""
+    return TRACER.start_span(name, attributes)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import re
 from typing import Any
@@ -51,6 +53,12 @@ class Soul:
 
         return cls(name, dna, directives, forbidden)
 
+    @property
+    def version(self) -> str:
+        """Fingerprint of the persona's rules; changes whenever SOUL.md is edited."""
+        payload = json.dumps(self.to_dict(), sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "name": self.name,
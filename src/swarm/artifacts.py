@@ -0,0 +1,58 @@
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.models.schemas import TaskParamRef, WorkerTaskInput, WorkerTaskOutput
+
+
+class ArtifactStore:
+    """
+    In-process store of Worker outputs for a campaign run.
+    Downstream tasks receive upstream results by reference, so large payloads are
+    never re-serialized on the hand-off between tasks.
+    """
+
+    def __init__(self):
+        self._outputs: dict[UUID, WorkerTaskOutput] = {}
+
+    def put(self, output: WorkerTaskOutput):
+        self._outputs[output.task_id] = output
+
+    def get(self, task_id: UUID) -> WorkerTaskOutput:
+        if task_id not in self._outputs:
+            raise KeyError(f"No artifact recorded for task {task_id}.")
+        return self._outputs[task_id]
+
+    def __contains__(self, task_id: UUID) -> bool:
+        return task_id in self._outputs
+
+    def resolve(self, ref: TaskParamRef) -> Any:
+        """Walk a dotted path (attributes, dict keys, list indices) into an upstream output."""
+        value: Any = self.get(ref.task_id)
+        for segment in ref.path.split("."):
+            if isinstance(value, BaseModel):
+                if segment not in type(value).model_fields:
+                    raise KeyError(f"'{segment}' is not a field of {type(value).__name__}.")
+                value = getattr(value, segment)
+            elif isinstance(value, list | tuple):
+                value = value[int(segment)]
+            elif isinstance(value, dict):
+                value = value[segment]
+            else:
+                raise KeyError(f"Cannot resolve '{segment}' on {type(value).__name__}.")
+        return value
+
+    def bind(self, task: WorkerTaskInput) -> WorkerTaskInput:
+        """Return a copy of the task with every parameter reference substituted."""
+        if not task.param_refs:
+            return task
+        params = dict(task.params)
+        for param_name, ref in task.param_refs.items():
+            try:
+                params[param_name] = self.resolve(ref)
+            except (KeyError, IndexError, ValueError) as e:
+                raise LookupError(
+                    f"Unresolved reference for '{param_name}' ({ref.task_id}:{ref.path}): {e}"
+                ) from e
+        return task.model_copy(update={"params": params})
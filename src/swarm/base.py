@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 from src.models.schemas import (
     Campaign,
@@ -14,6 +15,10 @@ class BaseSwarmMember(ABC):
     def __init__(self, name: str):
         self.name = name
 
+    async def health_check(self) -> bool:
+        """Liveness probe used by the Orchestrator. Override for members with dependencies."""
+        return True
+
 
 class Planner(BaseSwarmMember):
     """
@@ -27,8 +32,19 @@ class Planner(BaseSwarmMember):
         pass
 
     @abstractmethod
-    async def replan(self, campaign: Campaign, feedback: str) -> list[WorkerTaskInput]:
-        """Adjust the existing plan based on execution failures or environment context shifts."""
+    async def replan(
+        self,
+        campaign: Campaign,
+        plan: list[WorkerTaskInput],
+        results: list[dict[str, Any]],
+        feedback: str | None = None,
+    ) -> list[WorkerTaskInput]:
+        """
+        Adjust the existing plan based on execution failures.
+        Returns replacement tasks for the failed part of `plan` (per the result
+        entries in `results`) and its downstream dependents only; approved tasks are
+        kept and are not returned.
+        """
         pass
 
 
@@ -55,6 +71,16 @@ class Judge(BaseSwarmMember):
         """Validate worker output and route to HITL if confidence is below threshold."""
         pass
 
+    async def validate_outputs(
+        self, worker_outputs: list[WorkerTaskOutput]
+    ) -> list[JudgeValidationOutput]:
+        """
+        Validate several outputs, returning verdicts in input order.
+        Defaults to one `validate_output` call per item; Judges that can score in
+        bulk (batched model calls) override it.
+        """
+        return [await self.validate_output(worker_output) for worker_output in worker_outputs]
+
 
 class Orchestrator(BaseSwarmMember):
     """
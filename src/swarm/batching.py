@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, Field
+
+from skills.base import BaseSkill
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+
+TaskFuture = asyncio.Future[WorkerTaskOutput]
+BatchRunner = Callable[[BaseSkill, list[WorkerTaskInput]], Awaitable[list[WorkerTaskOutput]]]
+
+
+class BatchPolicy(BaseModel):
+    """
+    How concurrent work is grouped into batch calls: tasks for the same skill into
+    `execute_batch` (Worker), outputs awaiting review into `validate_outputs` (Judge).
+    A batch is flushed once it holds `max_size` items, or `max_linger` seconds after
+    its first item arrived, whichever comes first.
+    """
+
+    max_size: int = Field(default=32, ge=1)
+    max_linger: float = Field(default=0.005, ge=0.0)
+    skills: set[str] | None = None  # None = batch every skill (Worker batching only)
+
+    def applies_to(self, skill_name: str) -> bool:
+        return self.skills is None or skill_name in self.skills
+
+
+class TaskBatcher:
+    """
+    Collects tasks submitted for the same skill and runs them together.
+    Each `submit` resolves to that task's own output; if the batch call raises,
+    every task in it fails with the same error.
+    """
+
+    def __init__(self, policy: BatchPolicy, run_batch: BatchRunner):
+        self.policy = policy
+        self._run_batch = run_batch
+        self._pending: dict[str, list[tuple[WorkerTaskInput, TaskFuture]]] = {}
+        self._skills: dict[str, BaseSkill] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, skill: BaseSkill, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        loop = asyncio.get_running_loop()
+        future: TaskFuture = loop.create_future()
+        pending = self._pending.setdefault(skill.name, [])
+        pending.append((task_input, future))
+        self._skills[skill.name] = skill
+        if len(pending) >= self.policy.max_size:
+            self._flush(skill.name)
+        elif len(pending) == 1:
+            self._timers[skill.name] = loop.call_later(
+                self.policy.max_linger, self._flush, skill.name
+            )
+        return await future
+
+    def _flush(self, skill_name: str):
+        timer = self._timers.pop(skill_name, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(skill_name, [])
+        # Callers that gave up (deadline, cancellation) no longer need their task run.
+        batch = [(task_input, future) for task_input, future in batch if not future.done()]
+        if not batch:
+            return
+        runner = asyncio.create_task(self._run(self._skills[skill_name], batch))
+        self._running.add(runner)
+        runner.add_done_callback(self._running.discard)
+
+    async def _run(self, skill: BaseSkill, batch: list[tuple[WorkerTaskInput, TaskFuture]]):
+        futures = [future for _, future in batch]
+        try:
+            outputs = await self._run_batch(skill, [task_input for task_input, _ in batch])
+            if len(outputs) != len(batch):
+                raise RuntimeError(
+                    f"Skill {skill.name} returned {len(outputs)} outputs for a batch of {len(batch)}."
+                )
+            for future, output in zip(futures, outputs, strict=True):
+                if not future.done():
+                    future.set_result(output)
+        except Exception as e:
+            logging.error(f"Batch of {len(batch)} {skill.name} tasks failed: {str(e)}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Only reached with pending futures when the batch itself was cancelled.
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+import math
+import os
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.models.schemas import WorkerTaskInput
+from src.swarm.dag import TaskGraph
+from src.swarm.files import write_atomic
+
+
+class CostStats(BaseModel):
+    """Exponentially weighted latency (seconds) and failure rate of one skill or MCP tool."""
+
+    latency: float
+    failure_rate: float = 0.0
+    samples: int = 0
+
+
+def skill_key(skill_name: str) -> str:
+    return f"skill:{skill_name}"
+
+
+def tool_key(tool_name: str) -> str:
+    return f"mcp:{tool_name}"
+
+
+class CostModel:
+    """
+    Running cost statistics per skill ('skill:<name>') and MCP tool ('mcp:<tool>').
+
+    Latency and failure rate are EWMAs with weight `alpha` for the newest sample.
+    The expected cost of a task counts one extra attempt per expected failure
+    (`latency * (1 + failure_rate)`); unseen keys cost `default_latency`.
+
+    With a `path`, statistics are loaded on construction and written back by
+    `save()`, so a fresh process starts with a warm model.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        alpha: float = 0.2,
+        default_latency: float = 1.0,
+    ):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1].")
+        self.path = path
+        self.alpha = alpha
+        self.default_latency = default_latency
+        self.stats: dict[str, CostStats] = {}
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path: str):
+        try:
+            with open(path) as f:
+                raw = json.load(f)
+            self.stats = {key: CostStats.model_validate(value) for key, value in raw.items()}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cost model at {path}: {str(e)}")
+
+    async def save(self):
+        if not self.path:
+            return
+        payload = json.dumps({key: stats.model_dump() for key, stats in self.stats.items()})
+        await asyncio.to_thread(write_atomic, self.path, payload)
+
+    def record(self, key: str, seconds: float, failed: bool = False):
+        stats = self.stats.get(key)
+        if stats is None:
+            self.stats[key] = CostStats(
+                latency=seconds, failure_rate=1.0 if failed else 0.0, samples=1
+            )
+            return
+        stats.latency += self.alpha * (seconds - stats.latency)
+        stats.failure_rate += self.alpha * ((1.0 if failed else 0.0) - stats.failure_rate)
+        stats.samples += 1
+
+    def expected_cost(self, key: str) -> float:
+        stats = self.stats.get(key)
+        if stats is None:
+            return self.default_latency
+        return stats.latency * (1.0 + stats.failure_rate)
+
+    def task_cost(self, task: WorkerTaskInput) -> float:
+        """Cost of a task; MCP-bridged tasks use the called tool's stats once known."""
+        tool_name = task.params.get("tool_name")
+        if isinstance(tool_name, str) and tool_key(tool_name) in self.stats:
+            return self.expected_cost(tool_key(tool_name))
+        return self.expected_cost(skill_key(task.skill_name))
+
+    def critical_path(self, plan: list[WorkerTaskInput]) -> dict[UUID, float]:
+        """
+        Critical-path length per task: its own cost plus the longest chain of
+        downstream costs. Dispatching the largest first shortens the makespan.
+        """
+        graph = TaskGraph(plan)
+        remaining: dict[UUID, float] = {}
+        # Reverse topological order: a task's dependents are always finished first.
+        for task_id in reversed(self._topological_order(graph)):
+            downstream = (remaining[child_id] for child_id in graph.dependents[task_id])
+            remaining[task_id] = self.task_cost(graph.tasks[task_id]) + max(downstream, default=0.0)
+        return remaining
+
+    @staticmethod
+    def _topological_order(graph: TaskGraph) -> list[UUID]:
+        in_degree = {task_id: len(task.depends_on) for task_id, task in graph.tasks.items()}
+        order = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        for task_id in order:
+            for child_id in graph.dependents[task_id]:
+                in_degree[child_id] -= 1
+                if in_degree[child_id] == 0:
+                    order.append(child_id)
+        return order
+
+    def concurrency_for(self, skill_name: str, max_concurrency: int) -> int:
+        """
+        Slots a skill may hold at once: the global limit, scaled down by the skill's
+        failure rate so a failing skill cannot occupy every slot.
+        """
+        stats = self.stats.get(skill_key(skill_name))
+        if stats is None:
+            return max_concurrency
+        return max(1, math.ceil(max_concurrency * (1.0 - stats.failure_rate)))
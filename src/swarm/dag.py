@@ -0,0 +1,98 @@
+from uuid import UUID
+
+from src.models.schemas import WorkerTaskInput
+
+
+class TaskGraph:
+    """
+    Dependency graph over a Planner's task list.
+    Tracks which tasks are ready to dispatch as their upstream tasks resolve.
+    """
+
+    def __init__(self, tasks: list[WorkerTaskInput]):
+        self.tasks: dict[UUID, WorkerTaskInput] = {}
+        for task in tasks:
+            if task.task_id in self.tasks:
+                raise ValueError(f"Duplicate task id in plan: {task.task_id}")
+            self.tasks[task.task_id] = task
+
+        self.dependents: dict[UUID, list[UUID]] = {task_id: [] for task_id in self.tasks}
+        self._waiting_on: dict[UUID, set[UUID]] = {}
+        for task in tasks:
+            for upstream_id in task.depends_on:
+                if upstream_id not in self.tasks:
+                    raise ValueError(f"Task {task.task_id} depends on unknown task {upstream_id}.")
+                self.dependents[upstream_id].append(task.task_id)
+            self._waiting_on[task.task_id] = set(task.depends_on)
+
+        self._dispatched: set[UUID] = set()
+        self._resolved: set[UUID] = set()
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        """Kahn's algorithm: every task must be reachable from a root."""
+        in_degree = {task_id: len(deps) for task_id, deps in self._waiting_on.items()}
+        frontier = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while frontier:
+            task_id = frontier.pop()
+            visited += 1
+            for child_id in self.dependents[task_id]:
+                in_degree[child_id] -= 1
+                if in_degree[child_id] == 0:
+                    frontier.append(child_id)
+        if visited != len(self.tasks):
+            raise ValueError("Plan contains a dependency cycle.")
+
+    def ready(self) -> list[WorkerTaskInput]:
+        """Return tasks whose dependencies are resolved, marking them as dispatched."""
+        ready_tasks = [
+            task
+            for task_id, task in self.tasks.items()
+            if task_id not in self._dispatched and not self._waiting_on[task_id]
+        ]
+        self._dispatched.update(task.task_id for task in ready_tasks)
+        return ready_tasks
+
+    def resolve(self, task_id: UUID, succeeded: bool = True) -> list[WorkerTaskInput]:
+        """
+        Mark a task as finished.
+        If it failed, every downstream task is resolved as well and returned so the
+        caller can record it as skipped.
+        """
+        self._resolved.add(task_id)
+        if succeeded:
+            for child_id in self.dependents[task_id]:
+                self._waiting_on[child_id].discard(task_id)
+            return []
+
+        skipped = []
+        stack = list(self.dependents[task_id])
+        while stack:
+            child_id = stack.pop()
+            if child_id in self._dispatched:
+                continue
+            self._dispatched.add(child_id)
+            self._resolved.add(child_id)
+            skipped.append(self.tasks[child_id])
+            stack.extend(self.dependents[child_id])
+        return skipped
+
+    def downstream(self, task_ids: list[UUID]) -> set[UUID]:
+        """The given tasks together with everything that transitively depends on them."""
+        reached: set[UUID] = set()
+        stack = list(task_ids)
+        while stack:
+            task_id = stack.pop()
+            if task_id not in reached:
+                reached.add(task_id)
+                stack.extend(self.dependents[task_id])
+        return reached
+
+    def restore(self, task_id: UUID):
+        """Mark a task as already completed (e.g. loaded from a checkpoint) without dispatching it."""
+        self._dispatched.add(task_id)
+        self.resolve(task_id, succeeded=True)
+
+    def is_finished(self) -> bool:
+        return len(self._resolved) == len(self.tasks)
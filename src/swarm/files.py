@@ -0,0 +1,21 @@
+import os
+import tempfile
+
+
+def write_atomic(path: str, payload: str):
+    """
+    Replace the file at `path` with `payload` in one step, so readers never see a
+    partial file. Each call writes through its own temp file, so concurrent writers
+    (threads or processes) never clobber each other's half-written data.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,39 +1,240 @@
-from src.models.schemas import JudgeValidationOutput, TaskStatus, WorkerTaskOutput
+from collections import Counter
+
+from pydantic import BaseModel
+
+from skills.base import BaseSkill
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from src.governance.confidence_scoring import ConfidenceScorer, IncrementalScore
+from src.models.schemas import (
+    JudgeValidationOutput,
+    TaskStatus,
+    WorkerTaskInput,
+    WorkerTaskOutput,
+)
+from src.persona.soul import Soul
 from src.swarm.base import Judge
+from src.swarm.verdict_cache import VerdictCache, verdict_key
+
+
+class JudgeCascade(BaseModel):
+    """
+    Checks ChimeraJudge runs on an output's text content, cheapest first; an
+    output leaves the cascade at the first tier that decides it.
+
+    1. `safety`: keyword safety filter and the persona's forbidden terms (reject).
+    2. `persona`: persona score; the output is judged on the lower of it and the
+       worker's own confidence.
+    3. `deep_check`: only for outputs in the gray zone between `gray_zone_floor`
+       and the confidence threshold. It may reject them, but never approves:
+       gray-zone outputs still go to human review.
+    """
+
+    safety: bool = True
+    persona: bool = True
+    deep_check: bool = True
+    gray_zone_floor: float = 0.7
 
 
 class ChimeraJudge(Judge):
     """
     Chimera Implementation of the Judge agent.
     Validates content based on confidence scores and persona consistency rules.
+
+    Outputs carrying text content (a result with a 'content' string, as produced
+    by the content generator) go through the `cascade` of checks against the
+    `soul` (safety keywords only without one); `decided_by` counts which tier
+    settled each verdict. The deep check runs `deep_checker`
+    (SkillPersonaConsistency by default).
+
+    With a `verdict_cache`, verdicts on content are reused for byte-identical
+    content judged again against the same persona version (and the same worker
+    confidence and Judge settings); reused verdicts are marked '[cached]'.
+
+    `screen()` checks content while it is still being generated (see
+    ChimeraWorker's `stream_judge`) with the same safety and forbidden-term rules.
     """
 
-    def __init__(self, name: str = "ChimeraJudge", confidence_threshold: float = 0.9):
+    def __init__(
+        self,
+        name: str = "ChimeraJudge",
+        confidence_threshold: float = 0.9,
+        soul: Soul | None = None,
+        cascade: JudgeCascade | None = None,
+        deep_checker: BaseSkill | None = None,
+        verdict_cache: VerdictCache | None = None,
+    ):
         super().__init__(name)
         self.confidence_threshold = confidence_threshold
+        self.soul = soul
+        self.scorer = ConfidenceScorer(
+            soul or Soul(name="default", dna={}, directives=[], forbidden=[])
+        )
+        self.cascade = cascade or JudgeCascade()
+        self.deep_checker = deep_checker or SkillPersonaConsistency()
+        self.decided_by: Counter[str] = Counter()
+        self.verdict_cache = verdict_cache
+
+    def screen(self) -> IncrementalScore:
+        """Incremental checker for one piece of streamed content."""
+        return self.scorer.incremental()
 
     async def validate_output(self, worker_output: WorkerTaskOutput) -> JudgeValidationOutput:
+        return (await self.validate_outputs([worker_output]))[0]
+
+    async def validate_outputs(
+        self, worker_outputs: list[WorkerTaskOutput]
+    ) -> list[JudgeValidationOutput]:
         """
-        Validate the output of a Worker task.
-        Logic:
-        - confidence_score >= threshold: COMPLETED (Auto-approved)
-        - 0.7 <= confidence_score < threshold: ESC_HITL (Needs review)
-        - confidence_score < 0.7: FAILED (Reject)
+        Validate the outputs of Worker tasks.
+        Logic (score = worker confidence, lowered by the persona score when checked):
+        - safety breach or forbidden term: FAILED (Reject)
+        - score >= threshold: COMPLETED (Auto-approved)
+        - 0.7 <= score < threshold: ESC_HITL (Needs review), unless the deep check rejects it
+        - score < 0.7: FAILED (Reject)
         """
+        # The cheap tiers settle a whole batch in one pass; gray-zone outputs share
+        # a single deep-check batch.
+        decided: dict[int, JudgeValidationOutput] = {}
+        gray_zone: list[tuple[int, str, float]] = []  # index, content, score
+        cache_keys = self._cache_keys(worker_outputs)
+        for index, worker_output in enumerate(worker_outputs):
+            cached = self._cached(cache_keys[index])
+            if cached is not None:
+                decided[index] = cached
+                cache_keys[index] = None  # Already cached; nothing to store.
+                continue
+            verdict, content, score = self._cheap_verdict(worker_output)
+            if verdict is not None:
+                decided[index] = verdict
+            elif content is not None:  # Only outputs with content reach the gray zone.
+                gray_zone.append((index, content, score))
+
+        if gray_zone:
+            checks = await self.deep_checker.execute_batch(
+                [self._deep_check_input(content) for _, content, _ in gray_zone]
+            )
+            for (index, _, score), check in zip(gray_zone, checks, strict=True):
+                decided[index] = self._deep_verdict(score, check)
+
+        verdicts = [decided[index] for index in range(len(worker_outputs))]
+        if self.verdict_cache is not None:
+            for key, verdict in zip(cache_keys, verdicts, strict=True):
+                if key is not None:
+                    self.verdict_cache.put(key, verdict)
+        return verdicts
+
+    def _cache_keys(self, worker_outputs: list[WorkerTaskOutput]) -> list[str | None]:
+        """Verdict cache key per output; None for outputs without text content."""
+        if self.verdict_cache is None:
+            return [None] * len(worker_outputs)
+        soul = self.scorer.soul
+        persona_version = soul.version
+        settings = (
+            f"{self.confidence_threshold}:{self.cascade.model_dump_json()}:"
+            f"{self.deep_checker.name}:{self.deep_checker.version}"
+        )
+        keys = []
+        for worker_output in worker_outputs:
+            content = self._content_of(worker_output)
+            context = f"{worker_output.confidence_score}:{settings}"
+            keys.append(
+                None
+                if content is None
+                else verdict_key(content, soul.name, persona_version, context)
+            )
+        return keys
+
+    def _cached(self, key: str | None) -> JudgeValidationOutput | None:
+        if key is None or self.verdict_cache is None:
+            return None
+        verdict = self.verdict_cache.get(key)
+        if verdict is not None:
+            self.decided_by["cache"] += 1
+        return verdict
+
+    def _cheap_verdict(
+        self, worker_output: WorkerTaskOutput
+    ) -> tuple[JudgeValidationOutput | None, str | None, float]:
+        """Verdict from the confidence, safety and persona tiers; None for the gray zone."""
         score = worker_output.confidence_score
+        content = self._content_of(worker_output)
+        if score < self.cascade.gray_zone_floor:
+            return self._decide("confidence", self._rejection(score, worker_output)), content, score
+
+        if content is not None and (self.cascade.safety or self.cascade.persona):
+            check = self.scorer.check(content)
+            if self.cascade.safety and check.hits:
+                breach = self.scorer.matcher.describe(check.hits[0])
+                verdict = JudgeValidationOutput(
+                    approval_status=TaskStatus.FAILED,
+                    feedback=f"Rejected: Safety check failed ({breach}).",
+                )
+                return self._decide("safety", verdict), content, score
+            if self.cascade.persona:
+                score = min(score, check.score)
+                tier = "persona"
+            else:
+                tier = "safety"
+        else:
+            tier = "confidence"
 
         if score >= self.confidence_threshold:
-            return JudgeValidationOutput(
+            verdict = JudgeValidationOutput(
                 approval_status=TaskStatus.COMPLETED,
                 feedback="Auto-approved: High confidence and consistency.",
             )
-        elif score >= 0.7:
-            return JudgeValidationOutput(
-                approval_status=TaskStatus.ESC_HITL,
-                feedback=f"Confidence {score} is below threshold {self.confidence_threshold}. Escalating to human review.",
-            )
-        else:
-            return JudgeValidationOutput(
+            return self._decide(tier, verdict), content, score
+        if score < self.cascade.gray_zone_floor:
+            return self._decide(tier, self._rejection(score, worker_output)), content, score
+        if content is None or not self.cascade.deep_check:
+            return self._decide(tier, self._escalation(score)), content, score
+        return None, content, score
+
+    def _deep_verdict(self, score: float, check: WorkerTaskOutput) -> JudgeValidationOutput:
+        deep_score = check.confidence_score
+        if deep_score < self.cascade.gray_zone_floor:
+            verdict = JudgeValidationOutput(
                 approval_status=TaskStatus.FAILED,
-                feedback=f"Rejected: Confidence {score} is too low. Reasoning: {worker_output.reasoning}",
+                feedback=f"Rejected: Deep persona check scored {deep_score}. {check.reasoning}",
             )
+        else:
+            verdict = self._escalation(score, f" Deep persona check scored {deep_score}.")
+        return self._decide("deep", verdict)
+
+    def _decide(self, tier: str, verdict: JudgeValidationOutput) -> JudgeValidationOutput:
+        self.decided_by[tier] += 1
+        return verdict
+
+    def _escalation(self, score: float, detail: str = "") -> JudgeValidationOutput:
+        return JudgeValidationOutput(
+            approval_status=TaskStatus.ESC_HITL,
+            feedback=f"Confidence {score} is below threshold {self.confidence_threshold}. Escalating to human review.{detail}",
+        )
+
+    @staticmethod
+    def _rejection(score: float, worker_output: WorkerTaskOutput) -> JudgeValidationOutput:
+        return JudgeValidationOutput(
+            approval_status=TaskStatus.FAILED,
+            feedback=f"Rejected: Confidence {score} is too low. Reasoning: {worker_output.reasoning}",
+        )
+
+    @staticmethod
+    def _content_of(worker_output: WorkerTaskOutput) -> str | None:
+        result = worker_output.result
+        if isinstance(result, dict):
+            content = result.get("content")
+            if isinstance(content, str):
+                return content
+        return None
+
+    def _deep_check_input(self, content: str) -> WorkerTaskInput:
+        soul = self.scorer.soul
+        return WorkerTaskInput(
+            skill_name=self.deep_checker.name,
+            params={
+                "content_to_verify": content,
+                "soul_context": "; ".join(f"{k}: {v}" for k, v in soul.dna.items()) or soul.name,
+                "constraints": soul.forbidden,
+            },
+            persona_id=soul.name,
+        )
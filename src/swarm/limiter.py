@@ -0,0 +1,112 @@
+import asyncio
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class _Waiter:
+    def __init__(self, campaign_id: str, start_tag: float, seq: int, future: asyncio.Future):
+        self.campaign_id = campaign_id
+        self.start_tag = start_tag
+        self.seq = seq
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class FairShareLimiter:
+    """
+    Global in-flight cap shared by many campaigns.
+
+    Slots are granted by start-time fair queuing: each campaign advances its own
+    virtual clock by `1 / weight` per granted slot, so heavier campaigns get
+    proportionally more slots. Priority tiers are served first, and a waiting
+    request gains one priority level every `1 / aging_rate` seconds so low-priority
+    campaigns are never starved.
+    """
+
+    def __init__(self, max_in_flight: int, aging_rate: float = 1.0):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self.max_in_flight = max_in_flight
+        self.aging_rate = aging_rate
+        self.in_flight = 0
+        self._weights: dict[str, float] = {}
+        self._priorities: dict[str, int] = {}
+        self._last_finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    def register(self, campaign_id: str, weight: float = 1.0, priority: int = 0):
+        """Declare a campaign's share. Unregistered campaigns default to weight 1, priority 0."""
+        if weight <= 0:
+            raise ValueError("weight must be positive.")
+        self._weights[campaign_id] = weight
+        self._priorities[campaign_id] = priority
+
+    def unregister(self, campaign_id: str):
+        self._weights.pop(campaign_id, None)
+        self._priorities.pop(campaign_id, None)
+        self._last_finish.pop(campaign_id, None)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _next_start_tag(self, campaign_id: str) -> float:
+        start_tag = max(self._virtual_time, self._last_finish.get(campaign_id, 0.0))
+        self._last_finish[campaign_id] = start_tag + 1.0 / self._weights.get(campaign_id, 1.0)
+        return start_tag
+
+    def _effective_priority(self, waiter: _Waiter, now: float) -> int:
+        waited = now - waiter.enqueued_at
+        return self._priorities.get(waiter.campaign_id, 0) + math.floor(waited * self.aging_rate)
+
+    async def acquire(self, campaign_id: str):
+        start_tag = self._next_start_tag(campaign_id)
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self._virtual_time = start_tag
+            self.in_flight += 1
+            return
+
+        waiter = _Waiter(
+            campaign_id, start_tag, next(self._seq), asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Granted in the same tick we were cancelled: hand the slot on.
+                self.release(campaign_id)
+            raise
+
+    def release(self, campaign_id: str):
+        self.in_flight -= 1
+        self._grant_next()
+
+    def _grant_next(self):
+        now = time.monotonic()
+        while self._waiters and self.in_flight < self.max_in_flight:
+            waiter = min(
+                self._waiters,
+                key=lambda w: (-self._effective_priority(w, now), w.start_tag, w.seq),
+            )
+            self._waiters.remove(waiter)
+            if waiter.future.done():
+                continue
+            self._virtual_time = waiter.start_tag
+            self.in_flight += 1
+            waiter.future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, campaign_id: str) -> AsyncIterator[None]:
+        await self.acquire(campaign_id)
+        try:
+            yield
+        finally:
+            self.release(campaign_id)
@@ -1,80 +1,280 @@
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any
 
-from src.models.schemas import Campaign, TaskStatus
+from src.models.schemas import Campaign, TaskStatus, WorkerTaskInput
+from src.observability.metrics import SWARM_METRICS, SwarmMetrics
+from src.observability.tracing import TRACER, Tracer, span
 from src.swarm.base import Judge, Orchestrator, Planner, Worker
+from src.swarm.batching import BatchPolicy
+from src.swarm.cost_model import CostModel
+from src.swarm.limiter import FairShareLimiter
+from src.swarm.pipeline import CampaignPipeline
 from src.swarm.state import StateManager
 
+if TYPE_CHECKING:
+    from src.mcp.client import ChimeraMCPClient
+
 
 class ChimeraOrchestrator(Orchestrator):
     """
     Chimera Implementation of the Orchestrator.
     Manages the lifecycle of a campaign by coordinating Planner, Worker, and Judge.
+
+    Health of the swarm members and of every MCP server in `mcp_clients` is probed
+    concurrently (each bounded by `probe_timeout`) and cached for `health_ttl`
+    seconds. Tasks whose skill requires MCP are refused while an MCP server is down.
+
+    Stage latencies and outcomes are recorded on `metrics` (the process-wide
+    SWARM_METRICS by default; scrape them with `metrics.registry.serve()`).
+    Each run is traced on `tracer`: a `run_swarm` root span with children for
+    planning, every task execution, validation, persistence and MCP tool call.
+
+    Level 2 recovery: when tasks fail, the Planner replans only the failed subgraph
+    and the replacements run against the kept results, up to `max_replans` times.
+
+    A `cost_model` (per-skill/tool latency and failure statistics) drives
+    critical-path-first dispatch and per-skill concurrency; it learns from every
+    run and is saved after each one when it has a path.
+
+    With `judge_batch`, outputs waiting for review are validated in batches
+    (see CampaignPipeline). A Judge's `verdict_cache` is saved after each run.
     """
 
     def __init__(
-        self, name: str, planner: Planner, worker: Worker, judge: Judge, state_manager: StateManager
+        self,
+        name: str,
+        planner: Planner,
+        worker: Worker,
+        judge: Judge,
+        state_manager: StateManager,
+        max_concurrency: int = 4,
+        stage_queue_size: int | None = None,
+        mcp_clients: "dict[str, ChimeraMCPClient] | None" = None,
+        health_ttl: float = 5.0,
+        probe_timeout: float = 1.0,
+        metrics: SwarmMetrics | None = None,
+        tracer: Tracer | None = None,
+        max_replans: int = 1,
+        cost_model: CostModel | None = None,
+        skill_concurrency: dict[str, int] | None = None,
+        judge_batch: BatchPolicy | None = None,
     ):
         super().__init__(name)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
         self.planner = planner
         self.worker = worker
         self.judge = judge
         self.state_manager = state_manager
+        self.max_concurrency = max_concurrency
+        self.stage_queue_size = stage_queue_size or max_concurrency
+        self.metrics = metrics or SWARM_METRICS
+        self.tracer = tracer or TRACER
+        self.max_replans = max_replans
+        self.cost_model = cost_model
+        self.skill_concurrency = skill_concurrency
+        self.judge_batch = judge_batch
+
+        if mcp_clients is None:
+            worker_client = getattr(worker, "mcp_client", None)
+            mcp_clients = {"default": worker_client} if worker_client else {}
+        self.mcp_clients = mcp_clients
+        self.health_ttl = health_ttl
+        self.probe_timeout = probe_timeout
+        self._health: dict[str, bool] = {}
+        self._health_checked_at: float | None = None
+        self._health_refresh: asyncio.Task | None = None
 
     async def monitor_health(self) -> dict[str, bool]:
-        """Simple health check of components."""
-        return {"planner": True, "worker": True, "judge": True}
+        """
+        Probe every component and MCP server concurrently.
+        Results are cached for `health_ttl` seconds; a probe that errors or exceeds
+        `probe_timeout` counts as unhealthy.
+        """
+        if self._health_is_fresh():
+            return dict(self._health)
+
+        probes: dict[str, Awaitable[bool]] = {
+            "planner": self.planner.health_check(),
+            "worker": self.worker.health_check(),
+            "judge": self.judge.health_check(),
+        }
+        for server_name, client in self.mcp_clients.items():
+            probes[f"mcp:{server_name}"] = client.health_check()
+
+        outcomes = await asyncio.gather(*(self._probe(probe) for probe in probes.values()))
+        self._health = dict(zip(probes, outcomes, strict=True))
+        self._health_checked_at = time.monotonic()
+
+        unhealthy = [name for name, healthy in self._health.items() if not healthy]
+        if unhealthy:
+            logging.warning(f"Health probe failed for: {', '.join(unhealthy)}")
+        return dict(self._health)
+
+    async def _probe(self, probe: Awaitable[bool]) -> bool:
+        try:
+            return bool(await asyncio.wait_for(probe, self.probe_timeout))
+        except Exception:
+            return False
 
-    async def run_swarm(self, campaign: Campaign):
+    def _health_is_fresh(self) -> bool:
+        return (
+            self._health_checked_at is not None
+            and time.monotonic() - self._health_checked_at < self.health_ttl
+        )
+
+    def health_snapshot(self) -> dict[str, bool]:
         """
-        Primary control loop for the FastRender Swarm.
-        Goal -> Plan -> Execute (Loop) -> Validate -> Complete
+        Cached health for hot-path callers; never waits on a probe.
+        A stale cache triggers one background refresh.
         """
-        logging.info(f"Starting Campaign Swarm: {campaign.title}")
+        if not self._health_is_fresh() and (
+            self._health_refresh is None or self._health_refresh.done()
+        ):
+            self._health_refresh = asyncio.create_task(self.monitor_health())
+        return dict(self._health)
 
-        # Save initial campaign state
-        await self.state_manager.save_campaign(campaign)
+    def admit(self, task: WorkerTaskInput) -> str | None:
+        """Admission control: the reason to refuse `task`, or None to dispatch it."""
+        resolve_skill = getattr(self.worker, "resolve_skill", None)
+        try:
+            skill = resolve_skill(task.skill_name) if resolve_skill else None
+        except Exception:
+            skill = None  # the Worker reports load failures itself
+        if skill is None or not skill.requires_mcp:
+            return None
+        health = self.health_snapshot()
+        down = [name for name in self.mcp_clients if health.get(f"mcp:{name}") is False]
+        if down:
+            return f"Admission refused: MCP server(s) {', '.join(down)} unhealthy."
+        return None
 
-        # 1. Planning Phase
-        plan = await self.planner.create_plan(campaign)
-        logging.info(f"Generated plan with {len(plan)} tasks.")
+    async def run_swarm(
+        self,
+        campaign: Campaign,
+        limiter: FairShareLimiter | None = None,
+        resume: bool = False,
+    ):
+        """
+        Primary control loop for the FastRender Swarm.
+        Goal -> Plan -> Execute (DAG) -> Validate -> Persist
 
-        results = []
+        Tasks whose dependencies have resolved run concurrently, bounded by
+        `max_concurrency`; execution, validation and persistence are pipelined
+        stages joined by queues of `stage_queue_size` (see CampaignPipeline).
+        Results are returned in plan order.
 
-        # 2. Sequential Execution (MVP Fallback from Day 3 Plan)
-        for task in plan:
-            logging.info(f"Executing task: {task.skill_name} ({task.task_id})")
+        When a `limiter` is given (see CampaignScheduler), each task also takes a slot
+        from that shared, fair-share limiter before it is dispatched.
 
-            # Execute
-            worker_output = await self.worker.perform_task(task)
+        The plan is checkpointed alongside the campaign. With `resume=True` the
+        persisted plan is reused and tasks whose latest result is COMPLETED or
+        ESC_HITL are restored instead of re-executed.
+        """
+        attributes = {"campaign.id": str(campaign.id), "campaign.title": campaign.title}
+        with self.tracer.start_span("run_swarm", attributes):
+            return await self._run(campaign, limiter, resume)
+
+    async def _run(self, campaign: Campaign, limiter: FairShareLimiter | None, resume: bool):
+        logging.info(f"Starting Campaign Swarm: {campaign.title}")
+        campaign_id = str(campaign.id)
 
-            # 3. Validation Phase
-            validation = await self.judge.validate_output(worker_output)
+        # Save initial campaign state and warm the health cache for admission control
+        await self.state_manager.save_campaign(campaign)
+        await self.monitor_health()
 
-            res_entry = {
-                "task_id": task.task_id,
-                "skill": task.skill_name,
-                "status": validation.approval_status,
-                "output": worker_output.model_dump(),
-                "feedback": validation.feedback,
-            }
+        # 1. Planning Phase (or reload the checkpointed plan)
+        plan = await self.state_manager.get_plan(campaign_id) if resume else None
+        completed: list[dict[str, Any]] = []
+        if plan is None:
+            with (
+                span("create_plan", {"campaign.id": campaign_id}) as plan_span,
+                self.metrics.stage_seconds.labels("plan").time(),
+            ):
+                plan = await self.planner.create_plan(campaign)
+                plan_span.set_attribute("plan.tasks", len(plan))
+            await self.state_manager.save_plan(campaign_id, plan)
+            logging.info(f"Generated plan with {len(plan)} tasks.")
+        else:
+            completed = await self._load_checkpoint(campaign_id, plan)
+            logging.info(
+                f"Resuming plan with {len(plan)} tasks; {len(completed)} restored from checkpoint."
+            )
 
-            # Persist result
-            await self.state_manager.save_task_result(str(campaign.id), res_entry)
+        # 2. Pipelined Execution -> Validation -> Persistence
+        results = await self._execute(campaign, plan, limiter, completed)
 
-            if validation.approval_status == TaskStatus.COMPLETED:
-                logging.info(
-                    f"[SUCCESS] Task {task.task_id} approved. Result size: {len(str(worker_output.result))} chars."
-                )
-            elif validation.approval_status == TaskStatus.ESC_HITL:
-                logging.warning(
-                    f"[ESC_HITL] Task {task.task_id} requires human review. Reason: {validation.feedback}"
-                )
-            else:
-                logging.error(
-                    f"[FAILURE] Task {task.task_id} rejected. Initiating Level 2 recovery path."
-                )
+        # 3. Level 2 recovery: re-run only the failed subgraph
+        for attempt in range(1, self.max_replans + 1):
+            failed = [
+                res_entry for res_entry in results if res_entry["status"] == TaskStatus.FAILED
+            ]
+            if not failed:
+                break
+            logging.warning(
+                f"[REPLAN] {len(failed)} task(s) failed; replanning attempt {attempt}/{self.max_replans}."
+            )
+            feedback = "; ".join(
+                f"{res_entry['skill']}: {res_entry['feedback']}"
+                for res_entry in failed
+                if res_entry["feedback"]
+            )
+            with span("replan", {"campaign.id": campaign_id, "replan.attempt": attempt}):
+                replacements = await self.planner.replan(campaign, plan, results, feedback)
+            if not replacements:
+                break
 
-            results.append(res_entry)
+            kept = [res_entry for res_entry in results if res_entry["status"] != TaskStatus.FAILED]
+            kept_ids = {res_entry["task_id"] for res_entry in kept}
+            plan = [task for task in plan if task.task_id in kept_ids] + replacements
+            await self.state_manager.save_plan(campaign_id, plan)
+            results = await self._execute(campaign, plan, limiter, kept)
 
+        if self.cost_model is not None:
+            await self.cost_model.save()
+        verdict_cache = getattr(self.judge, "verdict_cache", None)
+        if verdict_cache is not None:
+            await verdict_cache.save()
         logging.info(f"Swarm run finished for campaign: {campaign.title}")
         return results
+
+    async def _execute(
+        self,
+        campaign: Campaign,
+        plan: list[WorkerTaskInput],
+        limiter: FairShareLimiter | None,
+        completed: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        pipeline = CampaignPipeline(
+            campaign=campaign,
+            plan=plan,
+            worker=self.worker,
+            judge=self.judge,
+            state_manager=self.state_manager,
+            max_concurrency=self.max_concurrency,
+            queue_size=self.stage_queue_size,
+            limiter=limiter,
+            completed=completed,
+            admission=self.admit,
+            metrics=self.metrics,
+            cost_model=self.cost_model,
+            skill_concurrency=self.skill_concurrency,
+            judge_batch=self.judge_batch,
+        )
+        return await pipeline.run()
+
+    async def _load_checkpoint(
+        self, campaign_id: str, plan: list[WorkerTaskInput]
+    ) -> list[dict[str, Any]]:
+        """Latest persisted result per planned task, keeping only finished ones."""
+        planned = {str(task.task_id) for task in plan}
+        latest: dict[str, dict[str, Any]] = {}
+        for res_entry in await self.state_manager.get_task_results(campaign_id):
+            task_id = str(res_entry["task_id"])
+            if task_id in planned:
+                latest[task_id] = res_entry
+        finished = (TaskStatus.COMPLETED, TaskStatus.ESC_HITL)
+        return [entry for entry in latest.values() if entry["status"] in finished]
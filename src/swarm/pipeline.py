@@ -0,0 +1,376 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from src.models.schemas import (
+    Campaign,
+    JudgeValidationOutput,
+    TaskStatus,
+    WorkerTaskInput,
+    WorkerTaskOutput,
+)
+from src.observability.metrics import SWARM_METRICS, SwarmMetrics
+from src.observability.tracing import span
+from src.swarm.artifacts import ArtifactStore
+from src.swarm.base import Judge, Worker
+from src.swarm.batching import BatchPolicy
+from src.swarm.cost_model import CostModel, skill_key
+from src.swarm.dag import TaskGraph
+from src.swarm.limiter import FairShareLimiter
+from src.swarm.state import StateManager
+
+
+class CampaignPipeline:
+    """
+    Execute -> Validate -> Persist stages for a single campaign run.
+
+    Ready tasks are executed concurrently (bounded by `max_concurrency`) and handed
+    to the Judge stage through a bounded review queue; verdicts flow to the persist
+    stage through a second bounded queue. Judging and persisting of one task thus
+    overlap execution of the next, and a full queue blocks the upstream stage
+    (backpressure) instead of buffering without limit.
+
+    Result entries passed as `completed` (e.g. from a checkpoint) are restored up
+    front: their outputs are available to dependents and they are never re-dispatched.
+
+    An `admission` callback may refuse a ready task (returning the reason); refused
+    tasks are recorded with a confidence-0.0 output instead of being dispatched.
+
+    Stage and per-skill latencies, outcomes, queue depths and in-flight tasks are
+    recorded on `metrics`.
+
+    With a `cost_model`, ready tasks are dispatched longest critical path first,
+    each skill is capped at its `concurrency_for` share of the slots, and every
+    dispatched task's latency and verdict are fed back into the model. Explicit
+    `skill_concurrency` caps take precedence. Without either, tasks are dispatched
+    in plan order.
+
+    With a `judge_batch` policy, the Judge stage takes up to `max_size` outputs from
+    the review queue at once, waiting at most `max_linger` for more to arrive, and
+    validates them with a single `validate_outputs` call.
+    """
+
+    def __init__(
+        self,
+        campaign: Campaign,
+        plan: list[WorkerTaskInput],
+        worker: Worker,
+        judge: Judge,
+        state_manager: StateManager,
+        max_concurrency: int,
+        queue_size: int,
+        limiter: FairShareLimiter | None = None,
+        completed: list[dict[str, Any]] | None = None,
+        admission: Callable[[WorkerTaskInput], str | None] | None = None,
+        metrics: SwarmMetrics | None = None,
+        cost_model: CostModel | None = None,
+        skill_concurrency: dict[str, int] | None = None,
+        judge_batch: BatchPolicy | None = None,
+    ):
+        self.campaign = campaign
+        self.plan = plan
+        self.worker = worker
+        self.judge = judge
+        self.state_manager = state_manager
+        self.limiter = limiter
+        self.admission = admission
+        self.metrics = metrics or SWARM_METRICS
+        self.cost_model = cost_model
+        self.max_concurrency = max_concurrency
+        self.skill_concurrency = skill_concurrency or {}
+        self.judge_batch = judge_batch
+
+        self.graph = TaskGraph(plan)
+        self.artifacts = ArtifactStore()
+        self.entries: dict[UUID, dict[str, Any]] = {}
+        self.review_queue: asyncio.Queue[tuple[WorkerTaskInput, WorkerTaskOutput]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.persist_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
+
+        self._priority = cost_model.critical_path(plan) if cost_model else {}
+        self._ready: list[tuple[float, int, WorkerTaskInput]] = []
+        self._sequence = itertools.count()
+        self._in_flight: Counter[str] = Counter()
+        self._latencies: dict[UUID, float] = {}
+        self._progress = asyncio.Event()
+        self._running: set[asyncio.Task] = set()
+
+        for res_entry in completed or []:
+            self._restore(res_entry)
+
+    def _restore(self, res_entry: dict[str, Any]):
+        """Seed a checkpointed result so the task is not dispatched again."""
+        worker_output = WorkerTaskOutput.model_validate(res_entry["output"])
+        if worker_output.task_id not in self.graph.tasks:
+            return
+        self.entries[worker_output.task_id] = {**res_entry, "task_id": worker_output.task_id}
+        self.artifacts.put(worker_output)
+        self.graph.restore(worker_output.task_id)
+
+    async def run(self) -> list[dict[str, Any]]:
+        """Drive the plan to completion and return result entries in plan order."""
+        persister = asyncio.create_task(self._persist_stage())
+        self._running.add(asyncio.create_task(self._judge_stage()))
+        self._running.add(persister)
+        try:
+            while True:
+                self._progress.clear()
+                if self.graph.is_finished():
+                    break
+                for task in self.graph.ready():
+                    priority = -self._priority.get(task.task_id, 0.0)
+                    heapq.heappush(self._ready, (priority, next(self._sequence), task))
+                self._launch()
+                await self._wait_for(self._progress.wait())
+
+            await self._wait_for(self.review_queue.join())
+            await self._wait_for(self.persist_queue.join())
+        except Exception:
+            await self._flush_persistence(persister)
+            raise
+        finally:
+            for running in self._running:
+                running.cancel()
+            await asyncio.gather(*self._running, return_exceptions=True)
+            # Items abandoned in the stage queues no longer count towards their depth.
+            self.metrics.queue_depth.labels("review").dec(self.review_queue.qsize())
+            self.metrics.queue_depth.labels("persist").dec(self.persist_queue.qsize())
+
+        return [self.entries[task.task_id] for task in self.plan]
+
+    async def _flush_persistence(self, persister: asyncio.Task):
+        """On failure, save results already handed to the persist stage before aborting."""
+        for running in self._running - {persister}:
+            running.cancel()
+        if persister.done():
+            return
+        flushed = asyncio.ensure_future(self.persist_queue.join())
+        await asyncio.wait({flushed, persister}, return_when=asyncio.FIRST_COMPLETED)
+        flushed.cancel()
+
+    async def _wait_for(self, awaitable):
+        """Wait for `awaitable`, surfacing the first exception raised by any stage."""
+        waiter = asyncio.ensure_future(awaitable)
+        try:
+            while not waiter.done():
+                done, _ = await asyncio.wait(
+                    {waiter, *self._running}, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done - {waiter}:
+                    self._running.discard(finished)
+                    finished.result()
+        finally:
+            waiter.cancel()
+
+    def _skill_limit(self, skill_name: str) -> int:
+        if skill_name in self.skill_concurrency:
+            return self.skill_concurrency[skill_name]
+        if self.cost_model is not None:
+            return self.cost_model.concurrency_for(skill_name, self.max_concurrency)
+        return self.max_concurrency
+
+    def _launch(self):
+        """Start the highest-priority ready tasks that fit the global and per-skill limits."""
+        deferred = []
+        while self._ready and self._in_flight.total() < self.max_concurrency:
+            queued = heapq.heappop(self._ready)
+            skill_name = queued[2].skill_name
+            if self._in_flight[skill_name] >= self._skill_limit(skill_name):
+                deferred.append(queued)
+                continue
+            self._in_flight[skill_name] += 1
+            self._running.add(asyncio.create_task(self._execute_stage(queued[2])))
+        for queued in deferred:
+            heapq.heappush(self._ready, queued)
+
+    def _global_slot(self):
+        if self.limiter is None:
+            return contextlib.nullcontext()
+        return self.limiter.slot(str(self.campaign.id))
+
+    async def _execute_stage(self, task: WorkerTaskInput):
+        """Bind upstream references, run the task and queue the output for review."""
+        try:
+            async with self._global_slot():
+                in_flight = self.metrics.in_flight.labels()
+                in_flight.inc()
+                try:
+                    with (
+                        self.metrics.stage_seconds.labels("execute").time(),
+                        self.metrics.skill_seconds.labels(task.skill_name).time(),
+                    ):
+                        worker_output = await self._dispatch(task)
+                finally:
+                    in_flight.dec()
+            self.artifacts.put(worker_output)
+
+            # Holding the concurrency slot while the review queue is full is the backpressure.
+            await self.review_queue.put((task, worker_output))
+            self.metrics.queue_depth.labels("review").inc()
+        finally:
+            self._in_flight[task.skill_name] -= 1
+            self._progress.set()
+
+    async def _dispatch(self, task: WorkerTaskInput) -> WorkerTaskOutput:
+        refusal = self.admission(task) if self.admission else None
+        if refusal:
+            logging.warning(f"[REFUSED] Task {task.task_id} not dispatched. {refusal}")
+            return self._failed_output(task, refusal)
+
+        logging.info(f"Executing task: {task.skill_name} ({task.task_id})")
+        try:
+            bound_task = self.artifacts.bind(task)
+        except LookupError as e:
+            return self._failed_output(task, str(e))
+        started = asyncio.get_running_loop().time()
+        with span("perform_task", self._span_attributes(task)) as task_span:
+            worker_output = await self.worker.perform_task(bound_task)
+            task_span.set_attribute("confidence_score", worker_output.confidence_score)
+        self._latencies[task.task_id] = asyncio.get_running_loop().time() - started
+        return worker_output
+
+    @staticmethod
+    def _span_attributes(task: WorkerTaskInput) -> dict[str, Any]:
+        return {"task.id": str(task.task_id), "skill.name": task.skill_name}
+
+    @staticmethod
+    def _failed_output(task: WorkerTaskInput, reasoning: str) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task.task_id,
+            skill_name=task.skill_name,
+            result=None,
+            confidence_score=0.0,
+            reasoning=reasoning,
+        )
+
+    async def _judge_stage(self):
+        """Validate outputs, release dependents in the DAG and queue results for persistence."""
+        while True:
+            batch = await self._next_review_batch()
+            validations = await self._validate(batch)
+            for (task, worker_output), validation in zip(batch, validations, strict=True):
+                await self._record_verdict(task, worker_output, validation)
+                self.review_queue.task_done()
+
+    async def _next_review_batch(self) -> list[tuple[WorkerTaskInput, WorkerTaskOutput]]:
+        batch = [await self.review_queue.get()]
+        policy = self.judge_batch
+        if policy is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + policy.max_linger
+            while len(batch) < policy.max_size:
+                if not self.review_queue.empty():
+                    batch.append(self.review_queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.review_queue.get(), remaining))
+                except TimeoutError:
+                    break
+        self.metrics.queue_depth.labels("review").dec(len(batch))
+        return batch
+
+    async def _validate(
+        self, batch: list[tuple[WorkerTaskInput, WorkerTaskOutput]]
+    ) -> list[JudgeValidationOutput]:
+        if len(batch) == 1:
+            task, worker_output = batch[0]
+            with (
+                span("validate_output", self._span_attributes(task)) as judge_span,
+                self.metrics.stage_seconds.labels("judge").time(),
+            ):
+                validation = await self.judge.validate_output(worker_output)
+                judge_span.set_attribute("approval_status", str(validation.approval_status))
+            return [validation]
+        with (
+            span("validate_outputs", {"batch.size": len(batch)}),
+            self.metrics.stage_seconds.labels("judge").time(),
+        ):
+            return await self.judge.validate_outputs([output for _, output in batch])
+
+    async def _record_verdict(
+        self,
+        task: WorkerTaskInput,
+        worker_output: WorkerTaskOutput,
+        validation: JudgeValidationOutput,
+    ):
+        self._log_verdict(task, worker_output, validation)
+
+        res_entry = self._entry(task, worker_output, validation)
+        self.entries[task.task_id] = res_entry
+        succeeded = validation.approval_status != TaskStatus.FAILED
+        latency = self._latencies.pop(task.task_id, None)
+        if self.cost_model is not None and latency is not None:
+            self.cost_model.record(skill_key(task.skill_name), latency, not succeeded)
+        skipped = self.graph.resolve(task.task_id, succeeded)
+        for skipped_task in skipped:
+            self.entries[skipped_task.task_id] = self._skip_entry(skipped_task, task.task_id)
+        self._progress.set()
+
+        for finished in (res_entry, *(self.entries[t.task_id] for t in skipped)):
+            self.metrics.task_outcomes.labels(finished["skill"], finished["status"]).inc()
+            await self.persist_queue.put(finished)
+            self.metrics.queue_depth.labels("persist").inc()
+
+    async def _persist_stage(self):
+        while True:
+            res_entry = await self.persist_queue.get()
+            self.metrics.queue_depth.labels("persist").dec()
+            attributes = {"task.id": str(res_entry["task_id"]), "skill.name": res_entry["skill"]}
+            with (
+                span("save_task_result", attributes),
+                self.metrics.stage_seconds.labels("persist").time(),
+            ):
+                await self.state_manager.save_task_result(str(self.campaign.id), res_entry)
+            self.persist_queue.task_done()
+
+    def _entry(
+        self,
+        task: WorkerTaskInput,
+        worker_output: WorkerTaskOutput,
+        validation: JudgeValidationOutput,
+    ) -> dict[str, Any]:
+        return {
+            "task_id": task.task_id,
+            "skill": task.skill_name,
+            "status": validation.approval_status,
+            "output": worker_output.model_dump(),
+            "feedback": validation.feedback,
+        }
+
+    def _skip_entry(self, task: WorkerTaskInput, failed_task_id: UUID) -> dict[str, Any]:
+        """Result entry for a task that cannot run because an upstream task failed."""
+        reason = f"Skipped: upstream task {failed_task_id} failed."
+        logging.warning(f"[SKIPPED] Task {task.task_id} not executed. {reason}")
+        output = self._failed_output(task, reason)
+        return self._entry(
+            task, output, JudgeValidationOutput(approval_status=TaskStatus.FAILED, feedback=reason)
+        )
+
+    def _log_verdict(
+        self,
+        task: WorkerTaskInput,
+        worker_output: WorkerTaskOutput,
+        validation: JudgeValidationOutput,
+    ):
+        if validation.approval_status == TaskStatus.COMPLETED:
+            logging.info(
+                f"[SUCCESS] Task {task.task_id} approved. Result size: {len(str(worker_output.result))} chars."
+            )
+        elif validation.approval_status == TaskStatus.ESC_HITL:
+            logging.warning(
+                f"[ESC_HITL] Task {task.task_id} requires human review. Reason: {validation.feedback}"
+            )
+        else:
+            logging.error(
+                f"[FAILURE] Task {task.task_id} rejected. Initiating Level 2 recovery path."
+            )
@@ -1,7 +1,42 @@
+from typing import Any
 from uuid import uuid4
 
-from src.models.schemas import Campaign, WorkerTaskInput
+from src.models.schemas import Campaign, TaskStatus, WorkerTaskInput
 from src.swarm.base import Planner
+from src.swarm.dag import TaskGraph
+from src.swarm.templates import (
+    PlanTemplate,
+    TaskTemplate,
+    TemplateCache,
+    TemplateRef,
+    normalize_goal,
+)
+
+STANDARD_TEMPLATE = PlanTemplate(
+    [
+        # 1. Trend Analysis Task
+        TaskTemplate(
+            skill_name="skill_trend_analysis",
+            params={"topic": "{title}", "depth": "high"},
+        ),
+        # 2. Content Generation Task (angled by the trend analysis result)
+        TaskTemplate(
+            skill_name="skill_content_generator",
+            params={
+                "prompt": "Generate a viral post about {title} based on {goal}",
+                "persona": "Sophisticated Influencer",
+                "target_platform": "twitter",
+            },
+            param_refs={"style_guidelines": TemplateRef(step=0, path="result.suggested_angles.0")},
+        ),
+        # 3. Persona Consistency Task
+        TaskTemplate(
+            skill_name="skill_persona_consistency",
+            params={"soul_context": "The persona is sophisticated and tech-savvy."},
+            param_refs={"content_to_verify": TemplateRef(step=1, path="result.content")},
+        ),
+    ]
+)
 
 
 class ChimeraPlanner(Planner):
@@ -11,56 +46,80 @@ class ChimeraPlanner(Planner):
     Trend Analysis -> Content Generation -> Persona Validation.
     """
 
-    def __init__(self, name: str = "ChimeraPlanner"):
+    def __init__(self, name: str = "ChimeraPlanner", template_cache_size: int = 1024):
         super().__init__(name)
+        self.templates = TemplateCache(template_cache_size)
 
     async def create_plan(self, campaign: Campaign) -> list[WorkerTaskInput]:
         """
         Decompose a campaign goal into a list of tasks.
-        Initially, we use a heuristic-based decomposition.
+        Plans are instantiated from a compiled PlanTemplate, cached per normalized
+        goal, so only the first campaign of a shape pays for `compile_template`.
+        Edges are expressed through `param_refs` (which imply `depends_on`), so the
+        Orchestrator runs the plan as a DAG and hands upstream outputs downstream.
         """
-        tasks = []
+        key = normalize_goal(campaign.goal)
+        template = self.templates.get(key)
+        if template is None:
+            template = await self.compile_template(campaign)
+            self.templates.put(key, template)
+        return template.instantiate(campaign)
 
-        # 1. Trend Analysis Task
-        trend_task = WorkerTaskInput(
-            task_id=uuid4(),
-            skill_name="skill_trend_analysis",
-            params={"topic": campaign.title, "depth": "high"},
-            persona_id="default_persona",
-        )
-        tasks.append(trend_task)
-
-        # 2. Content Generation Task
-        # Note: In a real system, this would depend on the output of Task 1.
-        content_task = WorkerTaskInput(
-            task_id=uuid4(),
-            skill_name="skill_content_generator",
-            params={
-                "prompt": f"Generate a viral post about {campaign.title} based on {campaign.goal}",
-                "persona": "Sophisticated Influencer",
-                "target_platform": "twitter",
-            },
-            persona_id="default_persona",
-        )
-        tasks.append(content_task)
-
-        # 3. Persona Consistency Task
-        consistency_task = WorkerTaskInput(
-            task_id=uuid4(),
-            skill_name="skill_persona_consistency",
-            params={
-                "content_to_verify": "PENDING_CONTENT",
-                "soul_context": "The persona is sophisticated and tech-savvy.",
-            },
-            persona_id="default_persona",
-        )
-        tasks.append(consistency_task)
-
-        return tasks
+    async def compile_template(self, campaign: Campaign) -> PlanTemplate:
+        """
+        Build the plan shape for a campaign goal.
+        Initially, we use a heuristic-based decomposition that is the same for every
+        goal; expensive (e.g. LLM-backed) planners override this.
+        """
+        return STANDARD_TEMPLATE
 
-    async def replan(self, campaign: Campaign, feedback: str) -> list[WorkerTaskInput]:
+    async def replan(
+        self,
+        campaign: Campaign,
+        plan: list[WorkerTaskInput],
+        results: list[dict[str, Any]],
+        feedback: str | None = None,
+    ) -> list[WorkerTaskInput]:
         """
-        Simple replanning logic: just regenerate the plan for now.
-        In a more advanced version, this would account for specific feedback.
+        Targeted replanning: re-issue only the failed subgraph.
+        Tasks whose latest result is COMPLETED or ESC_HITL are kept. Every other task
+        (rejected, skipped or never run) and its dependents get a replacement with a
+        fresh id; references to kept tasks are preserved so their outputs are reused.
+        Tasks that failed on their own receive the Judge's feedback (or `feedback`)
+        as a `revision_feedback` param.
         """
-        return await self.create_plan(campaign)
+        latest = {str(res_entry["task_id"]): res_entry for res_entry in results}
+        approved = (TaskStatus.COMPLETED, TaskStatus.ESC_HITL)
+        failed = [
+            task.task_id
+            for task in plan
+            if latest.get(str(task.task_id), {}).get("status") not in approved
+        ]
+        rerun = TaskGraph(plan).downstream(failed)
+        new_ids = {task.task_id: uuid4() for task in plan if task.task_id in rerun}
+
+        replacements = []
+        for task in plan:
+            if task.task_id not in rerun:
+                continue
+            params = dict(task.params)
+            if not rerun.intersection(task.depends_on):
+                reason = latest.get(str(task.task_id), {}).get("feedback") or feedback
+                if reason:
+                    params["revision_feedback"] = reason
+            replacements.append(
+                task.model_copy(
+                    update={
+                        "task_id": new_ids[task.task_id],
+                        "params": params,
+                        "depends_on": [new_ids.get(dep, dep) for dep in task.depends_on],
+                        "param_refs": {
+                            name: ref.model_copy(
+                                update={"task_id": new_ids.get(ref.task_id, ref.task_id)}
+                            )
+                            for name, ref in task.param_refs.items()
+                        },
+                    }
+                )
+            )
+        return replacements
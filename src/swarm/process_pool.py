@@ -0,0 +1,127 @@
+import asyncio
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from skills.base import BaseSkill
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+
+# Per-process state of pool workers: one event loop and one instance per skill.
+_skill_instances: dict[str, BaseSkill] = {}
+_process_loop: asyncio.AbstractEventLoop | None = None
+
+
+def skill_class(import_path: str) -> type[BaseSkill]:
+    """Import the skill class named by 'package.module:ClassName'."""
+    module_name, _, class_name = import_path.partition(":")
+    if not class_name:
+        raise ValueError(f"Skill import path must look like 'module:Class', got {import_path!r}.")
+    skill_cls: type[BaseSkill] = getattr(importlib.import_module(module_name), class_name)
+    return skill_cls
+
+
+def load_skill(import_path: str) -> BaseSkill:
+    """Instantiate a skill from 'package.module:ClassName', caching it in this process."""
+    if import_path not in _skill_instances:
+        _skill_instances[import_path] = skill_class(import_path)()
+    return _skill_instances[import_path]
+
+
+def _warm_process(import_paths: tuple[str, ...]):
+    """Pool initializer: import and instantiate skills before the first task arrives."""
+    global _process_loop
+    _process_loop = asyncio.new_event_loop()
+    for import_path in import_paths:
+        load_skill(import_path)
+
+
+def _execute_in_process(import_path: str, payload: bytes) -> bytes:
+    """Run one serialized WorkerTaskInput and return the serialized WorkerTaskOutput."""
+    global _process_loop
+    if _process_loop is None:
+        _process_loop = asyncio.new_event_loop()
+    skill = load_skill(import_path)
+    task_input = WorkerTaskInput.model_validate_json(payload)
+    output = _process_loop.run_until_complete(skill.execute(task_input))
+    return output.model_dump_json().encode()
+
+
+class ProcessSkillPool:
+    """
+    Pool of warm worker processes for CPU-bound skills.
+    Skills are registered by import path and loaded once per process; tasks cross the
+    process boundary as compact JSON-serialized WorkerTaskInput/WorkerTaskOutput.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.import_paths: dict[str, str] = {}
+        self._executor: ProcessPoolExecutor | None = None
+
+    def register(self, skill_name: str, import_path: str):
+        if self._executor is not None:
+            raise RuntimeError("Register skills before the process pool is started.")
+        self.import_paths[skill_name] = import_path
+
+    def __contains__(self, skill_name: str) -> bool:
+        return skill_name in self.import_paths
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_warm_process,
+                initargs=(tuple(self.import_paths.values()),),
+            )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def health_check(self) -> bool:
+        """Round-trip a trivial call through the pool (a pool not yet started is healthy)."""
+        if self._executor is None:
+            return True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, os.getpid)
+        return True
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        """
+        Run a task in a pool process.
+        Cancelling the awaiting coroutine (e.g. on timeout) abandons the result, but a
+        call that has already started runs to completion in its process.
+        """
+        self.start()
+        import_path = self.import_paths[task_input.skill_name]
+        payload = task_input.model_dump_json().encode()
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor, _execute_in_process, import_path, payload
+        )
+        return WorkerTaskOutput.model_validate_json(result)
+
+
+class ProcessPoolSkill(BaseSkill):
+    """
+    Worker-side stand-in that forwards a registered skill to a ProcessSkillPool.
+    It takes the wrapped skill's class-level flags, so caching, coalescing, retries
+    and MCP admission treat it like the skill itself.
+    """
+
+    def __init__(self, skill_name: str, pool: ProcessSkillPool):
+        self._skill_name = skill_name
+        self.pool = pool
+        skill_cls = skill_class(pool.import_paths[skill_name])
+        self.requires_mcp = skill_cls.requires_mcp
+        self.cacheable = skill_cls.cacheable
+        self.idempotent = skill_cls.idempotent
+        self.version = skill_cls.version
+
+    @property
+    def name(self) -> str:
+        return self._skill_name
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return await self.pool.execute(task_input)
@@ -0,0 +1,335 @@
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.base import Worker
+
+
+def task_queue_key(campaign_id: UUID | str | None) -> str:
+    """Redis key of pending WorkerTaskInputs for a campaign (technical.md, section 3)."""
+    return f"task_queue:{campaign_id or 'default'}"
+
+
+def review_queue_key(campaign_id: UUID | str | None) -> str:
+    """Redis key of WorkerTaskOutputs awaiting Judge review (technical.md, section 3)."""
+    return f"review_queue:{campaign_id or 'default'}"
+
+
+def dead_letter_key(key: str) -> str:
+    """Key where messages of `key` that cannot be parsed are set aside for inspection."""
+    return f"{key}:dead"
+
+
+class QueueMessage(BaseModel):
+    message_id: str
+    payload: str
+
+
+class TaskQueue(ABC):
+    """
+    At-least-once work queue.
+    A pulled message is leased for `visibility_timeout` seconds; if it is not acked in
+    time (e.g. the consumer crashed), `requeue_expired` makes it visible again.
+    """
+
+    @abstractmethod
+    async def push(self, key: str, payload: str) -> str:
+        pass
+
+    @abstractmethod
+    async def pull(self, key: str, visibility_timeout: float = 30.0) -> QueueMessage | None:
+        """Lease the oldest message, or return None if the queue is empty."""
+        pass
+
+    @abstractmethod
+    async def ack(self, key: str, message: QueueMessage):
+        pass
+
+    @abstractmethod
+    async def requeue_expired(self, key: str) -> int:
+        """Return expired leases to the front of the queue; returns how many were requeued."""
+        pass
+
+    @abstractmethod
+    async def length(self, key: str) -> int:
+        pass
+
+
+class InMemoryTaskQueue(TaskQueue):
+    """Single-process backend for tests and local runs."""
+
+    def __init__(self):
+        self.queues: dict[str, deque[QueueMessage]] = {}
+        self.leases: dict[str, dict[str, tuple[float, QueueMessage]]] = {}
+
+    async def push(self, key: str, payload: str) -> str:
+        message = QueueMessage(message_id=str(uuid4()), payload=payload)
+        self.queues.setdefault(key, deque()).append(message)
+        return message.message_id
+
+    async def pull(self, key: str, visibility_timeout: float = 30.0) -> QueueMessage | None:
+        queue = self.queues.get(key)
+        if not queue:
+            return None
+        message = queue.popleft()
+        deadline = time.monotonic() + visibility_timeout
+        self.leases.setdefault(key, {})[message.message_id] = (deadline, message)
+        return message
+
+    async def ack(self, key: str, message: QueueMessage):
+        self.leases.get(key, {}).pop(message.message_id, None)
+
+    async def requeue_expired(self, key: str) -> int:
+        leases = self.leases.get(key, {})
+        now = time.monotonic()
+        expired = [msg_id for msg_id, (deadline, _) in leases.items() if deadline <= now]
+        for msg_id in expired:
+            _, message = leases.pop(msg_id)
+            self.queues.setdefault(key, deque()).appendleft(message)
+        return len(expired)
+
+    async def length(self, key: str) -> int:
+        return len(self.queues.get(key, ()))
+
+
+class RedisTaskQueue(TaskQueue):
+    """
+    Redis backend using the reliable-queue pattern.
+    - `{key}`: pending messages (LPUSH in, RPOPLPUSH out, so FIFO)
+    - `{key}:processing`: leased messages
+    - `{key}:leases`: sorted set of leased messages scored by lease deadline
+
+    Every move between these keys runs as one Lua script, so a consumer crashing
+    mid-call can never leave a message in `{key}:processing` without a lease.
+    """
+
+    # KEYS: queue, processing, leases; ARGV: lease deadline.
+    PULL_SCRIPT = """
+local raw = redis.call('RPOPLPUSH', KEYS[1], KEYS[2])
+if raw then
+    redis.call('ZADD', KEYS[3], ARGV[1], raw)
+end
+return raw
+"""
+    # KEYS: processing, leases; ARGV: message.
+    ACK_SCRIPT = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+return redis.call('ZREM', KEYS[2], ARGV[1])
+"""
+    # KEYS: leases, processing, queue; ARGV: message. Only the caller winning the
+    # ZREM requeues, so concurrent reapers don't duplicate.
+    REQUEUE_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 1 then
+    redis.call('LREM', KEYS[2], 1, ARGV[1])
+    redis.call('RPUSH', KEYS[3], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+    def __init__(self, client: Redis):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisTaskQueue":
+        return cls(Redis.from_url(url))
+
+    @staticmethod
+    def _decode(raw: bytes | str) -> str:
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    async def push(self, key: str, payload: str) -> str:
+        message_id = str(uuid4())
+        await self.client.lpush(key, json.dumps({"id": message_id, "payload": payload}))
+        return message_id
+
+    async def pull(self, key: str, visibility_timeout: float = 30.0) -> QueueMessage | None:
+        raw = await self.client.eval(
+            self.PULL_SCRIPT,
+            3,
+            key,
+            f"{key}:processing",
+            f"{key}:leases",
+            time.time() + visibility_timeout,
+        )
+        if raw is None:
+            return None
+        envelope = json.loads(self._decode(raw))
+        return QueueMessage(message_id=envelope["id"], payload=envelope["payload"])
+
+    async def ack(self, key: str, message: QueueMessage):
+        raw = json.dumps({"id": message.message_id, "payload": message.payload})
+        await self.client.eval(self.ACK_SCRIPT, 2, f"{key}:processing", f"{key}:leases", raw)
+
+    async def requeue_expired(self, key: str) -> int:
+        expired = await self.client.zrangebyscore(f"{key}:leases", "-inf", time.time())
+        requeued = 0
+        for raw in expired:
+            if not isinstance(raw, bytes | str):
+                continue  # Tuples only come back with scores, which aren't requested.
+            requeued += await self.client.eval(
+                self.REQUEUE_SCRIPT,
+                3,
+                f"{key}:leases",
+                f"{key}:processing",
+                key,
+                self._decode(raw),
+            )
+        return requeued
+
+    async def length(self, key: str) -> int:
+        return await self.client.llen(key)
+
+
+class QueueConsumer:
+    """
+    Worker-node loop: pulls tasks from `task_queue:{campaign_id}`, runs them on a
+    local Worker and pushes outputs to `review_queue:{campaign_id}` before acking.
+    Many QueueConsumers on many nodes can serve the same queues; the orchestrator
+    side dispatches to them through a QueuedWorker. Task payloads that cannot be
+    parsed are moved to the dead-letter queue.
+    """
+
+    def __init__(
+        self,
+        worker: Worker,
+        queue: TaskQueue,
+        campaign_ids: list[UUID | str] | None = None,
+        visibility_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        self.worker = worker
+        self.queue = queue
+        self.campaign_ids: list[UUID | str] = list(campaign_ids or [])
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+
+    def watch(self, campaign_id: UUID | str):
+        if campaign_id not in self.campaign_ids:
+            self.campaign_ids.append(campaign_id)
+
+    async def run_once(self) -> int:
+        """Process at most one task per watched campaign; returns how many were processed."""
+        processed = 0
+        for campaign_id in list(self.campaign_ids):
+            key = task_queue_key(campaign_id)
+            await self.queue.requeue_expired(key)
+            message = await self.queue.pull(key, self.visibility_timeout)
+            if message is None:
+                continue
+            try:
+                task_input = WorkerTaskInput.model_validate_json(message.payload)
+            except ValueError as e:
+                # Requeuing it would only crash the next consumer that pulls it.
+                logging.error(f"Dead-lettering unreadable task on {key}: {str(e)}")
+                await self.queue.push(dead_letter_key(key), message.payload)
+                await self.queue.ack(key, message)
+                continue
+            output = await self.worker.perform_task(task_input)
+            await self.queue.push(review_queue_key(campaign_id), output.model_dump_json())
+            await self.queue.ack(key, message)
+            processed += 1
+        return processed
+
+    async def serve(self, stop: asyncio.Event):
+        while not stop.is_set():
+            if not await self.run_once():
+                await asyncio.sleep(self.poll_interval)
+
+
+class QueuedWorker(Worker):
+    """
+    Orchestrator-side Worker that dispatches through the task queue instead of
+    running skills in-process. Outputs are collected from the review queue and
+    matched back to the awaiting `perform_task` call by task id.
+
+    Review payloads that cannot be parsed are moved to the dead-letter queue. If
+    collecting fails (e.g. the queue backend is down), the campaign's pending tasks
+    fail instead of waiting out `result_timeout`.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue,
+        name: str = "QueuedWorker",
+        visibility_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        result_timeout: float | None = 300.0,
+    ):
+        super().__init__(name)
+        self.queue = queue
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.result_timeout = result_timeout
+        self._waiters: dict[UUID, tuple[str, asyncio.Future]] = {}
+        self._collectors: dict[str, asyncio.Task] = {}
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        campaign_key = str(task_input.campaign_id or "default")
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[task_input.task_id] = (campaign_key, future)
+        try:
+            await self.queue.push(task_queue_key(campaign_key), task_input.model_dump_json())
+            collector = self._collectors.get(campaign_key)
+            if collector is None or collector.done():
+                self._collectors[campaign_key] = asyncio.create_task(
+                    self._collect_reviews(campaign_key)
+                )
+            return await asyncio.wait_for(future, self.result_timeout)
+        except TimeoutError:
+            return self._failure(
+                task_input, f"No worker returned a result within {self.result_timeout}s."
+            )
+        except Exception as e:
+            return self._failure(task_input, f"Dispatch through the task queue failed: {str(e)}")
+        finally:
+            self._waiters.pop(task_input.task_id, None)
+
+    async def _collect_reviews(self, campaign_key: str):
+        try:
+            await self._collect_review_messages(campaign_key)
+        except Exception as e:
+            logging.error(f"Review collector for campaign {campaign_key} failed: {str(e)}")
+            for waiting_key, future in list(self._waiters.values()):
+                if waiting_key == campaign_key and not future.done():
+                    future.set_exception(e)
+
+    async def _collect_review_messages(self, campaign_key: str):
+        key = review_queue_key(campaign_key)
+        while any(waiting_key == campaign_key for waiting_key, _ in self._waiters.values()):
+            await self.queue.requeue_expired(key)
+            message = await self.queue.pull(key, self.visibility_timeout)
+            if message is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                output = WorkerTaskOutput.model_validate_json(message.payload)
+            except ValueError as e:
+                logging.error(f"Dead-lettering unreadable review output on {key}: {str(e)}")
+                await self.queue.push(dead_letter_key(key), message.payload)
+                await self.queue.ack(key, message)
+                continue
+            waiter = self._waiters.get(output.task_id)
+            if waiter is None:
+                logging.warning(f"Dropping review output for unknown task {output.task_id}.")
+            elif not waiter[1].done():
+                waiter[1].set_result(output)
+            await self.queue.ack(key, message)
+
+    @staticmethod
+    def _failure(task_input: WorkerTaskInput, reasoning: str) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=task_input.skill_name,
+            result=None,
+            confidence_score=0.0,
+            reasoning=reasoning,
+        )
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class HedgePolicy(BaseModel):
+    """
+    When to fire a backup attempt for a slow skill call.
+    A hedge is sent once the first attempt has run longer than the given latency
+    percentile of recent successful calls for that skill. Tasks the skill does not
+    report as safe to repeat (`BaseSkill.can_coalesce`) are never hedged.
+    """
+
+    percentile: float = Field(default=0.95, gt=0.0, lt=1.0)
+    min_samples: int = 20
+    skills: set[str] | None = None  # None = hedge every skill
+
+    def applies_to(self, skill_name: str) -> bool:
+        return self.skills is None or skill_name in self.skills
+
+
+class LatencyTracker:
+    """Rolling window of recent latencies (seconds) per key, e.g. per skill name."""
+
+    def __init__(self, window: int = 256):
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, key: str, seconds: float):
+        self._samples[key].append(seconds)
+
+    def count(self, key: str) -> int:
+        return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """Nearest-rank percentile, or None when nothing has been recorded."""
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[rank - 1]
+
+
+class RetryPolicy(BaseModel):
+    """
+    Exponential backoff for transient failures (Level 1 Auto-Retry in functional.md).
+    Only exceptions listed in `retry_on` are retried; anything else fails immediately.
+    An attempt running longer than `attempt_timeout` is abandoned with a TimeoutError,
+    so a hung dependency counts against its circuit breaker and is retried.
+    """
+
+    max_attempts: int = Field(default=4, ge=1)  # 1 call + 3 retries
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    jitter: bool = True
+    attempt_timeout: float | None = None
+    retry_on: tuple[type[Exception], ...] = (TimeoutError, ConnectionError)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based), using full jitter."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0.0, ceiling) if self.jitter else ceiling
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency is down.
+    Opens after `failure_threshold` consecutive failures, then after `reset_timeout`
+    lets a single probe call through (HALF_OPEN); its outcome closes or re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self):
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"Circuit '{self.name}' is open; failing fast.")
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"Circuit '{self.name}' is probing; failing fast.")
+            self._probe_in_flight = True
+
+    def record_success(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logging.warning(f"Circuit '{self.name}' opened after {self.failures} failures.")
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self):
+        """Abandon a call without an outcome (e.g. non-transient error or cancellation)."""
+        self._probe_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per key (e.g. 'skill:<name>' or 'mcp:<tool>'), sharing a config."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(key, self.failure_threshold, self.reset_timeout)
+        return self.breakers[key]
+
+
+async def call_with_retry(
+    operation: Callable[[], Awaitable[Any]],
+    policy: RetryPolicy | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> Any:
+    """
+    Run `operation` under an optional retry policy and circuit breaker.
+    Transient errors count against the breaker and are retried with backoff;
+    other errors propagate immediately. CircuitOpenError is never retried.
+    """
+    policy = policy or RetryPolicy(max_attempts=1)
+    attempt = 1
+    while True:
+        if breaker:
+            breaker.before_call()
+        try:
+            result = await asyncio.wait_for(operation(), policy.attempt_timeout)
+        except policy.retry_on:
+            if breaker:
+                breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt)
+            logging.warning(f"Transient failure (attempt {attempt}); retrying in {delay:.2f}s.")
+            attempt += 1
+            await asyncio.sleep(delay)
+        except BaseException:
+            if breaker:
+                breaker.release()
+            raise
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import heapq
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from skills.base import BaseSkill
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.files import write_atomic
+
+
+def result_key(skill: BaseSkill, task_input: WorkerTaskInput) -> str:
+    """Canonical hash of what determines a cacheable skill's output."""
+    payload = json.dumps(
+        {
+            "skill": skill.name,
+            "version": skill.version,
+            "params": task_input.params,
+            "persona_id": task_input.persona_id,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache of skill outputs for skills that declare themselves `cacheable`.
+
+    Entries are keyed by `result_key` and expire after the skill's TTL
+    (`skill_ttls`, else `default_ttl`; a TTL of 0 disables caching for that skill).
+    The in-memory tier is an LRU bounded by `max_entries`. With a `directory`,
+    entries are also written there as `<key>.json`, so Workers in other processes
+    sharing the directory can reuse them. Expired files are deleted when read. The
+    number of files is counted once and then tracked as entries are written; when it
+    passes `max_disk_entries` the directory is rescanned and the oldest files are
+    deleted down to 90% of the bound, so the scan runs only once per batch of writes.
+
+    Only outputs with a non-zero confidence are stored; failures are always recomputed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 300.0,
+        skill_ttls: dict[str, float] | None = None,
+        directory: str | None = None,
+        max_disk_entries: int = 4096,
+    ):
+        if max_entries < 1 or max_disk_entries < 1:
+            raise ValueError("max_entries and max_disk_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.default_ttl = default_ttl
+        self.skill_ttls = skill_ttls or {}
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: OrderedDict[str, tuple[float, WorkerTaskOutput]] = OrderedDict()
+        # Entry files on disk as of the last scan plus our writes since; None until scanned.
+        self._disk_entries: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, skill_name: str) -> float:
+        return self.skill_ttls.get(skill_name, self.default_ttl)
+
+    def applies_to(self, skill: BaseSkill) -> bool:
+        return skill.cacheable and self.ttl_for(skill.name) > 0
+
+    async def get(self, skill: BaseSkill, task_input: WorkerTaskInput) -> WorkerTaskOutput | None:
+        """The cached output re-addressed to `task_input`, or None on a miss."""
+        key = result_key(skill, task_input)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del self._entries[key]
+            entry = None
+        if entry is None and self.directory:
+            entry = await asyncio.to_thread(self._read, self._path(self.directory, key))
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1].model_copy(update={"task_id": task_input.task_id}, deep=True)
+
+    async def put(self, skill: BaseSkill, task_input: WorkerTaskInput, output: WorkerTaskOutput):
+        if output.confidence_score <= 0.0:
+            return
+        key = result_key(skill, task_input)
+        # The caller keeps `output`; store a copy so its later edits can't leak into hits.
+        entry = (time.time() + self.ttl_for(skill.name), output.model_copy(deep=True))
+        self._remember(key, entry)
+        directory = self.directory
+        if directory:
+            payload = json.dumps({"expires_at": entry[0], "output": output.model_dump(mode="json")})
+            try:
+                await asyncio.to_thread(write_atomic, self._path(directory, key), payload)
+            except OSError as e:
+                logging.warning(f"Could not persist cache entry {key}: {str(e)}")
+                return
+            if self._disk_entries is not None and self._disk_entries < self.max_disk_entries:
+                self._disk_entries += 1
+            else:
+                self._disk_entries = await asyncio.to_thread(self._prune, directory)
+
+    def _remember(self, key: str, entry: tuple[float, WorkerTaskOutput]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _path(directory: str, key: str) -> str:
+        return os.path.join(directory, f"{key}.json")
+
+    @staticmethod
+    def _read(path: str) -> tuple[float, WorkerTaskOutput] | None:
+        try:
+            with open(path) as f:
+                raw = json.load(f)
+            expires_at = raw["expires_at"]
+            if expires_at <= time.time():
+                ResultCache._remove(path)
+                return None
+            return expires_at, WorkerTaskOutput.model_validate(raw["output"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+
+    def _prune(self, directory: str) -> int | None:
+        """
+        Count the entry files and, if there are more than `max_disk_entries`, delete the
+        least recently written down to 90% of it. Returns the files left, or None if the
+        directory could not be scanned.
+        """
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        try:
+                            files.append((entry.stat().st_mtime, entry.path))
+                        except FileNotFoundError:
+                            pass  # Pruned concurrently by another process.
+        except OSError as e:
+            logging.warning(f"Could not prune cache directory {directory}: {str(e)}")
+            return None
+        if len(files) <= self.max_disk_entries:
+            return len(files)
+        keep = self.max_disk_entries - self.max_disk_entries // 10
+        for _, path in heapq.nsmallest(len(files) - keep, files):
+            self._remove(path)
+        return keep
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not delete cache entry {path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Any
+
+from src.models.schemas import Campaign
+from src.swarm.limiter import FairShareLimiter
+from src.swarm.orchestrator import ChimeraOrchestrator
+
+
+class CampaignScheduler:
+    """
+    Runs many campaigns through one Orchestrator.
+    Every campaign's task dispatch goes through a shared FairShareLimiter, which caps
+    global in-flight work and interleaves campaigns by weight and (aged) priority.
+    """
+
+    def __init__(
+        self,
+        orchestrator: ChimeraOrchestrator,
+        max_in_flight: int = 8,
+        aging_rate: float = 1.0,
+    ):
+        self.orchestrator = orchestrator
+        self.limiter = FairShareLimiter(max_in_flight=max_in_flight, aging_rate=aging_rate)
+        self.pending: list[Campaign] = []
+        self.errors: dict[str, BaseException] = {}
+
+    def submit(self, campaign: Campaign, weight: float = 1.0, priority: int = 0):
+        """Queue a campaign for the next `run`. Higher weight = larger share of slots."""
+        self.limiter.register(str(campaign.id), weight=weight, priority=priority)
+        self.pending.append(campaign)
+
+    async def run(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Drive every submitted campaign to completion.
+        Returns results keyed by campaign id; campaigns that raised are recorded in `errors`.
+        """
+        campaigns, self.pending = self.pending, []
+        outcomes = await asyncio.gather(
+            *(self._run_one(campaign) for campaign in campaigns), return_exceptions=True
+        )
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        for campaign, outcome in zip(campaigns, outcomes, strict=True):
+            campaign_id = str(campaign.id)
+            if isinstance(outcome, BaseException):
+                logging.error(f"Campaign {campaign.title} ({campaign_id}) aborted: {outcome}")
+                self.errors[campaign_id] = outcome
+            else:
+                results[campaign_id] = outcome
+        return results
+
+    async def _run_one(self, campaign: Campaign) -> list[dict[str, Any]]:
+        try:
+            results: list[dict[str, Any]] = await self.orchestrator.run_swarm(
+                campaign, limiter=self.limiter
+            )
+            return results
+        finally:
+            self.limiter.unregister(str(campaign.id))
@@ -1,7 +1,11 @@
+import asyncio
+import json
+import os
 from abc import ABC, abstractmethod
 from typing import Any
 
-from src.models.schemas import Campaign
+from src.models.schemas import Campaign, WorkerTaskInput
+from src.swarm.files import write_atomic
 
 
 class StateManager(ABC):
@@ -19,6 +23,19 @@ class StateManager(ABC):
     async def get_campaign_status(self, campaign_id: str) -> Campaign | None:
         pass
 
+    @abstractmethod
+    async def save_plan(self, campaign_id: str, plan: list[WorkerTaskInput]):
+        pass
+
+    @abstractmethod
+    async def get_plan(self, campaign_id: str) -> list[WorkerTaskInput] | None:
+        pass
+
+    @abstractmethod
+    async def get_task_results(self, campaign_id: str) -> list[dict[str, Any]]:
+        """Return persisted task results in the order they were saved."""
+        pass
+
 
 class InMemoryStateManager(StateManager):
     """
@@ -32,6 +49,7 @@ class InMemoryStateManager(StateManager):
 
     def __init__(self):
         self.campaigns: dict[str, Campaign] = {}
+        self.plans: dict[str, list[WorkerTaskInput]] = {}
         self.results: dict[str, list[dict[str, Any]]] = {}
 
     async def save_campaign(self, campaign: Campaign):
@@ -45,3 +63,76 @@ class InMemoryStateManager(StateManager):
 
     async def get_campaign_status(self, campaign_id: str) -> Campaign | None:
         return self.campaigns.get(campaign_id)
+
+    async def save_plan(self, campaign_id: str, plan: list[WorkerTaskInput]):
+        self.plans[campaign_id] = list(plan)
+
+    async def get_plan(self, campaign_id: str) -> list[WorkerTaskInput] | None:
+        return self.plans.get(campaign_id)
+
+    async def get_task_results(self, campaign_id: str) -> list[dict[str, Any]]:
+        return list(self.results.get(campaign_id, []))
+
+
+class FileStateManager(StateManager):
+    """
+    Durable, file-backed implementation so campaigns can be resumed after a restart.
+
+    Layout under `root_dir`, per campaign:
+    - `{campaign_id}.campaign.json`: the Campaign record
+    - `{campaign_id}.plan.json`: the persisted plan
+    - `{campaign_id}.results.jsonl`: one task result per line, appended as tasks finish
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, campaign_id: str, suffix: str) -> str:
+        return os.path.join(self.root_dir, f"{campaign_id}.{suffix}")
+
+    @staticmethod
+    def _append_line(path: str, line: str):
+        with open(path, "a") as f:
+            f.write(line + "\n")
+
+    @staticmethod
+    def _read_text(path: str) -> str | None:
+        try:
+            with open(path) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    async def save_campaign(self, campaign: Campaign):
+        await asyncio.to_thread(
+            write_atomic,
+            self._path(str(campaign.id), "campaign.json"),
+            campaign.model_dump_json(),
+        )
+
+    async def save_task_result(self, campaign_id: str, result: dict[str, Any]):
+        line = json.dumps(result, default=str)
+        await asyncio.to_thread(self._append_line, self._path(campaign_id, "results.jsonl"), line)
+
+    async def get_campaign_status(self, campaign_id: str) -> Campaign | None:
+        raw = await asyncio.to_thread(self._read_text, self._path(campaign_id, "campaign.json"))
+        if raw is None:
+            return None
+        return Campaign.model_validate_json(raw)
+
+    async def save_plan(self, campaign_id: str, plan: list[WorkerTaskInput]):
+        payload = json.dumps([task.model_dump(mode="json") for task in plan])
+        await asyncio.to_thread(write_atomic, self._path(campaign_id, "plan.json"), payload)
+
+    async def get_plan(self, campaign_id: str) -> list[WorkerTaskInput] | None:
+        raw = await asyncio.to_thread(self._read_text, self._path(campaign_id, "plan.json"))
+        if raw is None:
+            return None
+        return [WorkerTaskInput.model_validate(task) for task in json.loads(raw)]
+
+    async def get_task_results(self, campaign_id: str) -> list[dict[str, Any]]:
+        raw = await asyncio.to_thread(self._read_text, self._path(campaign_id, "results.jsonl"))
+        if raw is None:
+            return []
+        return [json.loads(line) for line in raw.splitlines() if line.strip()]
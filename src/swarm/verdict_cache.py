@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+
+from src.models.schemas import JudgeValidationOutput
+from src.swarm.files import write_atomic
+
+CACHED_MARKER = "[cached]"
+
+
+def verdict_key(content: str, persona_id: str, persona_version: str, context: str = "") -> str:
+    """
+    Cache key of a verdict on `content` for one version of a persona. `context`
+    carries whatever else the verdict depends on (worker confidence, Judge settings).
+    """
+    digest = hashlib.sha256()
+    for part in (persona_id, persona_version, context, content):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class VerdictCache:
+    """
+    LRU cache of Judge verdicts, bounded by `max_entries`.
+
+    Verdicts are returned with CACHED_MARKER prefixed to their feedback, so an
+    audit can tell them from fresh ones. With a `path`, entries are loaded on
+    construction and written back by `save()`.
+    """
+
+    def __init__(self, max_entries: int = 4096, path: str | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.path = path
+        self._verdicts: OrderedDict[str, JudgeValidationOutput] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path: str):
+        try:
+            with open(path) as f:
+                raw = json.load(f)
+            for key, verdict in raw.items():
+                self.put(key, JudgeValidationOutput.model_validate(verdict))
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable verdict cache at {path}: {str(e)}")
+
+    async def save(self):
+        if not self.path:
+            return
+        payload = json.dumps(
+            {key: verdict.model_dump(mode="json") for key, verdict in self._verdicts.items()}
+        )
+        await asyncio.to_thread(write_atomic, self.path, payload)
+
+    def get(self, key: str) -> JudgeValidationOutput | None:
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            self.misses += 1
+            return None
+        self._verdicts.move_to_end(key)
+        self.hits += 1
+        feedback = f"{CACHED_MARKER} {verdict.feedback}" if verdict.feedback else CACHED_MARKER
+        return verdict.model_copy(update={"feedback": feedback})
+
+    def put(self, key: str, verdict: JudgeValidationOutput):
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.max_entries:
+            self._verdicts.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
@@ -1,53 +1,361 @@
+import asyncio
 import logging
+from functools import partial
+from typing import TYPE_CHECKING
 
-from skills.base import BaseSkill
-from src.mcp.client import ChimeraMCPClient
+from skills.base import BaseSkill, StreamingSkill
+from skills.registry import SkillRegistry
 from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
 from src.swarm.base import Worker
+from src.swarm.batching import BatchPolicy, TaskBatcher
+from src.swarm.process_pool import ProcessPoolSkill, ProcessSkillPool
+from src.swarm.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+    call_with_retry,
+)
+from src.swarm.result_cache import ResultCache, result_key
+
+if TYPE_CHECKING:
+    # Importing the MCP SDK dominates cold start; Workers only need it when given a client.
+    from src.mcp.client import ChimeraMCPClient
+    from src.swarm.judge import ChimeraJudge
+
+
+class _SharedRun:
+    """One coalesced execution and how many callers are still waiting for it."""
+
+    def __init__(self, run: "asyncio.Future[WorkerTaskOutput]"):
+        self.run = run
+        self.waiters = 0
+        self.timed_out = False
 
 
 class ChimeraWorker(Worker):
     """
     Chimera Implementation of the Worker agent.
     Executes tasks by dynamically loading the required skill or calling MCP tools.
+
+    Every skill call is bounded by a deadline: the task's own `timeout_s`, the
+    per-skill entry in `skill_timeouts`, or `default_timeout` (the tightest wins).
+    With a `hedge_policy`, a backup attempt is fired when the first one runs past
+    the skill's recent latency percentile, and whichever finishes first is used.
+    Only tasks safe to run twice (`BaseSkill.can_coalesce`) are hedged, so a
+    side-effecting call such as 'post_content' is never duplicated.
+
+    Transient skill errors are retried per `retry_policy`, and a per-skill circuit
+    breaker (`breakers`, keyed 'skill:<name>') fails tasks fast while a skill keeps failing.
+    A missed deadline counts as a failure of the skill; set the policy's
+    `attempt_timeout` to also retry attempts that hang.
+
+    CPU-bound skills can be registered with `register_process_skill` to run in a
+    pool of warm worker processes instead of on the orchestrator's event loop.
+
+    Skills not registered explicitly are looked up in `registry` (a SkillRegistry)
+    and imported on first use.
+
+    With a `batch_policy`, tasks for the same skill that arrive together are
+    grouped and run through the skill's `execute_batch` (see TaskBatcher); deadlines,
+    retries and breakers still apply per task. Batched calls are never hedged.
+
+    With a `result_cache`, outputs of skills declaring `cacheable` are reused for
+    tasks with the same params and persona (see ResultCache).
+
+    With `coalesce`, identical tasks (same skill, params and persona) arriving while
+    one is already running wait for that run instead of executing again, and get its
+    output under their own task_id. Each caller keeps its own deadline, and the shared
+    run is cancelled once every caller has given up. Only tasks the skill reports as
+    safe to share (`BaseSkill.can_coalesce`) are coalesced.
+
+    With a `stream_judge`, StreamingSkills are run chunk by chunk under the Judge's
+    `screen()`: generation stops at the first safety breach or forbidden term and
+    the task fails without its content being finished. Screened skills are never
+    batched, even when the `batch_policy` covers them.
     """
 
-    def __init__(self, name: str = "ChimeraWorker", mcp_client: ChimeraMCPClient | None = None):
+    def __init__(
+        self,
+        name: str = "ChimeraWorker",
+        mcp_client: "ChimeraMCPClient | None" = None,
+        default_timeout: float | None = None,
+        skill_timeouts: dict[str, float] | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breakers: CircuitBreakerRegistry | None = None,
+        process_pool: ProcessSkillPool | None = None,
+        registry: SkillRegistry | None = None,
+        batch_policy: BatchPolicy | None = None,
+        result_cache: ResultCache | None = None,
+        coalesce: bool = False,
+        stream_judge: "ChimeraJudge | None" = None,
+    ):
         super().__init__(name)
         self.skills: dict[str, BaseSkill] = {}
         self.mcp_client = mcp_client
+        self.default_timeout = default_timeout
+        self.skill_timeouts = skill_timeouts or {}
+        self.hedge_policy = hedge_policy
+        self.latencies = LatencyTracker()
+        self.retry_policy = retry_policy
+        self.breakers = breakers
+        self.process_pool = process_pool
+        self.registry = registry
+        self.batch_policy = batch_policy
+        self.batcher = TaskBatcher(batch_policy, self._execute_batch) if batch_policy else None
+        self.result_cache = result_cache
+        self.coalesce = coalesce
+        self._in_flight: dict[str, _SharedRun] = {}
+        self.coalesced = 0
+        self.stream_judge = stream_judge
 
     def register_skill(self, skill: BaseSkill):
         """Manually register a skill instance."""
         self.skills[skill.name] = skill
 
+    def register_process_skill(self, skill_name: str, import_path: str):
+        """Run a skill ('package.module:ClassName') in the Worker's process pool."""
+        if self.process_pool is None:
+            self.process_pool = ProcessSkillPool()
+        self.process_pool.register(skill_name, import_path)
+        self.skills[skill_name] = ProcessPoolSkill(skill_name, self.process_pool)
+
+    def resolve_skill(self, skill_name: str) -> BaseSkill | None:
+        """A registered skill, else one loaded (and cached) from the registry."""
+        skill = self.skills.get(skill_name)
+        if skill is None and self.registry is not None:
+            skill = self.registry.get(skill_name)
+            if skill is not None:
+                self.skills[skill_name] = skill
+        return skill
+
+    async def health_check(self) -> bool:
+        if self.process_pool is not None:
+            return await self.process_pool.health_check()
+        return True
+
     async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
         """
         Execute a task using the registered skills.
-        If the skill is not registered, it attempts to load it (in a real system).
+        If the skill is not registered, it is loaded from the skill registry.
         """
         skill_name = task_input.skill_name
 
-        if skill_name not in self.skills:
-            # Simple dynamic loading logic or error
-            return WorkerTaskOutput(
-                task_id=task_input.task_id,
-                skill_name=skill_name,
-                result=None,
-                confidence_score=0.0,
-                reasoning=f"Skill '{skill_name}' not found or not registered on Worker {self.name}.",
+        try:
+            skill = self.resolve_skill(skill_name)
+        except Exception as e:
+            logging.error(f"Failed to load skill {skill_name}: {str(e)}")
+            return self._failure(task_input, f"Failed to load skill {skill_name}: {str(e)}")
+        if skill is None:
+            return self._failure(
+                task_input,
+                f"Skill '{skill_name}' not found or not registered on Worker {self.name}.",
             )
 
+        cache = self.result_cache
+        if cache is not None and cache.applies_to(skill):
+            cached = await cache.get(skill, task_input)
+            if cached is not None:
+                logging.debug(f"Serving {skill_name} ({task_input.task_id}) from the result cache.")
+                return cached
+        else:
+            cache = None
+
+        timeout = self._timeout_for(task_input)
+        if self.coalesce and skill.can_coalesce(task_input):
+            return await self._run_coalesced(skill, task_input, cache, timeout)
+        return await self._run(skill, task_input, cache, timeout)
+
+    async def _run_coalesced(
+        self,
+        skill: BaseSkill,
+        task_input: WorkerTaskInput,
+        cache: ResultCache | None,
+        timeout: float | None,
+    ) -> WorkerTaskOutput:
+        """Share one run between identical tasks in flight at the same time."""
+        key = result_key(skill, task_input)
+        entry = self._in_flight.get(key)
+        if entry is None:
+            # A separate task without a deadline of its own: every caller (the first
+            # included) waits on it under its own deadline.
+            shared = asyncio.ensure_future(self._run(skill, task_input, cache, None))
+            entry = self._in_flight[key] = _SharedRun(shared)
+            shared.add_done_callback(lambda _: self._forget_shared(key, entry))
+        else:
+            self.coalesced += 1
+            logging.debug(f"Coalescing {skill.name} ({task_input.task_id}) with an in-flight task.")
+
+        entry.waiters += 1
         try:
-            skill = self.skills[skill_name]
-            output = await skill.execute(task_input)
+            output = await asyncio.wait_for(asyncio.shield(entry.run), timeout)
+        except TimeoutError:
+            entry.timed_out = True
+            logging.error(f"Skill {skill.name} timed out after {timeout}s ({task_input.task_id}).")
+            return self._failure(task_input, f"Timed out in skill {skill.name} after {timeout}s.")
+        finally:
+            entry.waiters -= 1
+            if not entry.waiters and not entry.run.done():
+                # Nobody is waiting any more; later identical tasks start afresh.
+                self._forget_shared(key, entry)
+                entry.run.cancel()
+                breaker = self._breaker_for(skill)
+                if breaker is not None and entry.timed_out:
+                    # One failure per abandoned run, as `_run` records for a missed deadline.
+                    breaker.record_failure()
+        if output.task_id == task_input.task_id:
+            return output
+        return output.model_copy(update={"task_id": task_input.task_id}, deep=True)
+
+    def _breaker_for(self, skill: BaseSkill) -> CircuitBreaker | None:
+        return self.breakers.get(f"skill:{skill.name}") if self.breakers else None
+
+    def _forget_shared(self, key: str, entry: _SharedRun):
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
+
+    async def _run(
+        self,
+        skill: BaseSkill,
+        task_input: WorkerTaskInput,
+        cache: ResultCache | None,
+        timeout: float | None,
+    ) -> WorkerTaskOutput:
+        skill_name = skill.name
+        batcher = self.batcher
+        if (
+            batcher is not None
+            and batcher.policy.applies_to(skill_name)
+            and not self._screens(skill)
+        ):
+            operation = partial(batcher.submit, skill, task_input)
+        else:
+            operation = partial(self._execute, skill, task_input)
+        breaker = self._breaker_for(skill)
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                output: WorkerTaskOutput = await call_with_retry(
+                    operation, self.retry_policy, breaker
+                )
+            if cache is not None:
+                await cache.put(skill, task_input, output)
             return output
+        except CircuitOpenError as e:
+            return self._failure(task_input, str(e))
+        except TimeoutError:
+            if breaker is not None and deadline.expired():
+                # The cancelled call was released without an outcome; a skill that
+                # keeps missing deadlines must still trip its breaker.
+                breaker.record_failure()
+            logging.error(f"Skill {skill_name} timed out after {timeout}s ({task_input.task_id}).")
+            return self._failure(task_input, f"Timed out in skill {skill_name} after {timeout}s.")
         except Exception as e:
             logging.error(f"Error executing skill {skill_name}: {str(e)}")
-            return WorkerTaskOutput(
-                task_id=task_input.task_id,
-                skill_name=skill_name,
-                result=None,
-                confidence_score=0.0,
-                reasoning=f"Execution error in skill {skill_name}: {str(e)}",
-            )
+            return self._failure(task_input, f"Execution error in skill {skill_name}: {str(e)}")
+
+    def _timeout_for(self, task_input: WorkerTaskInput) -> float | None:
+        candidates = [
+            task_input.timeout_s,
+            self.skill_timeouts.get(task_input.skill_name, self.default_timeout),
+        ]
+        deadlines = [c for c in candidates if c is not None]
+        return min(deadlines) if deadlines else None
+
+    def _hedge_delay(self, skill: BaseSkill, task_input: WorkerTaskInput) -> float | None:
+        policy = self.hedge_policy
+        if policy is None or not policy.applies_to(skill.name):
+            return None
+        # Cancelling the losing attempt cannot undo its side effects.
+        if not skill.can_coalesce(task_input):
+            return None
+        if self.latencies.count(skill.name) < policy.min_samples:
+            return None
+        return self.latencies.percentile(skill.name, policy.percentile)
+
+    async def _execute(self, skill: BaseSkill, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        hedge_after = self._hedge_delay(skill, task_input)
+        if self.stream_judge is not None and isinstance(skill, StreamingSkill):
+            output = await self._execute_screened(skill, task_input, self.stream_judge)
+        elif hedge_after is None:
+            output = await skill.execute(task_input)
+        else:
+            output = await self._execute_hedged(skill, task_input, hedge_after)
+        self.latencies.record(skill.name, loop.time() - started)
+        return output
+
+    def _screens(self, skill: BaseSkill) -> bool:
+        """Whether the skill's output is screened by the stream Judge while generated."""
+        return self.stream_judge is not None and isinstance(skill, StreamingSkill)
+
+    async def _execute_screened(
+        self, skill: StreamingSkill, task_input: WorkerTaskInput, judge: "ChimeraJudge"
+    ) -> WorkerTaskOutput:
+        """Stream the skill's content through the Judge, stopping at the first breach."""
+        screen = judge.screen()
+        stream = skill.stream(task_input)
+        try:
+            async for chunk in stream:
+                if screen.feed(chunk) is not None:
+                    break
+        finally:
+            # Closing an async generator stops generation right where it is.
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+        breach = screen.close()
+        if breach is not None:
+            logging.warning(f"Aborted {skill.name} ({task_input.task_id}) mid-stream: {breach}.")
+            return self._failure(task_input, f"Generation aborted by {judge.name}: {breach}.")
+        return skill.finalize(task_input, screen.content)
+
+    async def _execute_batch(
+        self, skill: BaseSkill, task_inputs: list[WorkerTaskInput]
+    ) -> list[WorkerTaskOutput]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        outputs = await skill.execute_batch(task_inputs)
+        # Every task in the batch waited for the whole call.
+        elapsed = loop.time() - started
+        for _ in task_inputs:
+            self.latencies.record(skill.name, elapsed)
+        return outputs
+
+    async def _execute_hedged(
+        self, skill: BaseSkill, task_input: WorkerTaskInput, hedge_after: float
+    ) -> WorkerTaskOutput:
+        """Race the primary attempt against a backup fired after `hedge_after` seconds."""
+        attempts = {asyncio.create_task(skill.execute(task_input))}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedge_after)
+            if not done:
+                logging.info(
+                    f"Hedging {skill.name} ({task_input.task_id}) after {hedge_after:.3f}s."
+                )
+                attempts.add(asyncio.create_task(skill.execute(task_input)))
+
+            while True:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                if not attempts:
+                    # Every attempt failed: re-raise the last error.
+                    return done.pop().result()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def _failure(self, task_input: WorkerTaskInput, reasoning: str) -> WorkerTaskOutput:
+        """Standard confidence-0.0 output for tasks the Worker could not complete."""
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=task_input.skill_name,
+            result=None,
+            confidence_score=0.0,
+            reasoning=reasoning,
+        )
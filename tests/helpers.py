@@ -0,0 +1,121 @@
+"""Helpers shared by tests that build tasks, workers and orchestrators."""
+
+import asyncio
+from collections import Counter
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_mcp_bridger import SkillMCPBridger
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.base import Judge, Planner, Worker
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager, StateManager
+from src.swarm.worker import ChimeraWorker
+
+
+def make_task(
+    skill_name: str,
+    depends_on=None,
+    persona_id: str = "p1",
+    timeout_s: float | None = None,
+    **params,
+) -> WorkerTaskInput:
+    return WorkerTaskInput(
+        skill_name=skill_name,
+        params=params,
+        persona_id=persona_id,
+        depends_on=depends_on or [],
+        timeout_s=timeout_s,
+    )
+
+
+class StaticPlanner(Planner):
+    """Returns a fixed plan and never replans."""
+
+    def __init__(self, plan: list[WorkerTaskInput]):
+        super().__init__("StaticPlanner")
+        self.plan = plan
+
+    async def create_plan(self, campaign: Campaign) -> list[WorkerTaskInput]:
+        return self.plan
+
+    async def replan(self, campaign, plan, results, feedback=None) -> list[WorkerTaskInput]:
+        return []
+
+
+class SleepyWorker(Worker):
+    """
+    Sleeps `params['delay']` (else `delay`) per task and records what ran: start
+    labels, completion order, and overall and per-skill concurrency.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__("SleepyWorker")
+        self.delay = delay
+        self.executed = 0
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.skill_active: Counter[str] = Counter()
+        self.skill_peak: Counter[str] = Counter()
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        skill_name = task_input.skill_name
+        self.started.append(task_input.params.get("label", skill_name))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.skill_active[skill_name] += 1
+        self.skill_peak[skill_name] = max(
+            self.skill_peak[skill_name], self.skill_active[skill_name]
+        )
+        await asyncio.sleep(task_input.params.get("delay", self.delay))
+        self.active -= 1
+        self.skill_active[skill_name] -= 1
+        self.executed += 1
+        self.finished.append(skill_name)
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=skill_name,
+            result="ok",
+            confidence_score=task_input.params.get("confidence", 0.95),
+            reasoning="sleepy",
+        )
+
+
+def make_skill_worker() -> ChimeraWorker:
+    """A ChimeraWorker with the bundled local skills registered."""
+    worker = ChimeraWorker()
+    worker.register_skill(SkillTrendAnalysis())
+    worker.register_skill(SkillContentGenerator())
+    worker.register_skill(SkillPersonaConsistency())
+    worker.register_skill(SkillMCPBridger(mcp_client=None))
+    return worker
+
+
+def make_orchestrator(
+    plan: list[WorkerTaskInput] | None = None,
+    worker: Worker | None = None,
+    name: str = "TestOrchestrator",
+    planner: Planner | None = None,
+    judge: Judge | None = None,
+    state_manager: StateManager | None = None,
+    **kwargs,
+) -> ChimeraOrchestrator:
+    """
+    An orchestrator running `plan` through a StaticPlanner, or the ChimeraPlanner
+    when no plan is given, on `worker` (default: `make_skill_worker()`).
+    """
+    if planner is None:
+        planner = StaticPlanner(plan) if plan is not None else ChimeraPlanner()
+    return ChimeraOrchestrator(
+        name=name,
+        planner=planner,
+        worker=worker if worker is not None else make_skill_worker(),
+        judge=judge if judge is not None else ChimeraJudge(confidence_threshold=0.9),
+        state_manager=state_manager if state_manager is not None else InMemoryStateManager(),
+        **kwargs,
+    )
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+from skills.base import BaseSkill
+from skills.skill_mcp_bridger import SkillMCPBridger
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.resilience import CircuitBreakerRegistry, CircuitState
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+
+class SlowSkill(BaseSkill):
+    idempotent = True
+
+    def __init__(self, delay: float = 0.05):
+        self.calls = 0
+        self.delay = delay
+
+    @property
+    def name(self) -> str:
+        return "skill_slow"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result={"topic": task_input.params["topic"]},
+            confidence_score=0.95,
+            reasoning="slow",
+        )
+
+
+class CountingMCPClient:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> str:
+        self.calls.append(tool_name)
+        await asyncio.sleep(0.02)
+        return "ok"
+
+
+def make_worker(skill: BaseSkill, **kwargs) -> ChimeraWorker:
+    worker = ChimeraWorker(coalesce=True, **kwargs)
+    worker.register_skill(skill)
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_tasks_share_one_run():
+    skill = SlowSkill()
+    worker = make_worker(skill)
+    tasks = [make_task("skill_slow", topic="AI") for _ in range(5)] + [
+        make_task("skill_slow", topic="fashion")
+    ]
+
+    outputs = await asyncio.gather(*(worker.perform_task(t) for t in tasks))
+
+    assert skill.calls == 2
+    assert worker.coalesced == 4
+    assert [o.task_id for o in outputs] == [t.task_id for t in tasks]
+    assert [o.result["topic"] for o in outputs] == ["AI"] * 5 + ["fashion"]
+    # Followers get their own copy of the output.
+    assert outputs[0].result is not outputs[1].result
+
+
+@pytest.mark.asyncio
+async def test_finished_tasks_are_not_coalesced():
+    skill = SlowSkill(delay=0.0)
+    worker = make_worker(skill)
+
+    await worker.perform_task(make_task("skill_slow", topic="AI"))
+    await worker.perform_task(make_task("skill_slow", topic="AI"))
+
+    assert skill.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_followers():
+    skill = SlowSkill()
+    worker = make_worker(skill)
+    leader = asyncio.create_task(worker.perform_task(make_task("skill_slow", topic="AI")))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(worker.perform_task(make_task("skill_slow", topic="AI")))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    output = await follower
+
+    assert output.confidence_score == 0.95
+    assert skill.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_follower_keeps_its_own_deadline():
+    worker = make_worker(SlowSkill(delay=0.2))
+    leader = asyncio.create_task(worker.perform_task(make_task("skill_slow", topic="AI")))
+    await asyncio.sleep(0)
+    impatient = make_task("skill_slow", topic="AI")
+    impatient.timeout_s = 0.01
+
+    output = await worker.perform_task(impatient)
+
+    assert output.confidence_score == 0.0
+    assert output.reasoning.startswith("Timed out")
+    assert (await leader).confidence_score == 0.95
+
+
+@pytest.mark.asyncio
+async def test_leader_deadline_does_not_apply_to_followers():
+    worker = make_worker(SlowSkill(delay=0.05))
+    impatient = make_task("skill_slow", topic="AI")
+    impatient.timeout_s = 0.01
+    leader = asyncio.create_task(worker.perform_task(impatient))
+    await asyncio.sleep(0)
+    patient = make_task("skill_slow", topic="AI")
+    patient.timeout_s = 5.0
+
+    output = await worker.perform_task(patient)
+
+    assert (await leader).reasoning == "Timed out in skill skill_slow after 0.01s."
+    assert output.confidence_score == 0.95
+    assert output.task_id == patient.task_id
+
+
+@pytest.mark.asyncio
+async def test_shared_run_is_cancelled_once_every_caller_gave_up():
+    skill = SlowSkill(delay=1.0)
+    worker = make_worker(skill)
+    tasks = [make_task("skill_slow", topic="AI") for _ in range(2)]
+    for task in tasks:
+        task.timeout_s = 0.01
+
+    outputs = await asyncio.gather(*(worker.perform_task(t) for t in tasks))
+    skill.delay = 0.0
+    retried = await worker.perform_task(make_task("skill_slow", topic="AI"))
+
+    assert [o.confidence_score for o in outputs] == [0.0, 0.0]
+    # The abandoned run is not joined by later identical tasks.
+    assert retried.confidence_score == 0.95
+    assert skill.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hung_shared_runs_trip_the_breaker():
+    skill = SlowSkill(delay=60.0)
+    breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60.0)
+    worker = make_worker(skill, default_timeout=0.01, breakers=breakers)
+
+    for _ in range(3):
+        outputs = await asyncio.gather(
+            *(worker.perform_task(make_task("skill_slow", topic="AI")) for _ in range(2))
+        )
+
+    # One failure per abandoned run, however many callers shared it.
+    assert skill.calls == 2
+    assert breakers.get("skill:skill_slow").state == CircuitState.OPEN
+    assert all("failing fast" in o.reasoning for o in outputs)
+
+
+@pytest.mark.asyncio
+async def test_bridger_only_coalesces_read_only_tools():
+    client = CountingMCPClient()
+    worker = make_worker(SkillMCPBridger(client))
+
+    def bridged(tool_name: str) -> WorkerTaskInput:
+        return make_task("skill_mcp_bridger", tool_name=tool_name, arguments={"topic": "AI"})
+
+    await asyncio.gather(*(worker.perform_task(bridged("search_trends")) for _ in range(3)))
+    await asyncio.gather(*(worker.perform_task(bridged("post_content")) for _ in range(3)))
+
+    assert client.calls == ["search_trends"] + ["post_content"] * 3
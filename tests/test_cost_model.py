@@ -0,0 +1,132 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.base import Worker
+from src.swarm.cost_model import CostModel, skill_key, tool_key
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import SleepyWorker, make_orchestrator, make_task
+
+
+def long_pole_plan(delay: float = 0.0) -> list[WorkerTaskInput]:
+    """Three independent leaves listed before a three-task chain."""
+    leaves = [make_task("leaf", label=f"leaf{i}", delay=delay) for i in range(3)]
+    chain = [make_task("chain", label="chain0", delay=delay)]
+    for i in range(1, 3):
+        chain.append(make_task("chain", [chain[-1].task_id], label=f"chain{i}", delay=delay))
+    return leaves + chain
+
+
+def test_ewma_statistics_and_expected_cost():
+    model = CostModel(alpha=0.5, default_latency=2.0)
+    model.record(skill_key("s"), 1.0)
+    model.record(skill_key("s"), 3.0, failed=True)
+
+    stats = model.stats[skill_key("s")]
+    assert stats.latency == 2.0
+    assert stats.failure_rate == 0.5
+    assert model.expected_cost(skill_key("s")) == 3.0
+    assert model.expected_cost(skill_key("unseen")) == 2.0
+    assert model.concurrency_for("s", 4) == 2
+    assert model.concurrency_for("unseen", 4) == 4
+
+
+def test_mcp_bridged_tasks_use_tool_cost():
+    model = CostModel()
+    model.record(skill_key("skill_mcp_bridger"), 0.1)
+    model.record(tool_key("post_content"), 5.0)
+
+    task = make_task("skill_mcp_bridger", tool_name="post_content", arguments={})
+    assert model.task_cost(task) == 5.0
+
+
+def test_critical_path_lengths():
+    model = CostModel()
+    model.record(skill_key("leaf"), 1.0)
+    model.record(skill_key("chain"), 1.0)
+    plan = long_pole_plan()
+
+    priorities = model.critical_path(plan)
+
+    assert [priorities[t.task_id] for t in plan] == [1.0, 1.0, 1.0, 3.0, 2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_long_pole_dispatched_first_shortens_makespan():
+    model = CostModel()
+    model.record(skill_key("leaf"), 0.05)
+    model.record(skill_key("chain"), 0.05)
+
+    loop = asyncio.get_running_loop()
+    timings = {}
+    for label, cost_model in (("fifo", None), ("critical_path", model)):
+        worker = SleepyWorker()
+        orchestrator = make_orchestrator(
+            long_pole_plan(delay=0.05), worker, max_concurrency=2, cost_model=cost_model
+        )
+        started = loop.time()
+        await orchestrator.run_swarm(Campaign(title=label, goal="Finish sooner"))
+        timings[label] = loop.time() - started
+        if cost_model is not None:
+            assert worker.started[0] == "chain0"
+
+    # FIFO needs four 50ms rounds, critical-path-first needs three.
+    assert timings["critical_path"] < timings["fifo"] - 0.02
+
+
+@pytest.mark.asyncio
+async def test_per_skill_concurrency_cap():
+    worker = SleepyWorker()
+    orchestrator = make_orchestrator(
+        long_pole_plan(delay=0.01), worker, max_concurrency=4, skill_concurrency={"leaf": 1}
+    )
+
+    await orchestrator.run_swarm(Campaign(title="Capped", goal="One leaf at a time"))
+
+    assert worker.skill_peak["leaf"] == 1
+    assert len(worker.started) == 6
+
+
+@pytest.mark.asyncio
+async def test_statistics_persist_between_runs(tmp_path):
+    path = str(tmp_path / "costs.json")
+    worker = ChimeraWorker()
+    worker.register_skill(SkillTrendAnalysis())
+    worker.register_skill(SkillContentGenerator())
+    worker.register_skill(SkillPersonaConsistency())
+    orchestrator = ChimeraOrchestrator(
+        name="LearningOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=worker,
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=InMemoryStateManager(),
+        cost_model=CostModel(path=path),
+    )
+
+    await orchestrator.run_swarm(Campaign(title="Warm", goal="Remember costs"))
+
+    warm = CostModel(path=path)
+    assert warm.stats[skill_key("skill_trend_analysis")].samples == 1
+    assert warm.stats[skill_key("skill_content_generator")].failure_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_do_not_collide(tmp_path):
+    path = str(tmp_path / "costs.json")
+    model = CostModel(path=path)
+    model.record(skill_key("skill_trend_analysis"), 0.1)
+
+    for _ in range(20):
+        await asyncio.gather(*(model.save() for _ in range(8)))
+
+    assert CostModel(path=path).stats == model.stats
+    assert [p.name for p in tmp_path.iterdir()] == ["costs.json"]
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from skills.skill_mcp_bridger import SkillMCPBridger
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, WorkerTaskInput
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_orchestrator
+
+
+class StubMCPClient:
+    def __init__(self, healthy: bool = True, delay: float = 0.0):
+        self.healthy = healthy
+        self.delay = delay
+        self.probes = 0
+
+    async def health_check(self) -> bool:
+        self.probes += 1
+        await asyncio.sleep(self.delay)
+        return self.healthy
+
+
+class HangingJudge(ChimeraJudge):
+    async def health_check(self) -> bool:
+        await asyncio.sleep(10)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_with_timeouts():
+    slow_server = StubMCPClient(delay=0.1)
+    orchestrator = make_orchestrator(
+        judge=HangingJudge(),
+        mcp_clients={"social": slow_server, "news": StubMCPClient(delay=0.1)},
+        probe_timeout=0.2,
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    health = await orchestrator.monitor_health()
+
+    assert loop.time() - started < 0.35
+    assert health == {
+        "planner": True,
+        "worker": True,
+        "judge": False,
+        "mcp:social": True,
+        "mcp:news": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_health_is_cached_for_ttl():
+    server = StubMCPClient()
+    orchestrator = make_orchestrator(mcp_clients={"social": server}, health_ttl=60.0)
+
+    await orchestrator.monitor_health()
+    await orchestrator.monitor_health()
+    assert orchestrator.health_snapshot()["mcp:social"] is True
+
+    assert server.probes == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_refreshes_in_background():
+    server = StubMCPClient()
+    orchestrator = make_orchestrator(mcp_clients={"social": server}, health_ttl=60.0)
+
+    assert orchestrator.health_snapshot() == {}
+    await asyncio.sleep(0.01)
+    assert server.probes == 1
+    assert orchestrator.health_snapshot()["mcp:social"] is True
+
+
+@pytest.mark.asyncio
+async def test_mcp_tasks_refused_while_server_is_down():
+    plan = [
+        WorkerTaskInput(
+            skill_name="skill_mcp_bridger",
+            params={"tool_name": "post_content", "arguments": {}},
+            persona_id="p1",
+        ),
+        WorkerTaskInput(skill_name="skill_trend_analysis", params={"topic": "AI"}, persona_id="p1"),
+    ]
+    orchestrator = make_orchestrator(
+        plan=plan, mcp_clients={"social": StubMCPClient(healthy=False)}
+    )
+
+    results = await orchestrator.run_swarm(Campaign(title="Outage", goal="Do not hammer"))
+
+    assert results[0]["status"] == "FAILED"
+    assert "Admission refused" in results[0]["output"]["reasoning"]
+    assert results[1]["status"] == "COMPLETED"
@@ -0,0 +1,125 @@
+from uuid import uuid4
+
+import pytest
+
+from skills.base import BaseSkill
+from src.models.schemas import TaskStatus, WorkerTaskInput, WorkerTaskOutput
+from src.persona.soul import Soul
+from src.swarm.judge import ChimeraJudge, JudgeCascade
+
+SOUL = Soul.from_file("personas/example_agent/SOUL.md")
+CLEAN = "This architectural approach ensures long-term scalability and governance."
+
+
+def draft(content: str | None, confidence: float = 0.95) -> WorkerTaskOutput:
+    return WorkerTaskOutput(
+        task_id=uuid4(),
+        skill_name="skill_content_generator",
+        result={"content": content} if content is not None else {"topic": "AI"},
+        confidence_score=confidence,
+        reasoning="drafted",
+    )
+
+
+class ScriptedChecker(BaseSkill):
+    """Deep check returning a fixed score and recording its batches."""
+
+    def __init__(self, score: float):
+        self.score = score
+        self.batches: list[int] = []
+
+    @property
+    def name(self) -> str:
+        return "skill_scripted_check"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result=None,
+            confidence_score=self.score,
+            reasoning="scripted",
+        )
+
+    async def execute_batch(self, task_inputs):
+        self.batches.append(len(task_inputs))
+        return await super().execute_batch(task_inputs)
+
+
+@pytest.mark.asyncio
+async def test_cheap_tiers_decide_clear_cases_without_deep_check():
+    checker = ScriptedChecker(score=0.95)
+    judge = ChimeraJudge(soul=SOUL, deep_checker=checker)
+
+    verdicts = await judge.validate_outputs(
+        [
+            draft(CLEAN),
+            draft("An illegal shortcut to growth, explained in detail."),
+            draft("This new agent is totally lit, fam, trust the process!"),
+            draft(CLEAN, confidence=0.3),
+            draft(None),
+        ]
+    )
+
+    assert [v.approval_status for v in verdicts] == [
+        TaskStatus.COMPLETED,
+        TaskStatus.FAILED,
+        TaskStatus.FAILED,
+        TaskStatus.FAILED,
+        TaskStatus.COMPLETED,
+    ]
+    assert "safety keyword 'illegal'" in verdicts[1].feedback
+    assert "forbidden term 'lit'" in verdicts[2].feedback
+    assert checker.batches == []
+    assert judge.decided_by == {"persona": 1, "safety": 2, "confidence": 2}
+
+
+@pytest.mark.asyncio
+async def test_persona_score_can_lower_worker_confidence():
+    judge = ChimeraJudge(soul=SOUL, cascade=JudgeCascade(deep_check=False))
+
+    # Too short for the persona: 0.95 - 0.1.
+    verdict = await judge.validate_output(draft("Agents rock."))
+
+    assert verdict.approval_status == TaskStatus.ESC_HITL
+    assert "Confidence 0.85" in verdict.feedback
+
+
+@pytest.mark.asyncio
+async def test_deep_check_runs_once_per_batch_of_gray_zone_outputs():
+    checker = ScriptedChecker(score=0.95)
+    judge = ChimeraJudge(soul=SOUL, deep_checker=checker)
+
+    verdicts = await judge.validate_outputs(
+        [draft(CLEAN, confidence=0.8), draft(CLEAN), draft(CLEAN, confidence=0.75)]
+    )
+
+    assert checker.batches == [2]
+    # A passing deep check never skips human review.
+    assert [v.approval_status for v in verdicts] == [
+        TaskStatus.ESC_HITL,
+        TaskStatus.COMPLETED,
+        TaskStatus.ESC_HITL,
+    ]
+    assert "Deep persona check scored 0.95" in verdicts[0].feedback
+
+
+@pytest.mark.asyncio
+async def test_failed_deep_check_rejects_gray_zone_output():
+    judge = ChimeraJudge(soul=SOUL, deep_checker=ScriptedChecker(score=0.4))
+
+    verdict = await judge.validate_output(draft(CLEAN, confidence=0.8))
+
+    assert verdict.approval_status == TaskStatus.FAILED
+    assert judge.decided_by["deep"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_tiers_fall_back_to_worker_confidence():
+    judge = ChimeraJudge(
+        soul=SOUL, cascade=JudgeCascade(safety=False, persona=False, deep_check=False)
+    )
+
+    verdict = await judge.validate_output(draft("An illegal shortcut, lit."))
+
+    assert verdict.approval_status == TaskStatus.COMPLETED
@@ -52,3 +52,15 @@ async def test_worker_mcp_bridger_skill():
     assert "SUCCESS" in output.result["mcp_output"][0].text
 
     await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_mcp_client_health_check():
+    server_script = os.path.abspath("mcp-server-mock/server.py")
+    client = ChimeraMCPClient(command="python", args=[server_script])
+    assert await client.health_check() is False
+
+    await client.connect()
+    assert await client.health_check() is True
+
+    await client.disconnect()
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign
+from src.observability.metrics import MetricsRegistry, SwarmMetrics
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("judge").observe(value)
+
+    text = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{stage="judge",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{stage="judge",le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{stage="judge",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{stage="judge"} 4' in text
+    assert 'latency_seconds_sum{stage="judge"} 3.65' in text
+
+
+def test_registry_returns_existing_metric_and_rejects_kind_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events.", ("kind",))
+    assert registry.counter("events_total", "Events.", ("kind",)) is counter
+
+    with pytest.raises(ValueError):
+        registry.gauge("events_total", "Events.")
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
+
+
+@pytest.mark.asyncio
+async def test_swarm_run_records_stages_and_outcomes():
+    metrics = SwarmMetrics(MetricsRegistry())
+    worker = ChimeraWorker()
+    worker.register_skill(SkillTrendAnalysis())
+    worker.register_skill(SkillContentGenerator())
+    worker.register_skill(SkillPersonaConsistency())
+    orchestrator = ChimeraOrchestrator(
+        name="MeteredOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=worker,
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=InMemoryStateManager(),
+        metrics=metrics,
+    )
+
+    await orchestrator.run_swarm(Campaign(title="Metered", goal="Measure everything"))
+
+    for stage in ("plan", "execute", "judge", "persist"):
+        assert metrics.stage_seconds.labels(stage).count > 0
+    assert metrics.skill_seconds.labels("skill_trend_analysis").count == 1
+    assert metrics.task_outcomes.value("skill_content_generator", "COMPLETED") == 1
+    assert metrics.queue_depth.value("review") == 0
+    assert metrics.queue_depth.value("persist") == 0
+    assert metrics.in_flight.value() == 0
+
+
+@pytest.mark.asyncio
+async def test_scrape_endpoint_serves_text_format():
+    registry = MetricsRegistry()
+    registry.counter("scrapes_total", "Scrapes.").inc()
+    server = await registry.serve(port=0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = (await reader.read()).decode()
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "scrapes_total 1.0" in response
@@ -1,8 +1,10 @@
 import os
+import random
+import re
 
 import pytest
 
-from src.governance.confidence_scoring import ConfidenceScorer
+from src.governance.confidence_scoring import SAFETY_KEYWORDS, SLANG_TERMS, ConfidenceScorer
 from src.persona.soul import Soul
 
 
@@ -34,3 +36,82 @@ def test_confidence_scoring():
     # Safety check
     assert scorer.validate_safety("Clean content") is True
     assert scorer.validate_safety("This content is an illegal attack") is False
+
+
+def reference_score(soul: Soul, content: str) -> float:
+    """The original per-action, per-term scoring loop."""
+    penalty = 0.0
+    for action in soul.forbidden:
+        if "slang" in action.lower():
+            if any(re.search(term, content.lower()) for term in SLANG_TERMS):
+                penalty += 0.3
+    if len(content) < 20:
+        penalty += 0.1
+    return max(0.0, 0.95 - penalty)
+
+
+def test_compiled_matcher_matches_reference_scoring():
+    pieces = ["lit", "fam", "bruh", "harm", "illegal", "LIT", "Fam", "flit", "lite", " ", "-", "x"]
+    rng = random.Random(7)
+    for slang_actions in range(3):
+        soul = Soul("s", {}, [], ["Do not use slang."] * slang_actions + ["Be kind."])
+        scorer = ConfidenceScorer(soul)
+        for _ in range(2000):
+            content = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 10)))
+            assert scorer.score_content(content) == reference_score(soul, content)
+            assert scorer.validate_safety(content) == (
+                not any(word in content.lower() for word in SAFETY_KEYWORDS)
+            )
+
+
+def test_check_reports_fired_rules():
+    scorer = ConfidenceScorer(Soul.from_file("personas/example_agent/SOUL.md"))
+
+    check = scorer.check("An illegal attack, bruh. Harmless? Lit.")
+
+    assert check.hits == (
+        "safety:harm",
+        "safety:illegal",
+        "safety:attack",
+        "slang:lit",
+        "slang:bruh",
+    )
+    assert not check.safe
+    assert check.score == scorer.score_content("An illegal attack, bruh. Harmless? Lit.")
+
+
+def test_matcher_is_compiled_once_per_persona_rules():
+    soul = Soul("s", {}, [], ["Do not use slang."])
+    scorer = ConfidenceScorer(soul)
+
+    assert scorer.matcher is ConfidenceScorer(Soul("t", {}, [], ["Do not use slang."])).matcher
+    soul.forbidden.clear()
+    assert "slang:lit" not in scorer.matcher.rules
+
+
+def test_bulk_scoring_matches_single_item_scoring():
+    np = pytest.importorskip("numpy")
+    pieces = ["lit", "fam", "bruh", "harm", "illegal", "LIT", "flit", " ", "\n", "İ", "x" * 12]
+    rng = random.Random(11)
+    contents = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 8))) for _ in range(3000)]
+    scorer = ConfidenceScorer(Soul("s", {}, [], ["Do not use slang."]))
+    rules = list(scorer.matcher.rules)
+
+    scores, hits = scorer.score_bulk(np.array(contents))
+
+    assert scores.tolist() == [scorer.score_content(content) for content in contents]
+    assert [tuple(rules[i] for i in np.flatnonzero(row)) for row in hits] == [
+        scorer.check(content).hits for content in contents
+    ]
+
+    pooled_scores, pooled_hits = scorer.score_bulk(contents, processes=2)
+    assert np.array_equal(pooled_scores, scores)
+    assert np.array_equal(pooled_hits, hits)
+
+
+def test_bulk_scoring_of_nothing():
+    pytest.importorskip("numpy")
+    scores, hits = ConfidenceScorer(Soul("s", {}, [], [])).score_bulk([])
+
+    assert scores.shape == (0,)
+    assert hits.shape == (0, len(SAFETY_KEYWORDS))
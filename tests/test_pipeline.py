@@ -0,0 +1,163 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.models.schemas import (
+    Campaign,
+    JudgeValidationOutput,
+    TaskStatus,
+    WorkerTaskInput,
+    WorkerTaskOutput,
+)
+from src.swarm.base import Judge, Worker
+from src.swarm.batching import BatchPolicy
+from src.swarm.judge import ChimeraJudge
+from src.swarm.pipeline import CampaignPipeline
+from src.swarm.state import InMemoryStateManager
+from tests.helpers import SleepyWorker
+
+
+class SlowJudge(Judge):
+    def __init__(self, delay: float, worker: SleepyWorker):
+        super().__init__("SlowJudge")
+        self.delay = delay
+        self.worker = worker
+        self.judged = 0
+        self.max_backlog = 0
+
+    async def validate_output(self, worker_output: WorkerTaskOutput) -> JudgeValidationOutput:
+        self.max_backlog = max(self.max_backlog, self.worker.executed - self.judged)
+        await asyncio.sleep(self.delay)
+        self.judged += 1
+        return JudgeValidationOutput(approval_status=TaskStatus.COMPLETED, feedback="ok")
+
+
+def make_plan(size: int) -> list[WorkerTaskInput]:
+    return [WorkerTaskInput(skill_name=f"s{i}", params={}, persona_id="p1") for i in range(size)]
+
+
+@pytest.mark.asyncio
+async def test_judging_overlaps_execution():
+    worker = SleepyWorker(delay=0.05)
+    judge = SlowJudge(delay=0.05, worker=worker)
+    state = InMemoryStateManager()
+    campaign = Campaign(title="Overlap", goal="Hide judge latency")
+    await state.save_campaign(campaign)
+    pipeline = CampaignPipeline(
+        campaign, make_plan(4), worker, judge, state, max_concurrency=1, queue_size=2
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await pipeline.run()
+
+    # Strictly sequential would take 4 * (0.05 + 0.05) = 0.4s.
+    assert loop.time() - started < 0.33
+    assert [r["status"] for r in results] == ["COMPLETED"] * 4
+    assert len(state.results[str(campaign.id)]) == 4
+
+
+@pytest.mark.asyncio
+async def test_full_review_queue_applies_backpressure():
+    worker = SleepyWorker(delay=0.0)
+    judge = SlowJudge(delay=0.02, worker=worker)
+    state = InMemoryStateManager()
+    campaign = Campaign(title="Backpressure", goal="Do not run ahead")
+    await state.save_campaign(campaign)
+    pipeline = CampaignPipeline(
+        campaign, make_plan(10), worker, judge, state, max_concurrency=2, queue_size=1
+    )
+
+    await pipeline.run()
+
+    # One output being judged, one queued, and at most `max_concurrency` waiting to enqueue.
+    assert judge.max_backlog <= 4
+    assert judge.judged == 10
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_propagates():
+    class ExplodingJudge(Judge):
+        async def validate_output(self, worker_output):
+            raise RuntimeError("judge down")
+
+    worker = SleepyWorker(delay=0.0)
+    state = InMemoryStateManager()
+    campaign = Campaign(title="Boom", goal="Surface errors")
+    pipeline = CampaignPipeline(
+        campaign, make_plan(2), worker, ExplodingJudge("x"), state, max_concurrency=1, queue_size=1
+    )
+
+    with pytest.raises(RuntimeError, match="judge down"):
+        await pipeline.run()
+
+
+class BatchingJudge(Judge):
+    """Round-trip cost is per call, not per output."""
+
+    def __init__(self, round_trip: float):
+        super().__init__("BatchingJudge")
+        self.round_trip = round_trip
+        self.batches: list[int] = []
+
+    async def validate_output(self, worker_output: WorkerTaskOutput) -> JudgeValidationOutput:
+        return (await self.validate_outputs([worker_output]))[0]
+
+    async def validate_outputs(self, worker_outputs):
+        self.batches.append(len(worker_outputs))
+        await asyncio.sleep(self.round_trip)
+        return [
+            JudgeValidationOutput(
+                approval_status=TaskStatus.COMPLETED if o.skill_name != "s3" else TaskStatus.FAILED,
+                feedback=o.skill_name,
+            )
+            for o in worker_outputs
+        ]
+
+
+@pytest.mark.asyncio
+async def test_review_queue_is_judged_in_batches():
+    judge = BatchingJudge(round_trip=0.02)
+    state = InMemoryStateManager()
+    campaign = Campaign(title="Batched", goal="Judge together")
+    await state.save_campaign(campaign)
+    pipeline = CampaignPipeline(
+        campaign,
+        make_plan(10),
+        SleepyWorker(delay=0.0),
+        judge,
+        state,
+        max_concurrency=10,
+        queue_size=10,
+        judge_batch=BatchPolicy(max_size=4, max_linger=0.01),
+    )
+
+    results = await pipeline.run()
+
+    assert judge.batches == [4, 4, 2]
+    # Verdicts are matched back to their tasks in input order.
+    assert [r["feedback"] for r in results] == [f"s{i}" for i in range(10)]
+    assert results[3]["status"] == TaskStatus.FAILED
+    assert len(state.results[str(campaign.id)]) == 10
+
+
+@pytest.mark.asyncio
+async def test_chimera_judge_batch_matches_single_verdicts():
+    judge = ChimeraJudge(confidence_threshold=0.9)
+    outputs = [
+        WorkerTaskOutput(
+            task_id=uuid4(), skill_name="s", result="ok", confidence_score=c, reasoning="r"
+        )
+        for c in (0.95, 0.8, 0.1, 0.9)
+    ]
+
+    batched = await judge.validate_outputs(outputs)
+
+    assert batched == [await judge.validate_output(o) for o in outputs]
+    assert [v.approval_status for v in batched] == [
+        TaskStatus.COMPLETED,
+        TaskStatus.ESC_HITL,
+        TaskStatus.FAILED,
+        TaskStatus.COMPLETED,
+    ]
@@ -0,0 +1,79 @@
+import pytest
+
+from src.models.schemas import Campaign, WorkerTaskInput
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.templates import (
+    PlanTemplate,
+    TaskTemplate,
+    TemplateCache,
+    TemplateRef,
+    normalize_goal,
+)
+
+
+class CountingPlanner(ChimeraPlanner):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.compiled = 0
+
+    async def compile_template(self, campaign):
+        self.compiled += 1
+        return await super().compile_template(campaign)
+
+
+@pytest.mark.asyncio
+async def test_instances_match_validated_plan_with_fresh_ids():
+    planner = ChimeraPlanner()
+    campaign = Campaign(title="AI Fashion", goal="Grow reach")
+
+    first = await planner.create_plan(campaign)
+    second = await planner.create_plan(campaign)
+
+    for task in first:
+        assert WorkerTaskInput.model_validate(task.model_dump()) == task
+        assert task.campaign_id == campaign.id
+    trend, content, consistency = first
+    assert trend.params["topic"] == "AI Fashion"
+    assert content.params["prompt"] == "Generate a viral post about AI Fashion based on Grow reach"
+    assert content.depends_on == [trend.task_id]
+    assert content.param_refs["style_guidelines"].task_id == trend.task_id
+    assert consistency.depends_on == [content.task_id]
+    assert {t.task_id for t in first}.isdisjoint(t.task_id for t in second)
+
+
+@pytest.mark.asyncio
+async def test_templates_are_cached_by_normalized_goal():
+    planner = CountingPlanner(template_cache_size=1)
+
+    await planner.create_plan(Campaign(title="A", goal="Grow  reach"))
+    await planner.create_plan(Campaign(title="B", goal="grow reach "))
+    assert planner.compiled == 1
+    assert planner.templates.hits == 1
+
+    await planner.create_plan(Campaign(title="C", goal="Sell shoes"))
+    await planner.create_plan(Campaign(title="D", goal="Grow reach"))
+    assert planner.compiled == 3  # size-1 LRU evicted the first goal
+    assert len(planner.templates) == 1
+
+
+def test_mutable_params_are_not_shared_between_instances():
+    template = PlanTemplate([TaskTemplate(skill_name="s", params={"tags": ["a"]})])
+    campaign = Campaign(title="T", goal="G")
+
+    first, second = template.instantiate(campaign)[0], template.instantiate(campaign)[0]
+    first.params["tags"].append("b")
+
+    assert second.params["tags"] == ["a"]
+
+
+def test_invalid_templates_are_rejected_at_compile_time():
+    with pytest.raises(ValueError):
+        PlanTemplate([TaskTemplate(skill_name="s", param_refs={"x": TemplateRef(step=0)})])
+    with pytest.raises(ValueError):
+        PlanTemplate([TaskTemplate(skill_name="s", params={"prompt": "About {persona}"})])
+    with pytest.raises(ValueError):
+        TemplateCache(max_size=0)
+
+
+def test_normalize_goal():
+    assert normalize_goal("  Grow\tREACH  fast ") == "grow reach fast"
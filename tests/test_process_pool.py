@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from skills.base import BaseSkill
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.process_pool import ProcessSkillPool, load_skill
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+
+class BusySkill(BaseSkill):
+    """CPU-bound skill: spins for `params['seconds']` and reports its process id."""
+
+    @property
+    def name(self) -> str:
+        return "skill_busy"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        deadline = time.perf_counter() + task_input.params.get("seconds", 0.0)
+        while time.perf_counter() < deadline:
+            pass
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result={"pid": os.getpid()},
+            confidence_score=1.0,
+            reasoning="busy",
+        )
+
+
+class CachedBusySkill(BusySkill):
+    cacheable = True
+    idempotent = True
+    version = "3"
+
+
+def test_process_skill_keeps_the_wrapped_skill_flags():
+    worker = ChimeraWorker()
+    worker.register_process_skill("skill_busy", "tests.test_process_pool:CachedBusySkill")
+
+    skill = worker.resolve_skill("skill_busy")
+
+    assert skill is not None
+    assert (skill.cacheable, skill.idempotent, skill.version) == (True, True, "3")
+    assert skill.requires_mcp is False
+
+
+@pytest.mark.asyncio
+async def test_process_skill_runs_out_of_process_without_blocking_loop():
+    worker = ChimeraWorker(process_pool=ProcessSkillPool(max_workers=2))
+    worker.register_process_skill("skill_busy", "tests.test_process_pool:BusySkill")
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        task = make_task("skill_busy", seconds=0.3)
+        output = await worker.perform_task(task)
+    finally:
+        ticking.cancel()
+        worker.process_pool.shutdown()
+
+    assert output.task_id == task.task_id
+    assert output.confidence_score == 1.0
+    assert output.result["pid"] != os.getpid()
+    # The loop kept running while the skill burned CPU in another process.
+    assert ticks >= 10
+
+
+def test_register_after_start_is_rejected():
+    pool = ProcessSkillPool(max_workers=1)
+    pool.register("skill_busy", "tests.test_process_pool:BusySkill")
+    pool.start()
+    try:
+        with pytest.raises(RuntimeError):
+            pool.register("late_skill", "tests.test_process_pool:BusySkill")
+    finally:
+        pool.shutdown()
+
+
+def test_load_skill_rejects_malformed_import_path():
+    with pytest.raises(ValueError):
+        load_skill("tests.test_process_pool.BusySkill")
@@ -0,0 +1,120 @@
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, TaskStatus, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+
+
+def entry(task: WorkerTaskInput, status: TaskStatus, feedback: str | None = None) -> dict:
+    return {
+        "task_id": str(task.task_id),
+        "skill": task.skill_name,
+        "status": status,
+        "feedback": feedback,
+    }
+
+
+class FlakyContentWorker(ChimeraWorker):
+    """Produces a low-confidence draft the first time content is generated."""
+
+    def __init__(self):
+        super().__init__()
+        self.register_skill(SkillTrendAnalysis())
+        self.register_skill(SkillContentGenerator())
+        self.register_skill(SkillPersonaConsistency())
+        self.calls: list[WorkerTaskInput] = []
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.calls.append(task_input)
+        output = await super().perform_task(task_input)
+        first_draft = sum(t.skill_name == "skill_content_generator" for t in self.calls) == 1
+        if task_input.skill_name == "skill_content_generator" and first_draft:
+            return output.model_copy(update={"confidence_score": 0.1})
+        return output
+
+
+@pytest.mark.asyncio
+async def test_replan_replaces_only_failed_subgraph():
+    campaign = Campaign(title="Replan", goal="Retry only what failed")
+    trend, content, consistency = await ChimeraPlanner().create_plan(campaign)
+    results = [
+        entry(trend, TaskStatus.COMPLETED),
+        entry(content, TaskStatus.FAILED, "Too generic."),
+        entry(consistency, TaskStatus.FAILED, f"Skipped: upstream task {content.task_id} failed."),
+    ]
+
+    new_content, new_consistency = await ChimeraPlanner().replan(
+        campaign, [trend, content, consistency], results, "campaign feedback"
+    )
+
+    assert new_content.skill_name == "skill_content_generator"
+    assert new_content.task_id != content.task_id
+    assert new_content.depends_on == [trend.task_id]
+    assert new_content.param_refs["style_guidelines"].task_id == trend.task_id
+    assert new_content.params["revision_feedback"] == "Too generic."
+    assert new_consistency.depends_on == [new_content.task_id]
+    assert "revision_feedback" not in new_consistency.params
+    # The original plan is left untouched.
+    assert "revision_feedback" not in content.params
+
+
+@pytest.mark.asyncio
+async def test_replan_of_approved_plan_is_empty():
+    campaign = Campaign(title="Replan", goal="Nothing to do")
+    plan = await ChimeraPlanner().create_plan(campaign)
+    results = [entry(task, TaskStatus.COMPLETED) for task in plan]
+
+    assert await ChimeraPlanner().replan(campaign, plan, results) == []
+
+
+@pytest.mark.asyncio
+async def test_rejection_triggers_targeted_retry():
+    worker = FlakyContentWorker()
+    state = InMemoryStateManager()
+    orchestrator = ChimeraOrchestrator(
+        name="RecoveringOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=worker,
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=state,
+    )
+    campaign = Campaign(title="Recover", goal="Survive a rejection")
+
+    results = await orchestrator.run_swarm(campaign)
+
+    assert [r["status"] for r in results] == [TaskStatus.COMPLETED] * 3
+    assert [t.skill_name for t in worker.calls] == [
+        "skill_trend_analysis",
+        "skill_content_generator",
+        "skill_content_generator",
+        "skill_persona_consistency",
+    ]
+    saved_plan = state.plans[str(campaign.id)]
+    assert [t.task_id for t in saved_plan] == [r["task_id"] for r in results]
+    assert saved_plan[0].task_id == worker.calls[0].task_id
+
+
+@pytest.mark.asyncio
+async def test_replanning_can_be_disabled():
+    orchestrator = ChimeraOrchestrator(
+        name="StrictOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=FlakyContentWorker(),
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=InMemoryStateManager(),
+        max_replans=0,
+    )
+
+    results = await orchestrator.run_swarm(Campaign(title="Strict", goal="No retries"))
+
+    assert [r["status"] for r in results] == [
+        TaskStatus.COMPLETED,
+        TaskStatus.FAILED,
+        TaskStatus.FAILED,
+    ]
@@ -0,0 +1,180 @@
+import os
+
+import pytest
+
+from skills.base import BaseSkill
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.result_cache import ResultCache, result_key
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+
+class CountingSkill(BaseSkill):
+    """Deterministic skill counting how often it actually runs."""
+
+    cacheable = True
+
+    def __init__(self, confidence: float = 0.95):
+        self.calls = 0
+        self.confidence = confidence
+
+    @property
+    def name(self) -> str:
+        return "skill_counting"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.calls += 1
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result={"topic": task_input.params.get("topic")},
+            confidence_score=self.confidence,
+            reasoning="counted",
+        )
+
+
+def make_worker(skill: BaseSkill, cache: ResultCache) -> ChimeraWorker:
+    worker = ChimeraWorker(result_cache=cache)
+    worker.register_skill(skill)
+    return worker
+
+
+def test_key_is_canonical_and_versioned():
+    skill = CountingSkill()
+    a = make_task("skill_counting", topic="AI", depth="high")
+    b = WorkerTaskInput(
+        skill_name="skill_counting", params={"depth": "high", "topic": "AI"}, persona_id="p1"
+    )
+
+    assert result_key(skill, a) == result_key(skill, b)
+    assert result_key(skill, a) != result_key(
+        skill, make_task("skill_counting", persona_id="p2", topic="AI")
+    )
+    skill.version = "2"
+    assert result_key(skill, a) != result_key(CountingSkill(), a)
+
+
+@pytest.mark.asyncio
+async def test_repeated_task_is_served_from_cache():
+    skill = CountingSkill()
+    cache = ResultCache()
+    worker = make_worker(skill, cache)
+    first, second = make_task("skill_counting", topic="AI"), make_task("skill_counting", topic="AI")
+
+    await worker.perform_task(first)
+    output = await worker.perform_task(second)
+
+    assert skill.calls == 1
+    assert output.task_id == second.task_id
+    assert output.result == {"topic": "AI"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_and_failures_are_recomputed(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.swarm.result_cache.time.time", lambda: now[0])
+    skill = CountingSkill()
+    worker = make_worker(skill, ResultCache(default_ttl=60, skill_ttls={"skill_counting": 10}))
+
+    await worker.perform_task(make_task("skill_counting", topic="AI"))
+    now[0] += 11
+    await worker.perform_task(make_task("skill_counting", topic="AI"))
+    assert skill.calls == 2
+
+    skill.confidence = 0.0
+    await worker.perform_task(make_task("skill_counting", topic="fails"))
+    await worker.perform_task(make_task("skill_counting", topic="fails"))
+    assert skill.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_lru_bound():
+    skill = CountingSkill()
+    cache = ResultCache(max_entries=2)
+    worker = make_worker(skill, cache)
+
+    for topic in ("a", "b", "a", "c", "a", "b"):
+        await worker.perform_task(make_task("skill_counting", topic=topic))
+
+    # "b" was evicted by "c" because "a" had been used more recently.
+    assert skill.calls == 4
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_shared_between_caches(tmp_path):
+    skill = CountingSkill()
+    await make_worker(skill, ResultCache(directory=str(tmp_path))).perform_task(
+        make_task("skill_counting", topic="AI")
+    )
+
+    other = CountingSkill()
+    output = await make_worker(other, ResultCache(directory=str(tmp_path))).perform_task(
+        make_task("skill_counting", topic="AI")
+    )
+
+    assert other.calls == 0
+    assert output.result == {"topic": "AI"}
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_bounded_and_drops_expired_files(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.swarm.result_cache.time.time", lambda: now[0])
+    directory = str(tmp_path)
+    worker = make_worker(
+        CountingSkill(), ResultCache(max_entries=2, directory=directory, max_disk_entries=3)
+    )
+    for topic in "abcdefghij":
+        await worker.perform_task(make_task("skill_counting", topic=topic))
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+    now[0] += 301
+    cache = ResultCache(directory=directory)
+    for topic in "abcdefghij":
+        assert await cache.get(CountingSkill(), make_task("skill_counting", topic=topic)) is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_rescans_only_when_the_bound_is_crossed(tmp_path, monkeypatch):
+    scans = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scans.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr("src.swarm.result_cache.os.scandir", counting_scandir)
+    worker = make_worker(CountingSkill(), ResultCache(directory=str(tmp_path), max_disk_entries=20))
+    for index in range(40):
+        await worker.perform_task(make_task("skill_counting", topic=str(index)))
+
+    # One scan on the first write, then one per 2-3 writes past the bound instead of 40.
+    assert len(scans) <= 10
+    assert 18 <= len(list(tmp_path.glob("*.json"))) <= 20
+
+
+@pytest.mark.asyncio
+async def test_cached_output_is_isolated_from_the_caller():
+    worker = make_worker(CountingSkill(), ResultCache())
+
+    first = await worker.perform_task(make_task("skill_counting", topic="AI"))
+    first.result["topic"] = "edited"
+    second = await worker.perform_task(make_task("skill_counting", topic="AI"))
+
+    assert second.result == {"topic": "AI"}
+
+
+@pytest.mark.asyncio
+async def test_non_cacheable_skills_always_run():
+    cache = ResultCache()
+    worker = make_worker(SkillTrendAnalysis(), cache)
+
+    for _ in range(2):
+        await worker.perform_task(make_task("skill_trend_analysis", topic="AI"))
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
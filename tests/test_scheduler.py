@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from src.models.schemas import Campaign, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.base import Planner, Worker
+from src.swarm.judge import ChimeraJudge
+from src.swarm.limiter import FairShareLimiter
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.scheduler import CampaignScheduler
+from src.swarm.state import InMemoryStateManager
+
+
+class FanOutPlanner(Planner):
+    """Emits `width` independent tasks per campaign."""
+
+    def __init__(self, width: int):
+        super().__init__("FanOutPlanner")
+        self.width = width
+
+    async def create_plan(self, campaign: Campaign) -> list[WorkerTaskInput]:
+        return [
+            WorkerTaskInput(skill_name=campaign.title, params={}, persona_id="p1")
+            for _ in range(self.width)
+        ]
+
+    async def replan(self, campaign, plan, results, feedback=None) -> list[WorkerTaskInput]:
+        return []
+
+
+class CountingWorker(Worker):
+    def __init__(self):
+        super().__init__("CountingWorker")
+        self.active = 0
+        self.peak = 0
+        self.order: list[str] = []
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.order.append(task_input.skill_name)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=task_input.skill_name,
+            result="ok",
+            confidence_score=0.95,
+            reasoning="counted",
+        )
+
+
+async def grant_order(limiter: FairShareLimiter, requests: list[str]) -> list[str]:
+    """Queue all requests behind a held slot, then release and record grant order."""
+    order: list[str] = []
+
+    async def request(campaign_id: str):
+        async with limiter.slot(campaign_id):
+            order.append(campaign_id)
+
+    await limiter.acquire("blocker")
+    waiters = [asyncio.create_task(request(campaign_id)) for campaign_id in requests]
+    await asyncio.sleep(0)
+    limiter.release("blocker")
+    await asyncio.gather(*waiters)
+    return order
+
+
+class TestFairShareLimiter:
+    @pytest.mark.asyncio
+    async def test_weighted_share(self):
+        limiter = FairShareLimiter(max_in_flight=1)
+        limiter.register("heavy", weight=3.0)
+        limiter.register("light", weight=1.0)
+
+        order = await grant_order(limiter, ["heavy"] * 9 + ["light"] * 3)
+
+        assert order[:8].count("heavy") == 6
+        assert order[:8].count("light") == 2
+
+    @pytest.mark.asyncio
+    async def test_priority_then_aging(self):
+        limiter = FairShareLimiter(max_in_flight=1, aging_rate=0.0)
+        limiter.register("urgent", priority=5)
+        limiter.register("batch", priority=0)
+
+        order = await grant_order(limiter, ["batch", "batch", "urgent", "urgent"])
+        assert order == ["urgent", "urgent", "batch", "batch"]
+
+        aged = FairShareLimiter(max_in_flight=1, aging_rate=1000.0)
+        aged.register("urgent", priority=5)
+        aged.register("batch", priority=0)
+        await aged.acquire("blocker")
+        batch = asyncio.create_task(grant_order_single(aged, "batch"))
+        await asyncio.sleep(0.02)
+        urgent = asyncio.create_task(grant_order_single(aged, "urgent"))
+        await asyncio.sleep(0)
+        aged.release("blocker")
+        assert await batch < await urgent
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = FairShareLimiter(max_in_flight=1)
+        await limiter.acquire("a")
+        waiter = asyncio.create_task(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release("a")
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+
+async def grant_order_single(limiter: FairShareLimiter, campaign_id: str) -> float:
+    await limiter.acquire(campaign_id)
+    granted_at = asyncio.get_running_loop().time()
+    limiter.release(campaign_id)
+    return granted_at
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_global_in_flight_and_interleaves():
+    worker = CountingWorker()
+    orchestrator = ChimeraOrchestrator(
+        name="SharedOrchestrator",
+        planner=FanOutPlanner(width=6),
+        worker=worker,
+        judge=ChimeraJudge(),
+        state_manager=InMemoryStateManager(),
+        max_concurrency=6,
+    )
+    scheduler = CampaignScheduler(orchestrator, max_in_flight=2)
+    campaigns = [Campaign(title=f"campaign_{i}", goal="fan out") for i in range(3)]
+    for campaign in campaigns:
+        scheduler.submit(campaign)
+
+    results = await scheduler.run()
+
+    assert worker.peak == 2
+    assert set(results) == {str(c.id) for c in campaigns}
+    assert all(len(r) == 6 for r in results.values())
+    # Every campaign gets work in before any single campaign finishes.
+    assert set(worker.order[:6]) == {c.title for c in campaigns}
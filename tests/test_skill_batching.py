@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from skills.base import BaseSkill
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_mcp_bridger import SkillMCPBridger
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.batching import BatchPolicy
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+
+class EchoSkill(BaseSkill):
+    """Relies on the default `execute_batch`."""
+
+    @property
+    def name(self) -> str:
+        return "skill_echo"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result=task_input.params["value"],
+            confidence_score=0.95,
+            reasoning="echo",
+        )
+
+
+class RecordingSkill(EchoSkill):
+    """Records the size of every batch it is given."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[int] = []
+        self.fail = fail
+
+    async def execute_batch(self, task_inputs: list[WorkerTaskInput]) -> list[WorkerTaskOutput]:
+        self.batches.append(len(task_inputs))
+        if self.fail:
+            raise RuntimeError("backend unavailable")
+        return await super().execute_batch(task_inputs)
+
+
+class RecordingMCPClient:
+    """Records tool calls and the peak number of calls in flight at once."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> str:
+        self.calls.append((tool_name, arguments))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return f"{tool_name}:{arguments['topic']}"
+
+
+@pytest.mark.asyncio
+async def test_default_batch_runs_each_item_in_order():
+    tasks = [make_task("skill_echo", value=i) for i in range(3)]
+
+    outputs = await EchoSkill().execute_batch(tasks)
+
+    assert [o.result for o in outputs] == [0, 1, 2]
+    assert [o.task_id for o in outputs] == [t.task_id for t in tasks]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "skill, params",
+    [
+        (SkillTrendAnalysis(), {"topic": "AI"}),
+        (SkillContentGenerator(), {"prompt": "Hello", "persona": "Calm"}),
+        (
+            SkillPersonaConsistency(),
+            {"content_to_verify": "Hello", "soul_context": "Calm"},
+        ),
+    ],
+)
+async def test_native_batches_match_single_execution(skill, params):
+    tasks = [make_task(skill.name, **params), make_task(skill.name)]
+
+    batched = await skill.execute_batch(tasks)
+    single = [await skill.execute(t) for t in tasks]
+
+    assert [o.task_id for o in batched] == [t.task_id for t in tasks]
+    assert [o.confidence_score for o in batched] == [o.confidence_score for o in single]
+    assert batched[1].reasoning.startswith("Invalid parameters")
+
+
+@pytest.mark.asyncio
+async def test_mcp_bridger_batch_issues_calls_concurrently():
+    client = RecordingMCPClient()
+    tasks = [
+        make_task("skill_mcp_bridger", tool_name="search_trends", arguments={"topic": t})
+        for t in ("ai", "fashion", "tech")
+    ]
+
+    outputs = await SkillMCPBridger(client).execute_batch(tasks)
+
+    assert client.peak == 3
+    assert [o.result["mcp_output"] for o in outputs] == [
+        "search_trends:ai",
+        "search_trends:fashion",
+        "search_trends:tech",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_worker_groups_concurrent_tasks_up_to_max_size():
+    skill = RecordingSkill()
+    worker = ChimeraWorker(batch_policy=BatchPolicy(max_size=4, max_linger=0.05))
+    worker.register_skill(skill)
+    tasks = [make_task("skill_echo", value=i) for i in range(10)]
+
+    outputs = await asyncio.gather(*(worker.perform_task(t) for t in tasks))
+
+    assert [o.result for o in outputs] == list(range(10))
+    assert skill.batches == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_worker_flushes_partial_batch_after_linger():
+    skill = RecordingSkill()
+    worker = ChimeraWorker(batch_policy=BatchPolicy(max_size=100, max_linger=0.01))
+    worker.register_skill(skill)
+
+    output = await asyncio.wait_for(worker.perform_task(make_task("skill_echo", value=7)), 1.0)
+
+    assert output.result == 7
+    assert skill.batches == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_fails_each_task():
+    worker = ChimeraWorker(batch_policy=BatchPolicy(max_size=2))
+    worker.register_skill(RecordingSkill(fail=True))
+
+    outputs = await asyncio.gather(
+        *(worker.perform_task(make_task("skill_echo", value=i)) for i in range(2))
+    )
+
+    assert [o.confidence_score for o in outputs] == [0.0, 0.0]
+    assert all("backend unavailable" in o.reasoning for o in outputs)
+
+
+@pytest.mark.asyncio
+async def test_policy_can_limit_batching_to_some_skills():
+    skill = RecordingSkill()
+    worker = ChimeraWorker(batch_policy=BatchPolicy(skills={"skill_trend_analysis"}))
+    worker.register_skill(skill)
+
+    output = await worker.perform_task(make_task("skill_echo", value=1))
+
+    assert output.result == 1
+    assert skill.batches == []
@@ -0,0 +1,93 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from skills import registry as registry_module
+from skills.registry import ENTRY_POINT_GROUP, SkillRegistry
+from skills.skill_mcp_bridger import SkillMCPBridger
+from src.models.schemas import WorkerTaskInput
+from src.swarm.worker import ChimeraWorker
+
+BUNDLED = [
+    "skill_content_generator",
+    "skill_mcp_bridger",
+    "skill_persona_consistency",
+    "skill_trend_analysis",
+]
+
+
+def test_discovery_lists_bundled_skills_without_importing_them():
+    script = (
+        "import sys\n"
+        "from skills.registry import SkillRegistry\n"
+        "names = SkillRegistry().available()\n"
+        "assert 'skills.skill_trend_analysis.executor' not in sys.modules\n"
+        "assert 'mcp' not in sys.modules\n"
+        "print(','.join(names))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert set(BUNDLED) <= set(completed.stdout.strip().split(","))
+
+
+def test_skill_is_loaded_once_on_first_use():
+    skills = SkillRegistry(include_entry_points=False)
+    assert not skills.is_loaded("skill_trend_analysis")
+
+    skill = skills.get("skill_trend_analysis")
+
+    assert skill.name == "skill_trend_analysis"
+    assert skills.get("skill_trend_analysis") is skill
+    assert skills.get("skill_unknown") is None
+
+
+def test_dependencies_are_injected_by_name():
+    client = object()
+    skill = SkillRegistry(dependencies={"mcp_client": client, "unused": 1}).get("skill_mcp_bridger")
+
+    assert isinstance(skill, SkillMCPBridger)
+    assert skill._mcp_client is client
+
+
+def test_entry_points_are_discovered(monkeypatch):
+    plugin = EntryPoint(
+        name="skill_busy", value="tests.test_process_pool:BusySkill", group=ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr(
+        registry_module,
+        "entry_points",
+        lambda group: [plugin] if group == ENTRY_POINT_GROUP else [],
+    )
+
+    skills = SkillRegistry()
+
+    assert "skill_busy" in skills
+    assert skills.get("skill_busy").name == "skill_busy"
+
+
+@pytest.mark.asyncio
+async def test_worker_loads_unregistered_skills_from_registry():
+    worker = ChimeraWorker(registry=SkillRegistry(include_entry_points=False))
+    task = WorkerTaskInput(
+        skill_name="skill_trend_analysis", params={"topic": "AI"}, persona_id="p1"
+    )
+
+    output = await worker.perform_task(task)
+
+    assert output.confidence_score > 0.0
+    assert "skill_trend_analysis" in worker.skills
+
+
+@pytest.mark.asyncio
+async def test_worker_reports_skills_that_fail_to_load():
+    # The MCP bridger cannot be constructed without its `mcp_client` dependency.
+    worker = ChimeraWorker(registry=SkillRegistry(include_entry_points=False))
+    task = WorkerTaskInput(skill_name="skill_mcp_bridger", params={}, persona_id="p1")
+
+    output = await worker.perform_task(task)
+
+    assert output.confidence_score == 0.0
+    assert output.reasoning.startswith("Failed to load skill skill_mcp_bridger")
@@ -0,0 +1,85 @@
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import FileStateManager
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_orchestrator
+
+
+class CrashingWorker(ChimeraWorker):
+    """Simulates the process dying when a given skill is dispatched."""
+
+    def __init__(self, crash_on: str | None = None):
+        super().__init__()
+        self.crash_on = crash_on
+        self.executed: list[str] = []
+        self.register_skill(SkillTrendAnalysis())
+        self.register_skill(SkillContentGenerator())
+        self.register_skill(SkillPersonaConsistency())
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        if task_input.skill_name == self.crash_on:
+            raise SystemError("process died")
+        self.executed.append(task_input.skill_name)
+        return await super().perform_task(task_input)
+
+
+@pytest.mark.asyncio
+async def test_file_state_manager_round_trip(tmp_path):
+    state = FileStateManager(str(tmp_path))
+    campaign = Campaign(title="Durable", goal="Survive restarts")
+    plan = await ChimeraPlanner().create_plan(campaign)
+
+    await state.save_campaign(campaign)
+    await state.save_plan(str(campaign.id), plan)
+    await state.save_task_result(str(campaign.id), {"task_id": plan[0].task_id, "status": "FAILED"})
+
+    reloaded = FileStateManager(str(tmp_path))
+    assert (await reloaded.get_campaign_status(str(campaign.id))).title == "Durable"
+    assert await reloaded.get_plan(str(campaign.id)) == plan
+    assert await reloaded.get_task_results(str(campaign.id)) == [
+        {"task_id": str(plan[0].task_id), "status": "FAILED"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resume_only_dispatches_unfinished_tasks(tmp_path):
+    campaign = Campaign(title="Crash Test", goal="Resume after a crash")
+
+    first_worker = CrashingWorker(crash_on="skill_persona_consistency")
+    with pytest.raises(SystemError):
+        await make_orchestrator(
+            worker=first_worker, state_manager=FileStateManager(str(tmp_path))
+        ).run_swarm(campaign)
+    assert first_worker.executed == ["skill_trend_analysis", "skill_content_generator"]
+
+    # A fresh process with a fresh state manager over the same directory.
+    second_worker = CrashingWorker()
+    state = FileStateManager(str(tmp_path))
+    results = await make_orchestrator(worker=second_worker, state_manager=state).run_swarm(
+        campaign, resume=True
+    )
+
+    assert second_worker.executed == ["skill_persona_consistency"]
+    assert [r["skill"] for r in results] == [
+        "skill_trend_analysis",
+        "skill_content_generator",
+        "skill_persona_consistency",
+    ]
+    assert all(r["status"] == "COMPLETED" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_resume_without_checkpoint_plans_fresh(tmp_path):
+    worker = CrashingWorker()
+    results = await make_orchestrator(
+        worker=worker, state_manager=FileStateManager(str(tmp_path))
+    ).run_swarm(Campaign(title="Fresh", goal="No checkpoint yet"), resume=True)
+    assert len(results) == 3
+    assert len(worker.executed) == 3
@@ -0,0 +1,142 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from skills.base import StreamingSkill
+from skills.skill_content_generator.executor import SkillContentGenerator
+from src.governance.confidence_scoring import ConfidenceScorer
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.persona.soul import Soul
+from src.swarm.batching import BatchPolicy
+from src.swarm.judge import ChimeraJudge
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+SOUL = Soul.from_file("personas/example_agent/SOUL.md")
+
+
+class LongFormSkill(StreamingSkill):
+    """Streams `params['chunks']`, recording how many were produced."""
+
+    def __init__(self):
+        self.produced = 0
+        self.closed = False
+
+    @property
+    def name(self) -> str:
+        return "skill_long_form"
+
+    async def stream(self, task_input: WorkerTaskInput) -> AsyncIterator[str]:
+        try:
+            for chunk in task_input.params["chunks"]:
+                self.produced += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+    def finalize(self, task_input: WorkerTaskInput, content: str) -> WorkerTaskOutput:
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result={"content": content},
+            confidence_score=0.95,
+            reasoning="long form",
+        )
+
+
+def test_incremental_score_matches_whole_content():
+    scorer = ConfidenceScorer(SOUL)
+    content = "This architectural approach ensures long-term scalability."
+
+    screen = scorer.incremental()
+    for i in range(0, len(content), 7):
+        assert screen.feed(content[i : i + 7]) is None
+
+    assert screen.close() is None
+    assert screen.score() == scorer.score_content(content)
+
+
+@pytest.mark.parametrize(
+    "chunks, breach",
+    [
+        (["Launch the att", "ack now"], "safety keyword 'attack'"),
+        (["Totally l", "it, friends"], "forbidden term 'lit'"),
+        (["That is ", "lit"], "forbidden term 'lit'"),
+    ],
+)
+def test_breach_is_found_across_chunk_boundaries(chunks, breach):
+    screen = ConfidenceScorer(SOUL).incremental()
+    for chunk in chunks:
+        screen.feed(chunk)
+
+    assert screen.close().startswith(breach)
+
+
+def test_word_prefixes_are_not_slang():
+    screen = ConfidenceScorer(SOUL).incremental()
+
+    assert screen.feed("Such a lit") is None
+    assert screen.feed("erary masterpiece about the fame of famous authors") is None
+    assert screen.close() is None
+
+
+def test_slang_is_allowed_when_persona_does_not_forbid_it():
+    relaxed = Soul(name="Relaxed", dna={}, directives=[], forbidden=[])
+    screen = ConfidenceScorer(relaxed).incremental()
+
+    screen.feed("This is lit, fam")
+    assert screen.close() is None
+
+
+@pytest.mark.asyncio
+async def test_content_generator_streams_its_content():
+    skill = SkillContentGenerator()
+    task = make_task("skill_content_generator", prompt="Agents at scale", persona="Calm")
+
+    chunks = [chunk async for chunk in skill.stream(task)]
+    output = await skill.execute(task)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == output.result["content"]
+
+
+@pytest.mark.asyncio
+async def test_worker_aborts_generation_at_first_breach():
+    skill = LongFormSkill()
+    worker = ChimeraWorker(stream_judge=ChimeraJudge(soul=SOUL))
+    worker.register_skill(skill)
+    task = make_task(
+        "skill_long_form", chunks=["A calm intro. ", "Then an exploit ", "and more"] * 10
+    )
+
+    output = await worker.perform_task(task)
+
+    assert output.confidence_score == 0.0
+    assert "safety keyword 'exploit'" in output.reasoning
+    assert skill.produced == 2
+    assert skill.closed
+
+
+@pytest.mark.asyncio
+async def test_batch_policy_does_not_bypass_the_screen():
+    skill = LongFormSkill()
+    worker = ChimeraWorker(stream_judge=ChimeraJudge(soul=SOUL), batch_policy=BatchPolicy())
+    worker.register_skill(skill)
+    task = make_task("skill_long_form", chunks=["A calm intro. ", "Then an exploit ", "and more"])
+
+    output = await worker.perform_task(task)
+
+    assert "safety keyword 'exploit'" in output.reasoning
+    assert skill.produced == 2
+
+
+@pytest.mark.asyncio
+async def test_clean_stream_is_finalized():
+    worker = ChimeraWorker(stream_judge=ChimeraJudge(soul=SOUL))
+    worker.register_skill(SkillContentGenerator())
+    task = make_task("skill_content_generator", prompt="Agents at scale", persona="Calm")
+
+    output = await worker.perform_task(task)
+
+    assert output.confidence_score == 0.95
+    assert output.result["content"].endswith("(Voice: Calm)")
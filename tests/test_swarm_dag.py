@@ -0,0 +1,189 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, TaskParamRef, WorkerTaskInput, WorkerTaskOutput
+from src.swarm.artifacts import ArtifactStore
+from src.swarm.base import Worker
+from src.swarm.dag import TaskGraph
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import SleepyWorker, make_orchestrator, make_task
+
+
+class TestTaskGraph:
+    def test_ready_follows_dependencies(self):
+        root = make_task("a")
+        child = make_task("b", depends_on=[root.task_id])
+        graph = TaskGraph([root, child])
+
+        assert graph.ready() == [root]
+        assert graph.ready() == []
+        graph.resolve(root.task_id)
+        assert graph.ready() == [child]
+        graph.resolve(child.task_id)
+        assert graph.is_finished()
+
+    def test_failure_skips_downstream(self):
+        root = make_task("a")
+        child = make_task("b", depends_on=[root.task_id])
+        grandchild = make_task("c", depends_on=[child.task_id])
+        graph = TaskGraph([root, child, grandchild])
+
+        graph.ready()
+        skipped = graph.resolve(root.task_id, succeeded=False)
+        assert {t.task_id for t in skipped} == {child.task_id, grandchild.task_id}
+        assert graph.is_finished()
+
+    def test_rejects_unknown_dependency(self):
+        with pytest.raises(ValueError):
+            TaskGraph([make_task("a", depends_on=[uuid4()])])
+
+    def test_rejects_cycle(self):
+        a = make_task("a")
+        b = make_task("b", depends_on=[a.task_id])
+        a.depends_on.append(b.task_id)
+        with pytest.raises(ValueError):
+            TaskGraph([a, b])
+
+
+@pytest.mark.asyncio
+async def test_independent_tasks_run_concurrently():
+    plan = [make_task(f"skill_{i}", delay=0.1) for i in range(4)]
+    worker = SleepyWorker()
+    orchestrator = make_orchestrator(plan, worker)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await orchestrator.run_swarm(Campaign(title="Parallel", goal="Go wide"))
+
+    assert loop.time() - started < 0.3
+    assert worker.peak == 4
+    assert [r["skill"] for r in results] == [t.skill_name for t in plan]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_dependencies_respected():
+    root = make_task("root", delay=0.05)
+    slow = make_task("slow", depends_on=[root.task_id], delay=0.1)
+    fast = make_task("fast", depends_on=[root.task_id], delay=0.01)
+    sink = make_task("sink", depends_on=[slow.task_id, fast.task_id])
+    worker = SleepyWorker()
+    orchestrator = make_orchestrator([root, slow, fast, sink], worker, max_concurrency=1)
+
+    await orchestrator.run_swarm(Campaign(title="Diamond", goal="Respect edges"))
+
+    assert worker.peak == 1
+    assert worker.finished[0] == "root"
+    assert worker.finished[-1] == "sink"
+
+
+@pytest.mark.asyncio
+async def test_failed_task_skips_dependents():
+    root = make_task("root", confidence=0.1)
+    child = make_task("child", depends_on=[root.task_id])
+    worker = SleepyWorker()
+    orchestrator = make_orchestrator([root, child], worker)
+
+    results = await orchestrator.run_swarm(Campaign(title="Broken", goal="Fail early"))
+
+    assert worker.finished == ["root"]
+    assert [r["status"] for r in results] == ["FAILED", "FAILED"]
+    assert "upstream" in results[1]["feedback"]
+
+
+class TestArtifactHandOff:
+    def test_param_refs_imply_dependencies(self):
+        upstream = make_task("a")
+        downstream = WorkerTaskInput(
+            skill_name="b",
+            params={},
+            persona_id="p1",
+            param_refs={"text": TaskParamRef(task_id=upstream.task_id, path="result.content")},
+        )
+        assert downstream.depends_on == [upstream.task_id]
+
+    def test_bind_resolves_by_reference(self):
+        upstream_id = uuid4()
+        payload = {"content": "hello", "angles": ["first", "second"]}
+        store = ArtifactStore()
+        store.put(
+            WorkerTaskOutput(
+                task_id=upstream_id,
+                skill_name="a",
+                result=payload,
+                confidence_score=1.0,
+                reasoning="ok",
+            )
+        )
+        task = WorkerTaskInput(
+            skill_name="b",
+            params={"static": 1},
+            persona_id="p1",
+            param_refs={
+                "whole": TaskParamRef(task_id=upstream_id),
+                "angle": TaskParamRef(task_id=upstream_id, path="result.angles.1"),
+            },
+        )
+
+        bound = store.bind(task)
+        assert bound.params == {"static": 1, "whole": payload, "angle": "second"}
+        assert bound.params["whole"] is payload
+        assert task.params == {"static": 1}
+
+    def test_bind_reports_missing_path(self):
+        upstream_id = uuid4()
+        store = ArtifactStore()
+        store.put(
+            WorkerTaskOutput(
+                task_id=upstream_id, skill_name="a", result={}, confidence_score=1.0, reasoning=""
+            )
+        )
+        task = WorkerTaskInput(
+            skill_name="b",
+            params={},
+            persona_id="p1",
+            param_refs={"x": TaskParamRef(task_id=upstream_id, path="result.missing")},
+        )
+        with pytest.raises(LookupError):
+            store.bind(task)
+
+
+class RecordingWorker(ChimeraWorker):
+    def __init__(self):
+        super().__init__()
+        self.seen: dict[str, WorkerTaskInput] = {}
+
+    async def perform_task(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.seen[task_input.skill_name] = task_input
+        return await super().perform_task(task_input)
+
+
+@pytest.mark.asyncio
+async def test_planner_hands_generated_content_to_consistency_check():
+    worker = RecordingWorker()
+    worker.register_skill(SkillTrendAnalysis())
+    worker.register_skill(SkillContentGenerator())
+    worker.register_skill(SkillPersonaConsistency())
+    orchestrator = ChimeraOrchestrator(
+        name="HandOffOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=worker,
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=InMemoryStateManager(),
+    )
+
+    results = await orchestrator.run_swarm(Campaign(title="Hand Off", goal="Chain outputs"))
+
+    trend, content, _ = results
+    generator_input = worker.seen["skill_content_generator"].params
+    consistency_input = worker.seen["skill_persona_consistency"].params
+    assert generator_input["style_guidelines"] == trend["output"]["result"]["suggested_angles"][0]
+    assert consistency_input["content_to_verify"] == content["output"]["result"]["content"]
@@ -0,0 +1,239 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.models.schemas import Campaign, WorkerTaskInput
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.queues import (
+    InMemoryTaskQueue,
+    QueueConsumer,
+    QueuedWorker,
+    RedisTaskQueue,
+    dead_letter_key,
+    review_queue_key,
+    task_queue_key,
+)
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+
+
+class LocalRedis:
+    """Minimal local stand-in for the Redis list/sorted-set commands the queue uses."""
+
+    def __init__(self):
+        self.lists: dict[str, deque] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    async def lpush(self, key, value):
+        self.lists.setdefault(key, deque()).appendleft(value.encode())
+        return len(self.lists[key])
+
+    async def rpush(self, key, value):
+        self.lists.setdefault(key, deque()).append(value.encode())
+        return len(self.lists[key])
+
+    async def rpoplpush(self, source, destination):
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop()
+        self.lists.setdefault(destination, deque()).appendleft(value)
+        return value
+
+    async def lrem(self, key, count, value):
+        items = self.lists.get(key, deque())
+        encoded = value.encode()
+        if encoded in items:
+            items.remove(encoded)
+            return 1
+        return 0
+
+    async def llen(self, key):
+        return len(self.lists.get(key, ()))
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, member):
+        return 1 if self.zsets.get(key, {}).pop(member, None) is not None else 0
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        """Run the queue's Lua scripts; no other call can interleave, as in Redis."""
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if script == RedisTaskQueue.PULL_SCRIPT:
+            raw = await self.rpoplpush(keys[0], keys[1])
+            if raw is not None:
+                await self.zadd(keys[2], {raw.decode(): args[0]})
+            return raw
+        if script == RedisTaskQueue.ACK_SCRIPT:
+            await self.lrem(keys[0], 1, args[0])
+            return await self.zrem(keys[1], args[0])
+        if script == RedisTaskQueue.REQUEUE_SCRIPT:
+            if not await self.zrem(keys[0], args[0]):
+                return 0
+            await self.lrem(keys[1], 1, args[0])
+            await self.rpush(keys[2], args[0])
+            return 1
+        raise NotImplementedError(script)
+
+    async def zrangebyscore(self, key, low, high):
+        members = self.zsets.get(key, {})
+        return [
+            m.encode()
+            for m, score in sorted(members.items(), key=lambda kv: kv[1])
+            if score <= high
+        ]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def queue(request):
+    if request.param == "memory":
+        return InMemoryTaskQueue()
+    return RedisTaskQueue(LocalRedis())
+
+
+@pytest.mark.asyncio
+async def test_fifo_and_ack(queue):
+    await queue.push("task_queue:c1", "first")
+    await queue.push("task_queue:c1", "second")
+    assert await queue.length("task_queue:c1") == 2
+
+    message = await queue.pull("task_queue:c1")
+    assert message.payload == "first"
+    await queue.ack("task_queue:c1", message)
+
+    assert (await queue.pull("task_queue:c1")).payload == "second"
+    assert await queue.pull("task_queue:c1") is None
+
+
+@pytest.mark.asyncio
+async def test_unacked_message_becomes_visible_after_timeout(queue):
+    await queue.push("task_queue:c1", "payload")
+    crashed = await queue.pull("task_queue:c1", visibility_timeout=0.0)
+    assert await queue.pull("task_queue:c1") is None
+
+    assert await queue.requeue_expired("task_queue:c1") == 1
+    retried = await queue.pull("task_queue:c1", visibility_timeout=30.0)
+    assert retried.message_id == crashed.message_id
+    await queue.ack("task_queue:c1", retried)
+    assert await queue.requeue_expired("task_queue:c1") == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_lease_is_taken_and_released_atomically():
+    redis = LocalRedis()
+    queue = RedisTaskQueue(redis)
+    await queue.push("task_queue:c1", "payload")
+
+    message = await queue.pull("task_queue:c1")
+    (leased,) = redis.zsets["task_queue:c1:leases"]
+    assert [raw.decode() for raw in redis.lists["task_queue:c1:processing"]] == [leased]
+
+    await queue.ack("task_queue:c1", message)
+    assert not redis.lists["task_queue:c1:processing"]
+    assert not redis.zsets["task_queue:c1:leases"]
+
+
+@pytest.mark.asyncio
+async def test_swarm_runs_through_queue_backed_workers(queue):
+    campaign = Campaign(title="Distributed", goal="Scale workers out")
+    nodes = []
+    for _ in range(2):
+        local_worker = ChimeraWorker()
+        local_worker.register_skill(SkillTrendAnalysis())
+        local_worker.register_skill(SkillContentGenerator())
+        local_worker.register_skill(SkillPersonaConsistency())
+        nodes.append(QueueConsumer(local_worker, queue, [campaign.id], poll_interval=0.001))
+
+    orchestrator = ChimeraOrchestrator(
+        name="QueueOrchestrator",
+        planner=ChimeraPlanner(),
+        worker=QueuedWorker(queue, poll_interval=0.001, result_timeout=5.0),
+        judge=ChimeraJudge(confidence_threshold=0.9),
+        state_manager=InMemoryStateManager(),
+    )
+
+    stop = asyncio.Event()
+    serving = [asyncio.create_task(node.serve(stop)) for node in nodes]
+    try:
+        results = await orchestrator.run_swarm(campaign)
+    finally:
+        stop.set()
+        await asyncio.gather(*serving)
+
+    assert [r["status"] for r in results] == ["COMPLETED"] * 3
+    assert await queue.length(task_queue_key(campaign.id)) == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_worker_times_out_without_consumers():
+    worker = QueuedWorker(InMemoryTaskQueue(), poll_interval=0.001, result_timeout=0.05)
+    task = WorkerTaskInput(skill_name="skill_trend_analysis", params={}, persona_id="p1")
+
+    output = await worker.perform_task(task)
+
+    assert output.confidence_score == 0.0
+    assert output.task_id == task.task_id
+
+
+class BrokenQueue(InMemoryTaskQueue):
+    """Accepts pushes, but every pull fails as if the backend were down."""
+
+    async def pull(self, key, visibility_timeout=30.0):
+        raise ConnectionError("queue backend unreachable")
+
+
+@pytest.mark.asyncio
+async def test_pending_tasks_fail_when_the_collector_dies():
+    worker = QueuedWorker(BrokenQueue(), poll_interval=0.001, result_timeout=5.0)
+    task = WorkerTaskInput(skill_name="skill_trend_analysis", params={}, persona_id="p1")
+
+    output = await asyncio.wait_for(worker.perform_task(task), 1.0)
+
+    assert output.confidence_score == 0.0
+    assert "queue backend unreachable" in output.reasoning
+
+
+@pytest.mark.asyncio
+async def test_unreadable_review_output_is_dead_lettered(queue):
+    worker = QueuedWorker(queue, poll_interval=0.001, result_timeout=5.0)
+    task = WorkerTaskInput(skill_name="skill_trend_analysis", params={}, persona_id="p1")
+    reviews = review_queue_key("default")
+    await queue.push(reviews, "not json")
+
+    async def answer():
+        message = None
+        while message is None:
+            await asyncio.sleep(0.001)
+            message = await queue.pull(task_queue_key("default"))
+        output = await ChimeraWorker().perform_task(
+            WorkerTaskInput.model_validate_json(message.payload)
+        )
+        await queue.push(reviews, output.model_dump_json())
+
+    consumer = asyncio.create_task(answer())
+    output = await worker.perform_task(task)
+    await consumer
+
+    assert output.task_id == task.task_id
+    assert await queue.length(dead_letter_key(reviews)) == 1
+    assert await queue.length(reviews) == 0
+
+
+@pytest.mark.asyncio
+async def test_consumer_dead_letters_unreadable_tasks(queue):
+    consumer = QueueConsumer(ChimeraWorker(), queue, ["c1"])
+    key = task_queue_key("c1")
+    await queue.push(key, "not json")
+
+    assert await consumer.run_once() == 0
+
+    assert await queue.length(dead_letter_key(key)) == 1
+    assert await queue.requeue_expired(key) == 0
+    assert await queue.length(key) == 0
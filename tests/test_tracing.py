@@ -0,0 +1,115 @@
+import json
+from collections import Counter
+
+import pytest
+
+from skills.skill_content_generator.executor import SkillContentGenerator
+from skills.skill_mcp_bridger import SkillMCPBridger
+from skills.skill_persona_consistency.executor import SkillPersonaConsistency
+from skills.skill_trend_analysis.executor import SkillTrendAnalysis
+from src.mcp.client import ChimeraMCPClient
+from src.models.schemas import Campaign, WorkerTaskInput
+from src.observability.tracing import (
+    STATUS_CODE_ERROR,
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    Tracer,
+    span,
+)
+from src.swarm.judge import ChimeraJudge
+from src.swarm.orchestrator import ChimeraOrchestrator
+from src.swarm.planner import ChimeraPlanner
+from src.swarm.state import InMemoryStateManager
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_orchestrator
+
+
+@pytest.mark.asyncio
+async def test_campaign_run_produces_one_trace():
+    exporter = InMemorySpanExporter()
+    campaign = Campaign(title="Traced", goal="Find the critical path")
+
+    await make_orchestrator(tracer=Tracer(exporter)).run_swarm(campaign)
+
+    names = Counter(s.name for s in exporter.spans)
+    assert names == {
+        "run_swarm": 1,
+        "create_plan": 1,
+        "perform_task": 3,
+        "validate_output": 3,
+        "save_task_result": 3,
+    }
+    root = next(s for s in exporter.spans if s.name == "run_swarm")
+    assert root.parent_span_id is None
+    assert root.attributes["campaign.id"] == str(campaign.id)
+    assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+    assert all(s.parent_span_id == root.span_id for s in exporter.spans if s is not root)
+    skills = {s.attributes["skill.name"] for s in exporter.spans if s.name == "perform_task"}
+    assert skills == {
+        "skill_trend_analysis",
+        "skill_content_generator",
+        "skill_persona_consistency",
+    }
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_calls_nest_under_their_task():
+    class EchoSession:
+        async def call_tool(self, tool_name, arguments):
+            class Result:
+                content = [arguments]
+
+            return Result()
+
+    client = ChimeraMCPClient(command="python")
+    client.session = EchoSession()
+    worker = ChimeraWorker(mcp_client=client)
+    worker.register_skill(SkillMCPBridger(client))
+    exporter = InMemorySpanExporter()
+    task = WorkerTaskInput(
+        skill_name="skill_mcp_bridger",
+        params={"tool_name": "search_trends", "arguments": {"topic": "AI"}},
+        persona_id="p1",
+    )
+
+    with Tracer(exporter).start_span("perform_task") as task_span:
+        await worker.perform_task(task)
+
+    call = next(s for s in exporter.spans if s.name == "call_tool")
+    assert call.parent_span_id == task_span.span_id
+    assert call.attributes["mcp.tool"] == "search_trends"
+
+
+@pytest.mark.asyncio
+async def test_sampling_drops_whole_traces():
+    exporter = InMemorySpanExporter()
+
+    await make_orchestrator(tracer=Tracer(exporter, sample_rate=0.0)).run_swarm(
+        Campaign(title="Unsampled", goal="Stay quiet")
+    )
+
+    assert exporter.spans == []
+    with pytest.raises(ValueError):
+        Tracer(exporter, sample_rate=1.5)
+
+
+def test_jsonl_export_is_otlp_shaped(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(JsonlSpanExporter(path, service_name="chimera-test"))
+
+    with tracer.start_span("run_swarm", {"campaign.id": "c1"}):
+        with pytest.raises(RuntimeError):
+            with span("call_tool", {"mcp.tool": "post_content", "attempt": 2}):
+                raise RuntimeError("boom")
+
+    (line,) = path.read_text().splitlines()
+    resource_spans = json.loads(line)["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"]["stringValue"] == "chimera-test"
+    root, child = sorted(
+        resource_spans["scopeSpans"][0]["spans"], key=lambda s: "parentSpanId" in s
+    )
+    assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+    assert child["parentSpanId"] == root["spanId"]
+    assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+    assert child["status"] == {"code": STATUS_CODE_ERROR, "message": "RuntimeError: boom"}
+    assert {"key": "attempt", "value": {"intValue": "2"}} in child["attributes"]
@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+import pytest
+
+from src.models.schemas import JudgeValidationOutput, TaskStatus, WorkerTaskOutput
+from src.persona.soul import Soul
+from src.swarm.judge import ChimeraJudge
+from src.swarm.verdict_cache import VerdictCache, verdict_key
+
+CLEAN = "This architectural approach ensures long-term scalability and governance."
+
+
+def make_soul(forbidden: list[str] | None = None) -> Soul:
+    return Soul(
+        name="Chimera Alpha",
+        dna={"Identity": "A sophisticated, tech-savvy AI strategist."},
+        directives=[],
+        forbidden=forbidden if forbidden is not None else ["Do not use generic slang."],
+    )
+
+
+def draft(content: str, confidence: float = 0.95) -> WorkerTaskOutput:
+    return WorkerTaskOutput(
+        task_id=uuid4(),
+        skill_name="skill_content_generator",
+        result={"content": content},
+        confidence_score=confidence,
+        reasoning="drafted",
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_content_reuses_marked_verdict():
+    cache = VerdictCache()
+    judge = ChimeraJudge(soul=make_soul(), verdict_cache=cache)
+
+    first = await judge.validate_output(draft(CLEAN))
+    second = await judge.validate_output(draft(CLEAN))
+
+    assert second.approval_status == first.approval_status == TaskStatus.COMPLETED
+    assert second.feedback == f"[cached] {first.feedback}"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert judge.decided_by["cache"] == 1
+
+
+@pytest.mark.asyncio
+async def test_persona_edit_invalidates_verdicts():
+    soul = make_soul(forbidden=[])
+    judge = ChimeraJudge(soul=soul, verdict_cache=VerdictCache())
+    slangy = "This new agent is totally lit, trust the process, friends!"
+
+    assert (await judge.validate_output(draft(slangy))).approval_status == TaskStatus.COMPLETED
+    soul.forbidden.append("Do not use generic slang.")
+    verdict = await judge.validate_output(draft(slangy))
+
+    assert verdict.approval_status == TaskStatus.FAILED
+    assert not verdict.feedback.startswith("[cached]")
+
+
+@pytest.mark.asyncio
+async def test_worker_confidence_is_part_of_the_key():
+    judge = ChimeraJudge(soul=make_soul(), verdict_cache=VerdictCache())
+
+    await judge.validate_output(draft(CLEAN, confidence=0.95))
+    verdict = await judge.validate_output(draft(CLEAN, confidence=0.8))
+
+    assert verdict.approval_status == TaskStatus.ESC_HITL
+
+
+def test_lru_eviction():
+    cache = VerdictCache(max_entries=2)
+    verdict = JudgeValidationOutput(approval_status=TaskStatus.COMPLETED, feedback="ok")
+    for key in ("a", "b"):
+        cache.put(key, verdict)
+    cache.get("a")
+    cache.put("c", verdict)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_verdicts_persist_across_restarts(tmp_path):
+    path = str(tmp_path / "verdicts.json")
+    soul = make_soul()
+    first = ChimeraJudge(soul=soul, verdict_cache=VerdictCache(path=path))
+    await first.validate_output(draft(CLEAN))
+    await first.verdict_cache.save()
+
+    restarted = ChimeraJudge(soul=soul, verdict_cache=VerdictCache(path=path))
+    verdict = await restarted.validate_output(draft(CLEAN))
+
+    assert verdict.feedback.startswith("[cached]")
+
+
+def test_key_separates_personas():
+    assert verdict_key("hi", "a", "v1") != verdict_key("hi", "b", "v1")
+    assert verdict_key("hi", "a", "v1") != verdict_key("hi", "a", "v2")
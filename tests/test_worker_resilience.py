@@ -0,0 +1,266 @@
+import asyncio
+
+import pytest
+
+from skills.base import BaseSkill
+from src.mcp.client import ChimeraMCPClient
+from src.models.schemas import WorkerTaskInput, WorkerTaskOutput
+from src.swarm.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+)
+from src.swarm.worker import ChimeraWorker
+from tests.helpers import make_task
+
+
+class ScriptedSkill(BaseSkill):
+    """Each call sleeps for the next delay in `delays` (the last one repeats)."""
+
+    idempotent = True
+
+    def __init__(self, delays: list[float], name: str = "scripted_skill"):
+        self._name = name
+        self.delays = delays
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result={"delay": delay},
+            confidence_score=1.0,
+            reasoning="scripted",
+        )
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=4)
+    assert tracker.percentile("s", 0.5) is None
+    for seconds in [5.0, 1.0, 2.0, 3.0, 4.0]:
+        tracker.record("s", seconds)
+    assert tracker.count("s") == 4
+    assert tracker.percentile("s", 0.5) == 2.0
+    assert tracker.percentile("s", 0.99) == 4.0
+
+
+class TestDeadlines:
+    @pytest.mark.asyncio
+    async def test_skill_timeout_yields_zero_confidence(self):
+        skill = ScriptedSkill([1.0])
+        worker = ChimeraWorker(skill_timeouts={"scripted_skill": 0.05})
+        worker.register_skill(skill)
+
+        output = await worker.perform_task(make_task("scripted_skill"))
+
+        assert output.confidence_score == 0.0
+        assert "Timed out" in output.reasoning
+        assert skill.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_task_deadline_is_tighter_than_default(self):
+        worker = ChimeraWorker(default_timeout=5.0)
+        worker.register_skill(ScriptedSkill([1.0]))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        output = await worker.perform_task(make_task("scripted_skill", timeout_s=0.05))
+
+        assert loop.time() - started < 0.5
+        assert output.confidence_score == 0.0
+
+    @pytest.mark.asyncio
+    async def test_fast_skill_unaffected(self):
+        worker = ChimeraWorker(default_timeout=1.0)
+        worker.register_skill(ScriptedSkill([0.0]))
+        output = await worker.perform_task(make_task("scripted_skill"))
+        assert output.confidence_score == 1.0
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_hedge_fires_after_percentile_and_wins(self):
+        skill = ScriptedSkill([1.0, 0.01])
+        worker = ChimeraWorker(hedge_policy=HedgePolicy(percentile=0.9, min_samples=3))
+        worker.register_skill(skill)
+        for _ in range(3):
+            worker.latencies.record("scripted_skill", 0.02)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        output = await worker.perform_task(make_task("scripted_skill"))
+
+        assert loop.time() - started < 0.5
+        assert output.result == {"delay": 0.01}
+        assert skill.calls == 2
+        await asyncio.sleep(0)
+        assert skill.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_side_effecting_tasks_are_never_hedged(self):
+        skill = ScriptedSkill([0.05, 0.01])
+        skill.idempotent = False
+        worker = ChimeraWorker(hedge_policy=HedgePolicy(percentile=0.9, min_samples=3))
+        worker.register_skill(skill)
+        for _ in range(3):
+            worker.latencies.record("scripted_skill", 0.001)
+
+        output = await worker.perform_task(make_task("scripted_skill"))
+
+        assert output.result == {"delay": 0.05}
+        assert skill.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_enough_samples(self):
+        skill = ScriptedSkill([0.05])
+        worker = ChimeraWorker(hedge_policy=HedgePolicy(min_samples=10))
+        worker.register_skill(skill)
+
+        await worker.perform_task(make_task("scripted_skill"))
+
+        assert skill.calls == 1
+        assert worker.latencies.count("scripted_skill") == 1
+
+
+class FlakySkill(BaseSkill):
+    """Raises `error` for the first `failures` calls, then succeeds."""
+
+    def __init__(self, failures: int, error: Exception):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "flaky_skill"
+
+    async def execute(self, task_input: WorkerTaskInput) -> WorkerTaskOutput:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return WorkerTaskOutput(
+            task_id=task_input.task_id,
+            skill_name=self.name,
+            result="recovered",
+            confidence_score=1.0,
+            reasoning="flaky",
+        )
+
+
+FAST_RETRY = RetryPolicy(max_attempts=4, base_delay=0.001, max_delay=0.002)
+
+
+class TestRetryAndCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        skill = FlakySkill(failures=2, error=ConnectionError("reset"))
+        worker = ChimeraWorker(retry_policy=FAST_RETRY)
+        worker.register_skill(skill)
+
+        output = await worker.perform_task(make_task("flaky_skill"))
+
+        assert output.result == "recovered"
+        assert skill.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_logic_errors_are_not_retried(self):
+        skill = FlakySkill(failures=1, error=ValueError("bad input"))
+        worker = ChimeraWorker(retry_policy=FAST_RETRY)
+        worker.register_skill(skill)
+
+        output = await worker.perform_task(make_task("flaky_skill"))
+
+        assert output.confidence_score == 0.0
+        assert skill.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        skill = FlakySkill(failures=100, error=ConnectionError("down"))
+        breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60.0)
+        worker = ChimeraWorker(retry_policy=FAST_RETRY, breakers=breakers)
+        worker.register_skill(skill)
+
+        first = await worker.perform_task(make_task("flaky_skill"))
+        second = await worker.perform_task(make_task("flaky_skill"))
+
+        assert skill.calls == 2
+        assert breakers.get("skill:flaky_skill").state == CircuitState.OPEN
+        assert first.confidence_score == 0.0
+        assert "failing fast" in second.reasoning
+
+    @pytest.mark.asyncio
+    async def test_hung_attempts_time_out_and_trip_the_breaker(self):
+        skill = ScriptedSkill([1.0])
+        breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60.0)
+        policy = FAST_RETRY.model_copy(update={"max_attempts": 2, "attempt_timeout": 0.01})
+        worker = ChimeraWorker(retry_policy=policy, breakers=breakers)
+        worker.register_skill(skill)
+
+        output = await worker.perform_task(make_task("scripted_skill"))
+
+        assert output.confidence_score == 0.0
+        assert skill.calls == 2
+        assert skill.cancelled == 2
+        assert breakers.get("skill:scripted_skill").state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_missed_deadlines_count_against_the_breaker(self):
+        skill = ScriptedSkill([1.0])
+        breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60.0)
+        worker = ChimeraWorker(default_timeout=0.01, breakers=breakers)
+        worker.register_skill(skill)
+
+        for _ in range(3):
+            output = await worker.perform_task(make_task("scripted_skill"))
+
+        assert skill.calls == 2
+        assert "failing fast" in output.reasoning
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_circuit(self):
+        breaker = CircuitBreaker("dep", failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        breaker.before_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool_calls_use_per_tool_breaker(self):
+        class DownSession:
+            calls = 0
+
+            async def call_tool(self, tool_name, arguments):
+                DownSession.calls += 1
+                raise ConnectionError("mcp server unreachable")
+
+        breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=60.0)
+        client = ChimeraMCPClient(command="python", breakers=breakers)
+        client.session = DownSession()
+
+        with pytest.raises(ConnectionError):
+            await client.call_tool("search_trends", {"topic": "x"})
+        with pytest.raises(CircuitOpenError):
+            await client.call_tool("search_trends", {"topic": "x"})
+        assert DownSession.calls == 1
+        assert "mcp:post_content" not in breakers.breakers